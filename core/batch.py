@@ -0,0 +1,190 @@
+"""
+RecordBatch — columnar in-memory representation of a county's records.
+
+One list per column (schema columns from config/schema.json first, then any
+extra keys solvers emit), instead of one dict per record:
+
+  - batch.column("Booking_Number") is the underlying list — O(1), no copy.
+  - batch[i] / iteration give RowView objects: dict-like views that read and
+    write the columns in place (record['Lead_Score'] = 80 works as before).
+  - to_rows(header) builds Sheets rows column-wise; to_documents() gives
+    Mongo/JSON dicts; take(indices) selects rows without copying records.
+
+Absent fields are stored as None and are left out of to_documents(), so a
+batch round-trips a list of dicts unchanged.
+
+Usage:
+    from core.batch import RecordBatch
+    batch = RecordBatch.from_records(records)
+    bookings = batch.column("Booking_Number")
+    rows = batch.to_rows(HEADER_ROW)
+"""
+
+from collections.abc import MutableMapping
+
+from core.schema import get_column_order, get_defaults
+
+
+class RowView(MutableMapping):
+    """Dict-like view of one row of a RecordBatch; writes go to the batch's columns."""
+
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: "RecordBatch", index: int):
+        self._batch = batch
+        self._index = index
+
+    def __getitem__(self, key):
+        col = self._batch._data.get(key)
+        if col is None or col[self._index] is None:
+            raise KeyError(key)
+        return col[self._index]
+
+    def get(self, key, default=None):
+        col = self._batch._data.get(key)
+        if col is None:
+            return default
+        value = col[self._index]
+        return default if value is None else value
+
+    def __setitem__(self, key, value):
+        self._batch._ensure_column(key)[self._index] = value
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._batch._data[key][self._index] = None
+
+    def __contains__(self, key):
+        col = self._batch._data.get(key)
+        return col is not None and col[self._index] is not None
+
+    def __iter__(self):
+        i = self._index
+        return (name for name, col in self._batch._data.items() if col[i] is not None)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def to_dict(self) -> dict:
+        i = self._index
+        return {name: col[i] for name, col in self._batch._data.items() if col[i] is not None}
+
+    def __repr__(self):
+        return f"RowView({self.to_dict()!r})"
+
+
+class RecordBatch:
+    """Columnar batch of arrest records. See module docstring."""
+
+    __slots__ = ("_data", "_length")
+
+    def __init__(self, columns: dict = None, length: int = 0):
+        self._data = columns if columns is not None else {name: [None] * length for name in get_column_order()}
+        self._length = length
+
+    @classmethod
+    def from_records(cls, records) -> "RecordBatch":
+        """Build a batch from dicts (or return `records` unchanged if it already is one)."""
+        if isinstance(records, RecordBatch):
+            return records
+        records = records if isinstance(records, list) else list(records)
+        batch = cls(length=len(records))
+        data = batch._data
+        for i, record in enumerate(records):
+            for key, value in record.items():
+                col = data.get(key)
+                if col is None:
+                    col = data[key] = [None] * batch._length
+                col[i] = value
+        return batch
+
+    def _ensure_column(self, name: str) -> list:
+        col = self._data.get(name)
+        if col is None:
+            col = self._data[name] = [None] * self._length
+        return col
+
+    # --- Access -----------------------------------------------------------
+
+    def __len__(self):
+        return self._length
+
+    def __bool__(self):
+        return self._length > 0
+
+    def __getitem__(self, index: int) -> RowView:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        return RowView(self, index)
+
+    def __iter__(self):
+        return (RowView(self, i) for i in range(self._length))
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self._data)
+
+    def column(self, name: str) -> list:
+        """The column's list (shared, not copied); absent values are None."""
+        return self._ensure_column(name)
+
+    def set_column(self, name: str, values) -> None:
+        values = list(values)
+        if len(values) != self._length:
+            raise ValueError(f"column {name}: {len(values)} values for {self._length} rows")
+        self._data[name] = values
+
+    def take(self, indices) -> "RecordBatch":
+        """New batch holding the given rows, in the given order."""
+        indices = list(indices)
+        return RecordBatch({name: [col[i] for i in indices] for name, col in self._data.items()}, len(indices))
+
+    def append(self, record: dict) -> None:
+        for col in self._data.values():
+            col.append(None)
+        self._length += 1
+        for key, value in record.items():
+            self._ensure_column(key)[-1] = value
+
+    def extend(self, records) -> None:
+        other = RecordBatch.from_records(records)
+        for name in other._data:
+            self._ensure_column(name)
+        for name, col in self._data.items():
+            col.extend(other._data.get(name) or [None] * other._length)
+        self._length += other._length
+
+    # --- Conversion -------------------------------------------------------
+
+    def to_rows(self, header: list = None, defaults: dict = None) -> list[list]:
+        """
+        Rows in `header` order (default: the schema's columns and defaults),
+        with None/absent values replaced by the column default or ''.
+        """
+        if header is None:
+            header = get_column_order()
+            defaults = get_defaults() if defaults is None else defaults
+        defaults = defaults or {}
+        missing = [None] * self._length
+        cols = []
+        for name in header:
+            fill = defaults.get(name, "")
+            col = self._data.get(name, missing)
+            cols.append([fill if v is None else v for v in col])
+        return [list(row) for row in zip(*cols)] if cols else [[] for _ in range(self._length)]
+
+    def to_documents(self) -> list[dict]:
+        """One dict per row (Mongo documents / JSON), without absent fields."""
+        items = list(self._data.items())
+        return [
+            {name: col[i] for name, col in items if col[i] is not None}
+            for i in range(self._length)
+        ]
+
+    to_records = to_documents
+
+    def __repr__(self):
+        return f"RecordBatch({self._length} rows, {len(self._data)} columns)"
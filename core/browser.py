@@ -1,51 +1,79 @@
 """
-Browser session management — creates configured DrissionPage browser instances.
+Browser session management — creates configured DrissionPage browser instances
+and pools warm Chromium processes across solvers.
+
+Launching Chromium costs seconds and ~300MB per county, and the container has a
+2GB shm. The pool keeps a capped number of Chromium processes alive and leases
+each solver its own tab; browsers are reused across counties (and across
+daemon cycles) as long as their launch options match.
 
 Usage:
-    from core.browser import create_browser
+    from core.browser import acquire_page, release_page, navigate
+    page = acquire_page(config)          # a tab in a pooled browser
+    try:
+        navigate(page, url, "lee")       # throttled per host, see core.rate_limit
+    finally:
+        release_page(page)               # closes the tab, keeps Chromium warm
+
+    from core.browser import leased_page
+    with leased_page({"headless": True}) as page:
+        ...
+
+    from core.browser import fetch_details    # detail pages on K tabs, in order
+    for (booking_id, url), record, error in fetch_details(page, links, extract_detail, county="charlotte"):
+        ...
+
+    from core.browser import create_browser   # dedicated, unpooled browser
     page = create_browser(config)
 """
 
 import os
 import sys
+import time
+import queue
+import atexit
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from DrissionPage import ChromiumPage, ChromiumOptions
 
+from core.rate_limit import throttle
 
-def create_browser(config: dict = None) -> ChromiumPage:
-    """
-    Create and configure a DrissionPage browser session.
 
-    Auto-detects Docker environment via CHROME_PATH env var.
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
 
-    Args:
-        config: Merged county config dict. Uses browser settings from it.
 
-    Returns:
-        Configured ChromiumPage instance.
-    """
+def _browser_settings(config: dict = None) -> dict:
+    """Resolve launch settings from a county config (or a bare override dict)."""
     if config is None:
         config = {}
+    browser_config = config.get("browser", {}) or {}
+    return {
+        "headless": bool(config.get("headless", browser_config.get("headless", True))),
+        "window_size": browser_config.get("window_size", "1920x1080"),
+        "user_agent": browser_config.get("user_agent", DEFAULT_USER_AGENT),
+        "proxy_url": config.get("proxy_url") or "",
+        "extra_arguments": tuple(browser_config.get("extra_arguments", ()) or ()),
+        "chrome_path": os.getenv("CHROME_PATH") or "",
+    }
 
-    browser_config = config.get("browser", {})
-    headless = config.get("headless", browser_config.get("headless", True))
-    window_size = browser_config.get("window_size", "1920x1080")
-    user_agent = browser_config.get(
-        "user_agent",
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0.0.0 Safari/537.36"
-    )
 
+def _build_options(settings: dict) -> ChromiumOptions:
+    """Build ChromiumOptions from resolved launch settings."""
     co = ChromiumOptions()
     co.auto_port()
 
     # Docker: set Chromium binary path from env
-    chrome_path = os.getenv("CHROME_PATH")
-    if chrome_path:
-        co.set_browser_path(chrome_path)
+    if settings["chrome_path"]:
+        co.set_browser_path(settings["chrome_path"])
 
     # Headless mode — use --headless=new for modern headless
-    if headless:
+    if settings["headless"]:
         co.headless(True)
         co.set_argument("--headless=new")
 
@@ -53,16 +81,400 @@ def create_browser(config: dict = None) -> ChromiumPage:
     co.set_argument("--disable-dev-shm-usage")
     co.set_argument("--disable-gpu")
     co.set_argument("--disable-blink-features=AutomationControlled")
-    co.set_argument(f"--window-size={window_size.replace('x', ',')}")
-    co.set_user_agent(user_agent)
+    co.set_argument(f"--window-size={settings['window_size'].replace('x', ',')}")
+    co.set_user_agent(settings["user_agent"])
+    for arg in settings["extra_arguments"]:
+        co.set_argument(arg)
 
     # Proxy support
-    proxy_url = config.get("proxy_url")
-    if proxy_url:
-        co.set_argument(f"--proxy-server={proxy_url}")
+    if settings["proxy_url"]:
+        co.set_argument(f"--proxy-server={settings['proxy_url']}")
+
+    return co
+
+
+def create_browser(config: dict = None) -> ChromiumPage:
+    """
+    Create and configure a dedicated (unpooled) DrissionPage browser session.
+
+    Auto-detects Docker environment via CHROME_PATH env var. Prefer
+    acquire_page() for solvers — it reuses warm Chromium processes.
+
+    Args:
+        config: Merged county config dict. Uses browser settings from it.
 
+    Returns:
+        Configured ChromiumPage instance.
+    """
+    settings = _browser_settings(config)
     sys.stderr.write(
-        f"🌐 Browser: headless={headless}, chrome_path={chrome_path or 'default'}, size={window_size}\n"
+        f"🌐 Browser: headless={settings['headless']}, "
+        f"chrome_path={settings['chrome_path'] or 'default'}, size={settings['window_size']}\n"
     )
+    return ChromiumPage(addr_or_opts=_build_options(settings))
+
+
+class _PooledBrowser:
+    """One Chromium process plus the tabs currently leased from it."""
+
+    def __init__(self, key: tuple, page: ChromiumPage):
+        self.key = key
+        self.page = page
+        self.leases = 0
+        self.last_used = time.monotonic()
+
+    def is_alive(self) -> bool:
+        try:
+            return bool(self.page.states.is_alive)
+        except Exception:
+            return False
+
+    def quit(self):
+        try:
+            self.page.quit()
+        except Exception as e:
+            sys.stderr.write(f"⚠️ Browser quit failed: {e}\n")
+
+
+class BrowserPool:
+    """
+    Process-wide pool of warm Chromium processes that leases tabs to solvers.
+
+    - At most `max_browsers` Chromium processes exist at once.
+    - Each browser serves up to `max_tabs` concurrent leases.
+    - Browsers are keyed by launch options (headless, UA, proxy, …); a lease
+      only reuses a browser whose options match.
+    - When the cap is reached, an idle browser with other options is recycled;
+      otherwise the caller waits for a lease to be returned.
+    - Browsers idle longer than `idle_seconds` are closed by reap_idle().
+    """
+
+    def __init__(self, max_browsers: int = 2, max_tabs: int = 4, idle_seconds: float = 300.0):
+        self.max_browsers = max(1, max_browsers)
+        self.max_tabs = max(1, max_tabs)
+        self.idle_seconds = idle_seconds
+        self._browsers: list[_PooledBrowser] = []
+        self._tabs = {}  # id(tab) → _PooledBrowser
+        self._launching = 0  # Slots reserved by acquire() calls starting Chromium outside the lock
+        self._cond = threading.Condition()
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def acquire(self, config: dict = None, timeout: float = 600.0):
+        """Lease a fresh tab from a pooled browser matching config's options."""
+        settings = _browser_settings(config)
+        key = tuple(sorted(settings.items()))
+        deadline = time.monotonic() + timeout
+
+        # Only bookkeeping happens under the lock; Chromium is started / quit
+        # outside it so other counties' acquire() and release() aren't held up
+        victim = None
+        launch = False
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Browser pool is shut down")
+                self._drop_dead()
+                browser = self._find(key)
+                if browser is not None:
+                    browser.leases += 1
+                    break
+                if len(self._browsers) + self._launching >= self.max_browsers and victim is None:
+                    victim = self._take_idle()
+                if len(self._browsers) + self._launching < self.max_browsers:
+                    self._launching += 1
+                    launch = True
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"No browser available after {timeout:.0f}s "
+                        f"({self.max_browsers} browsers, {self.max_tabs} tabs each)"
+                    )
+                self._cond.wait(remaining)
+
+        if victim is not None:
+            victim.quit()
+        if launch:
+            try:
+                browser = self._launch(key, settings)
+            except Exception:
+                with self._cond:
+                    self._launching -= 1
+                    self._cond.notify_all()
+                raise
+            with self._cond:
+                self._launching -= 1
+                closed = self._closed
+                if not closed:
+                    browser.leases += 1
+                    self._browsers.append(browser)
+                self._cond.notify_all()
+            if closed:
+                browser.quit()
+                raise RuntimeError("Browser pool is shut down")
+
+        try:
+            tab = self._open_tab(browser)
+        except Exception:
+            with self._cond:
+                browser.leases -= 1
+                self._cond.notify_all()
+            raise
+
+        with self._cond:
+            self._tabs[id(tab)] = browser
+        return tab
+
+    def release(self, tab):
+        """Return a leased tab: closes it and keeps the browser warm."""
+        with self._cond:
+            browser = self._tabs.pop(id(tab), None)
+        if browser is None:
+            # Not a pooled tab (e.g. create_browser page) — close it outright
+            try:
+                tab.quit()
+            except Exception:
+                pass
+            return
+
+        if tab is not browser.page:
+            try:
+                tab.close()
+            except Exception as e:
+                sys.stderr.write(f"⚠️ Tab close failed: {e}\n")
+
+        with self._cond:
+            browser.leases -= 1
+            browser.last_used = time.monotonic()
+            self._cond.notify_all()
+
+    def acquire_sibling(self, tab):
+        """
+        Lease another tab in the same browser as a leased tab.
+
+        The new tab gets the original tab's cookies (Cloudflare clearance,
+        session ids), so it can fetch pages the original already unlocked.
+        Returns None when `tab` is not pooled or its browser has no free tabs.
+        """
+        with self._cond:
+            browser = self._tabs.get(id(tab))
+            if browser is None or self._closed or browser.leases >= self.max_tabs:
+                return None
+            browser.leases += 1
+
+        try:
+            sibling = browser.page.new_tab()
+        except Exception as e:
+            sys.stderr.write(f"⚠️ Sibling tab open failed: {e}\n")
+            with self._cond:
+                browser.leases -= 1
+                self._cond.notify_all()
+            return None
+
+        try:
+            sibling.set.cookies(tab.cookies(all_info=True))
+        except Exception as e:
+            sys.stderr.write(f"⚠️ Sibling cookie copy failed: {e}\n")
+
+        with self._cond:
+            self._tabs[id(sibling)] = browser
+        return sibling
+
+    @contextmanager
+    def lease(self, config: dict = None):
+        """Context manager around acquire()/release()."""
+        tab = self.acquire(config)
+        try:
+            yield tab
+        finally:
+            self.release(tab)
+
+    def reap_idle(self):
+        """Quit browsers with no leases that have been idle past idle_seconds."""
+        now = time.monotonic()
+        with self._cond:
+            stale = [b for b in self._browsers
+                     if b.leases == 0 and now - b.last_used > self.idle_seconds]
+            for b in stale:
+                self._browsers.remove(b)
+        for b in stale:
+            b.quit()
+
+    def shutdown(self):
+        """Quit every pooled browser. Called automatically at interpreter exit."""
+        with self._cond:
+            self._closed = True
+            browsers, self._browsers = self._browsers, []
+            self._tabs.clear()
+            self._cond.notify_all()
+        for b in browsers:
+            b.quit()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "browsers": len(self._browsers),
+                "leased_tabs": sum(b.leases for b in self._browsers),
+                "max_browsers": self.max_browsers,
+                "max_tabs": self.max_tabs,
+            }
+
+    # ------------------------------------------------------------------
+    # Internal helpers (call with self._cond held, except _launch / _open_tab)
+    # ------------------------------------------------------------------
+
+    def _find(self, key):
+        candidates = [b for b in self._browsers if b.key == key and b.leases < self.max_tabs]
+        return min(candidates, key=lambda b: b.leases, default=None)
+
+    def _take_idle(self):
+        """Remove the longest-idle browser from the pool and return it (caller quits it), or None."""
+        idle = [b for b in self._browsers if b.leases == 0]
+        if not idle:
+            return None
+        victim = min(idle, key=lambda b: b.last_used)
+        self._browsers.remove(victim)
+        return victim
+
+    def _drop_dead(self):
+        for b in [b for b in self._browsers if b.leases == 0 and not b.is_alive()]:
+            self._browsers.remove(b)
+
+    def _launch(self, key, settings) -> _PooledBrowser:
+        """Start Chromium (without the lock held); acquire() adds it to the pool."""
+        sys.stderr.write(
+            f"🌐 Browser pool: launching a browser (max {self.max_browsers}, "
+            f"headless={settings['headless']}, chrome_path={settings['chrome_path'] or 'default'})\n"
+        )
+        return _PooledBrowser(key, ChromiumPage(addr_or_opts=_build_options(settings)))
+
+    @staticmethod
+    def _open_tab(browser: _PooledBrowser):
+        # Isolated browser context per lease where supported (DrissionPage ≥ 4.1),
+        # so cookies/storage from one county never leak into another.
+        try:
+            return browser.page.new_tab(new_context=True)
+        except TypeError:
+            return browser.page.new_tab()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the process-wide BrowserPool, sized from config/global.yaml `browser`."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            from core.config_loader import load_global_config
+            browser_config = load_global_config().get("browser", {}) or {}
+            _pool = BrowserPool(
+                max_browsers=int(os.getenv("BROWSER_POOL_MAX", browser_config.get("pool_max_browsers", 2))),
+                max_tabs=int(browser_config.get("pool_max_tabs", 4)),
+                idle_seconds=float(browser_config.get("pool_idle_seconds", 300)),
+            )
+            atexit.register(_pool.shutdown)
+        return _pool
+
+
+def acquire_page(config: dict = None):
+    """Lease a tab from the shared pool. Pair with release_page()."""
+    return get_browser_pool().acquire(config)
+
+
+def release_page(page):
+    """Return a tab leased with acquire_page() (closes unpooled pages)."""
+    get_browser_pool().release(page)
+
+
+@contextmanager
+def leased_page(config: dict = None):
+    """Context manager: a pooled tab for the duration of the block."""
+    with get_browser_pool().lease(config) as page:
+        yield page
+
+
+def navigate(page, url: str, county: str = None, **kwargs):
+    """Load `url` in `page` after taking a token from the host's bucket (county's `scraper.rate_limit`)."""
+    throttle(url, county)
+    return page.get(url, **kwargs)
+
+
+# ----------------------------------------------------------------------
+# Concurrent detail-page extraction
+# ----------------------------------------------------------------------
+
+def fetch_details(page, items, extract, county: str = None, tabs: int = None):
+    """
+    Run `extract(tab, *item)` for every item on up to `tabs` tabs in parallel.
+
+    `page` is the solver's leased tab (already past Cloudflare); extra tabs are
+    leased from the same browser with its cookies. Each navigation first takes
+    a token from the host's bucket in core.rate_limit (county's
+    `scraper.rate_limit`). Results are yielded in input order as
+    (item, record, error) — error is the exception extract raised, else None.
+
+    Only a small window of items runs ahead of the consumer, so a caller that
+    stops early (e.g. a date cutoff) wastes at most a few page loads. Stopping
+    iteration cancels queued work and returns the extra tabs to the pool.
+
+    `tabs` defaults to `browser.detail_tabs` in config/global.yaml.
+    """
+    items = list(items)
+    if tabs is None:
+        from core.config_loader import load_global_config
+        tabs = int((load_global_config().get("browser", {}) or {}).get("detail_tabs", 3))
+
+    pool = get_browser_pool()
+    siblings = []
+    for _ in range(min(max(1, tabs), len(items)) - 1):
+        sibling = pool.acquire_sibling(page)
+        if sibling is None:
+            break
+        siblings.append(sibling)
+
+    free_tabs = queue.Queue()
+    for tab in [page] + siblings:
+        free_tabs.put(tab)
+    workers = 1 + len(siblings)
+    if workers > 1:
+        sys.stderr.write(f"🗂️ Fetching {len(items)} detail pages on {workers} tabs\n")
+
+    def _run(item):
+        tab = free_tabs.get()
+        try:
+            url = next((x for x in item if isinstance(x, str) and x.startswith("http")), "")
+            throttle(url, county)
+            return extract(tab, *item)
+        finally:
+            free_tabs.put(tab)
 
-    return ChromiumPage(addr_or_opts=co)
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="detail")
+    pending = deque()
+    upcoming = iter(items)
+    try:
+        while True:
+            # Keep every tab busy plus one queued item each — no further ahead
+            while len(pending) < workers * 2:
+                item = next(upcoming, None)
+                if item is None:
+                    break
+                pending.append((item, executor.submit(_run, item)))
+            if not pending:
+                break
+            item, future = pending.popleft()
+            try:
+                yield item, future.result(), None
+            except Exception as e:
+                yield item, None, e
+    finally:
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+        for sibling in siblings:
+            pool.release(sibling)
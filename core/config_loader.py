@@ -13,7 +13,9 @@ Usage:
 """
 
 import os
+import copy
 import json
+import threading
 import yaml
 from pathlib import Path
 from core.exceptions import ConfigError
@@ -24,13 +26,27 @@ REPO_ROOT = Path(__file__).resolve().parent.parent
 CONFIG_DIR = REPO_ROOT / "config"
 COUNTIES_DIR = CONFIG_DIR / "counties"
 
+# Parsed YAML keyed by path → (mtime_ns, data). Long-running processes (the
+# daemon, parallel run_all) load the same files every cycle; edits on disk
+# are still picked up because the mtime changes.
+_yaml_cache: dict = {}
+_yaml_lock = threading.Lock()
+
 
 def _load_yaml(path: Path) -> dict:
     """Load a YAML file, returning empty dict if not found."""
-    if not path.exists():
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
         return {}
-    with open(path, "r") as f:
-        return yaml.safe_load(f) or {}
+    with _yaml_lock:
+        cached = _yaml_cache.get(path)
+        if cached is None or cached[0] != mtime:
+            with open(path, "r") as f:
+                cached = (mtime, yaml.safe_load(f) or {})
+            _yaml_cache[path] = cached
+    # Callers mutate the merged config (e.g. config['scraper']['days_back'])
+    return copy.deepcopy(cached[1])
 
 
 def _deep_merge(base: dict, override: dict) -> dict:
@@ -44,6 +60,25 @@ def _deep_merge(base: dict, override: dict) -> dict:
     return result
 
 
+def config_mtime(county_name: str) -> tuple:
+    """
+    mtimes of the files load_config(county_name) reads (0 for a missing one),
+    for callers that cache something derived from the county's config.
+    """
+    mtimes = []
+    for path in (CONFIG_DIR / "global.yaml", COUNTIES_DIR / "_defaults.yaml", COUNTIES_DIR / f"{county_name}.yaml"):
+        try:
+            mtimes.append(path.stat().st_mtime_ns)
+        except FileNotFoundError:
+            mtimes.append(0)
+    return tuple(mtimes)
+
+
+def load_global_config() -> dict:
+    """Load config/global.yaml on its own (no county merge, no env overrides)."""
+    return _load_yaml(CONFIG_DIR / "global.yaml")
+
+
 def load_config(county_name: str) -> dict:
     """
     Load merged configuration for a county.
@@ -58,7 +93,7 @@ def load_config(county_name: str) -> dict:
         ConfigError: If county config file is not found.
     """
     # 1. Global defaults
-    global_config = _load_yaml(CONFIG_DIR / "global.yaml")
+    global_config = load_global_config()
 
     # 2. County defaults
     county_defaults = _load_yaml(COUNTIES_DIR / "_defaults.yaml")
@@ -99,7 +134,7 @@ def load_config(county_name: str) -> dict:
 
 
 def load_schema() -> dict:
-    """Load the canonical 34-column schema."""
+    """Load the canonical 35-column schema."""
     schema_path = CONFIG_DIR / "schema.json"
     if not schema_path.exists():
         raise ConfigError(f"Schema file not found: {schema_path}")
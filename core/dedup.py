@@ -1,12 +1,37 @@
 """
 Deduplication — checks for existing records by Booking_Number + County.
 
+Keys already written to a sink (a Sheets tab, Mongo) are kept in the
+persistent index in core/dedup_index.py; drop_known() filters against it.
+ChangeDetector compares a fingerprint of each record's volatile fields
+(dedup.fingerprint_fields) with the one stored for its key, so a re-scrape
+only passes on new and changed bookings. KnownBookings lets a solver skip
+the detail pages of bookings seen recently (dedup.detail_refresh).
+
 Usage:
-    from core.dedup import deduplicate
-    unique_records = deduplicate(records, "charlotte")
+    from core.dedup import deduplicate, drop_known, ChangeDetector
+    unique_records = deduplicate(records, "charlotte")   # list or RecordBatch
+    fresh = drop_known(unique_records, "mongo", "charlotte")
+
+    changes = ChangeDetector("charlotte")
+    batch = changes.filter(batch)      # new + changed only
+    ...write batch...
+    changes.commit()                   # store fingerprints once written
+
+    known = KnownBookings("Charlotte", "charlotte")   # record County label, config name
+    links = known.filter(links, key=lambda link: link[0])   # only bookings due a fetch
 """
 
+import hashlib
 import sys
+from datetime import datetime, timedelta
+
+from core.batch import RecordBatch
+from core.config_loader import load_config, load_global_config
+from core.dedup_index import get_index
+
+# Fields whose change makes a known booking worth re-sending downstream
+FINGERPRINT_FIELDS = ["Status", "Bond_Amount", "Bond_Paid", "Charges", "Court_Date"]
 
 
 def get_dedup_key(record: dict) -> str:
@@ -16,18 +41,54 @@ def get_dedup_key(record: dict) -> str:
     return f"{county}|{booking}" if booking else ""
 
 
-def deduplicate(records: list[dict], county_name: str = "") -> list[dict]:
+def batch_keys(batch: RecordBatch, default_county: str = "") -> list[tuple[str, str]]:
+    """(County, Booking_Number) per row, County falling back to `default_county`."""
+    return [
+        (str(default_county if county is None else county).strip(), str(booking or "").strip())
+        for county, booking in zip(batch.column("County"), batch.column("Booking_Number"))
+    ]
+
+
+def _deduplicate_batch(batch: RecordBatch, county_name: str) -> RecordBatch:
+    """Column-wise dedup: one pass over the two key columns, then take()."""
+    seen = set()
+    keep = []
+    for i, (county, booking) in enumerate(zip(batch.column("County"), batch.column("Booking_Number"))):
+        booking = str(booking or "").strip()
+        if not booking:
+            keep.append(i)  # No dedup key = keep it
+            continue
+        key = f"{(county or '').strip()}|{booking}"
+        if key in seen:
+            continue
+        seen.add(key)
+        keep.append(i)
+
+    duplicates = len(batch) - len(keep)
+    if not duplicates:
+        return batch
+    sys.stderr.write(
+        f"🔍 [{county_name}] Dedup: {len(batch)} → {len(keep)} "
+        f"({duplicates} duplicates removed)\n"
+    )
+    return batch.take(keep)
+
+
+def deduplicate(records, county_name: str = ""):
     """
-    Remove duplicate records from a list.
+    Remove duplicate records from a list or RecordBatch.
     Dedup key is Booking_Number + County.
 
     Args:
-        records: List of normalized record dicts
+        records: List of normalized record dicts, or a RecordBatch
         county_name: County name for logging
 
     Returns:
-        De-duplicated list (preserves first occurrence)
+        De-duplicated list or RecordBatch (preserves first occurrence)
     """
+    if isinstance(records, RecordBatch):
+        return _deduplicate_batch(records, county_name)
+
     seen = set()
     unique = []
     duplicates = 0
@@ -50,3 +111,168 @@ def deduplicate(records: list[dict], county_name: str = "") -> list[dict]:
         )
 
     return unique
+
+
+def drop_known(records, sink: str, county_name: str = "", index=None):
+    """
+    Remove records whose County + Booking_Number the dedup index already
+    holds for `sink`. Records without a booking number are kept; with the
+    index disabled everything is kept.
+
+    Returns a list or RecordBatch, matching the input.
+    """
+    index = index or get_index()
+    if index is None or not records:
+        return records
+    batch = RecordBatch.from_records(records)
+    keys = batch_keys(batch, county_name)
+    known = index.known(sink, keys)
+    keep = [i for i, key in enumerate(keys) if key not in known]
+    if len(keep) == len(batch):
+        return records
+    sys.stderr.write(f"🔍 [{county_name}] Dedup: {len(batch) - len(keep)} already in {sink}\n")
+    kept = batch.take(keep)
+    return kept if isinstance(records, RecordBatch) else kept.to_records()
+
+
+def fingerprint(values) -> str:
+    """Content hash of a record's fingerprint field values (whitespace-insensitive)."""
+    text = "\x1f".join(" ".join(str(v or "").split()) for v in values)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ChangeDetector:
+    """
+    Classify records as new, changed or unchanged against the stored
+    fingerprints, keeping only new and changed ones.
+
+    Fingerprints (with Status, for KnownBookings) of every keyed record are
+    held until commit(), which the pipeline calls once the chunk is written,
+    so a failed write is retried on the next run. Records without a
+    Booking_Number always pass. With the dedup index or
+    `dedup.change_detection` off, everything passes as new.
+    """
+
+    def __init__(self, county_name: str = "", index=None):
+        settings = load_global_config().get("dedup", {}) or {}
+        self.county_name = county_name
+        self.fields = list(settings.get("fingerprint_fields") or FINGERPRINT_FIELDS)
+        self.index = None
+        if settings.get("change_detection", True) is not False:
+            self.index = index or get_index()
+        self.counts = {"new": 0, "changed": 0, "unchanged": 0}
+        self.pending = {}
+
+    def filter(self, records):
+        """New and changed records from a list or RecordBatch (same type back)."""
+        if self.index is None or not records:
+            self.counts["new"] += len(records)
+            return records
+
+        batch = RecordBatch.from_records(records)
+        keys = batch_keys(batch, self.county_name)
+        prints = [fingerprint(values) for values in zip(*(batch.column(f) for f in self.fields))]
+        stored = self.index.fingerprints(keys)
+
+        keep = []
+        for i, (key, fp, status) in enumerate(zip(keys, prints, batch.column("Status"))):
+            if not all(key):
+                self.counts["new"] += 1
+                keep.append(i)
+                continue
+            self.pending[key] = (fp, status)  # Unchanged ones too: refreshes their checked_at
+            previous = stored.get(key)
+            if previous == fp:
+                self.counts["unchanged"] += 1
+                continue
+            self.counts["changed" if previous else "new"] += 1
+            keep.append(i)
+
+        if len(keep) == len(batch):
+            return records
+        kept = batch.take(keep)
+        return kept if isinstance(records, RecordBatch) else kept.to_records()
+
+    def discard(self, records) -> None:
+        """Drop the held fingerprints of records whose write failed, so they pass next run."""
+        if self.index is None or not records:
+            return
+        for key in batch_keys(RecordBatch.from_records(records), self.county_name):
+            self.pending.pop(key, None)
+
+    def commit(self) -> None:
+        """Store the fingerprints of everything filtered since the last commit."""
+        if self.index is not None and self.pending:
+            self.index.set_fingerprints(self.pending)
+        self.pending = {}
+
+
+RELEASED_STATUSES = ["RELEASED", "BONDED", "DISCHARGED", "OUT OF CUSTODY", "TRANSFERRED"]
+
+
+class KnownBookings:
+    """
+    Booking lookup for solvers, between the listing and the detail phase.
+
+    A listed booking is "due" (its detail page should be fetched) when it has
+    never been through the pipeline, or when the refresh policy in
+    `dedup.detail_refresh` says it needs a status / bond recheck:
+
+      - in custody: last seen more than `in_custody_hours` ago
+      - released (Status contains one of `released_statuses`): last seen
+        more than `released_days` ago; 0 means never recheck
+
+    `scraper.skip_known_details: false` in a county's config, the dedup
+    index being off, or `detail_refresh.enabled: false` makes every booking due.
+    """
+
+    def __init__(self, county: str, county_name: str = "", index=None):
+        settings = (load_global_config().get("dedup", {}) or {}).get("detail_refresh", {}) or {}
+        self.county = county
+        self.in_custody = timedelta(hours=float(settings.get("in_custody_hours", 24)))
+        released_days = float(settings.get("released_days", 0))
+        self.released = timedelta(days=released_days) if released_days > 0 else None
+        self.released_statuses = [s.upper() for s in settings.get("released_statuses") or RELEASED_STATUSES]
+        self.skipped = 0
+
+        enabled = settings.get("enabled", True) is not False
+        if enabled and county_name:
+            try:
+                scraper = load_config(county_name).get("scraper", {}) or {}
+                enabled = scraper.get("skip_known_details", True) is not False
+            except Exception:
+                pass
+        self.index = (index or get_index()) if enabled else None
+
+    def _is_due(self, state, now: datetime) -> bool:
+        if state is None:
+            return True
+        status, checked_at = state
+        try:
+            age = now - datetime.fromisoformat(checked_at)
+        except ValueError:
+            return True
+        status = status.upper()
+        if any(s in status for s in self.released_statuses):
+            return self.released is not None and age >= self.released
+        return age >= self.in_custody
+
+    def due(self, booking_numbers) -> set:
+        """The booking numbers (as given) whose detail page should be fetched."""
+        numbers = [str(n or "").strip() for n in booking_numbers]
+        if self.index is None:
+            return set(numbers)
+        states = self.index.booking_states((self.county, n) for n in numbers)
+        now = datetime.now()
+        return {n for n in numbers if not n or self._is_due(states.get((self.county, n)), now)}
+
+    def filter(self, items, key=lambda item: item):
+        """Items whose booking number (key(item)) is due, in order; counts the rest in .skipped."""
+        items = list(items)
+        due = self.due(key(item) for item in items)
+        kept = [item for item in items if str(key(item) or "").strip() in due]
+        skipped = len(items) - len(kept)
+        if skipped:
+            self.skipped += skipped
+            sys.stderr.write(f"⏭️  [{self.county}] Skipping {skipped} known bookings (not due for recheck)\n")
+        return kept
@@ -0,0 +1,219 @@
+"""
+Dedup index — persistent County + Booking_Number keys per write target.
+
+The Sheets writers used to call get_all_values() on every write to rebuild
+the key set of a tab (and again for Qualified_Arrests), which grows with the
+sheet and costs a Sheets API read per chunk. The index keeps those keys in a
+local SQLite database (WAL mode, so the daemon and a manual run can share it):
+
+  - Each write target is a "sink": "sheets:<spreadsheet_id>:<tab>", "mongo".
+  - known(sink, keys) answers "which of these are already written" in
+    O(batch), with no API reads.
+  - add(sink, keys) records keys in one transaction, called only after the
+    write they describe succeeded.
+  - rebuild(sink, keys) replaces a sink's keys, e.g. from get_all_values()
+    the first time a tab is seen or after rows were edited by hand.
+  - fingerprints(keys) / set_fingerprints(items) keep one content hash per
+    County + Booking_Number (see core.dedup.ChangeDetector), so a re-scrape
+    can tell new, changed and unchanged records apart. The booking's last
+    Status and when it was last seen are kept with it (booking_states()),
+    which core.dedup.KnownBookings uses to skip detail pages.
+
+Path comes from `dedup.index_path` in config/global.yaml; `dedup.index: false`
+turns it off (writers fall back to reading the sheet).
+
+Usage:
+    from core.dedup_index import get_index
+    index = get_index()
+    sink = f"sheets:{spreadsheet_id}:Lee"
+    existing = index.known(sink, [("Lee", "2025-001234")])
+    ...write...
+    index.add(sink, [("Lee", "2025-001234")])
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from core.config_loader import load_global_config
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_INDEX_PATH = "output/state/dedup_index.sqlite3"
+_QUERY_CHUNK = 400  # Keys per IN (...) lookup, under SQLite's variable limit
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dedup_keys (
+    sink    TEXT NOT NULL,
+    county  TEXT NOT NULL,
+    booking TEXT NOT NULL,
+    PRIMARY KEY (sink, county, booking)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS dedup_fingerprints (
+    county      TEXT NOT NULL,
+    booking     TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    updated_at  TEXT NOT NULL,
+    status      TEXT NOT NULL DEFAULT '',
+    checked_at  TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (county, booking)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS dedup_sinks (
+    sink       TEXT PRIMARY KEY,
+    rebuilt_at TEXT NOT NULL
+);
+"""
+
+
+def _clean(keys) -> list[tuple[str, str]]:
+    """(county, booking) pairs stripped, without blanks or repeats."""
+    out = {}
+    for county, booking in keys:
+        county, booking = str(county or "").strip(), str(booking or "").strip()
+        if county and booking:
+            out[(county, booking)] = None
+    return list(out)
+
+
+class DedupIndex:
+    """SQLite-backed (county, booking) keys per sink, plus content fingerprints. Thread-safe."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(dedup_fingerprints)")}
+        for column in ("status", "checked_at"):
+            if column not in columns:  # Index created before these columns existed
+                self._conn.execute(f"ALTER TABLE dedup_fingerprints ADD COLUMN {column} TEXT NOT NULL DEFAULT ''")
+
+    def is_seeded(self, sink: str) -> bool:
+        """True once the sink has been rebuilt from its target at least once."""
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM dedup_sinks WHERE sink = ?", (sink,)).fetchone()
+        return row is not None
+
+    def _lookup(self, select: str, keys: list, params: list) -> list:
+        """Run `select` (ending in "IN") once per slice of `keys`; returns all rows."""
+        rows = []
+        with self._lock:
+            for start in range(0, len(keys), _QUERY_CHUNK):
+                part = keys[start:start + _QUERY_CHUNK]
+                values = ",".join("(?, ?)" for _ in part)
+                flat = [v for pair in part for v in pair]
+                rows.extend(self._conn.execute(f"{select} (VALUES {values})", [*params, *flat]))
+        return rows
+
+    def known(self, sink: str, keys) -> set[tuple[str, str]]:
+        """The subset of `keys` already recorded for `sink`."""
+        return set(self._lookup(
+            "SELECT county, booking FROM dedup_keys WHERE sink = ? AND (county, booking) IN",
+            _clean(keys), [sink],
+        ))
+
+    def fingerprints(self, keys) -> dict[tuple[str, str], str]:
+        """Stored content fingerprint per (county, booking), for the keys that have one."""
+        rows = self._lookup(
+            "SELECT county, booking, fingerprint FROM dedup_fingerprints WHERE (county, booking) IN",
+            _clean(keys), [],
+        )
+        return {(county, booking): fp for county, booking, fp in rows}
+
+    def booking_states(self, keys) -> dict[tuple[str, str], tuple[str, str]]:
+        """(status, checked_at) per (county, booking) for the keys seen before."""
+        rows = self._lookup(
+            "SELECT county, booking, status, checked_at FROM dedup_fingerprints WHERE (county, booking) IN",
+            _clean(keys), [],
+        )
+        return {(county, booking): (status, checked) for county, booking, status, checked in rows}
+
+    def set_fingerprints(self, items: dict) -> int:
+        """
+        Store {(county, booking): (fingerprint, status)} in one transaction.
+        checked_at becomes now; updated_at only moves when the fingerprint does.
+        """
+        now = datetime.now().isoformat(timespec="seconds")
+        rows = [
+            (str(c).strip(), str(b).strip(), fp, now, str(status or "").strip(), now)
+            for (c, b), (fp, status) in items.items() if str(c).strip() and str(b).strip()
+        ]
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO dedup_fingerprints (county, booking, fingerprint, updated_at, status, checked_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (county, booking) DO UPDATE SET "
+                "updated_at = CASE WHEN fingerprint = excluded.fingerprint THEN updated_at ELSE excluded.updated_at END, "
+                "fingerprint = excluded.fingerprint, status = excluded.status, checked_at = excluded.checked_at",
+                rows,
+            )
+        return len(rows)
+
+    def add(self, sink: str, keys) -> int:
+        """Record `keys` for `sink` in one transaction. Returns the number of keys given."""
+        keys = _clean(keys)
+        if not keys:
+            return 0
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO dedup_keys (sink, county, booking) VALUES (?, ?, ?)",
+                [(sink, c, b) for c, b in keys],
+            )
+        return len(keys)
+
+    def rebuild(self, sink: str, keys) -> int:
+        """Replace every key of `sink` with `keys` (atomically) and mark it seeded."""
+        keys = _clean(keys)
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM dedup_keys WHERE sink = ?", (sink,))
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO dedup_keys (sink, county, booking) VALUES (?, ?, ?)",
+                [(sink, c, b) for c, b in keys],
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO dedup_sinks (sink, rebuilt_at) VALUES (?, ?)",
+                (sink, datetime.now().isoformat(timespec="seconds")),
+            )
+        return len(keys)
+
+    def forget(self, sink: str) -> None:
+        """Drop a sink entirely; its next write rebuilds it from the target."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM dedup_keys WHERE sink = ?", (sink,))
+            self._conn.execute("DELETE FROM dedup_sinks WHERE sink = ?", (sink,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_indexes: dict[str, DedupIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_index():
+    """The process-wide DedupIndex, or None when `dedup.index` is off or the file can't be opened."""
+    settings = (load_global_config().get("dedup", {}) or {})
+    if settings.get("index", True) is False:
+        return None
+    path = Path(settings.get("index_path", DEFAULT_INDEX_PATH))
+    path = path if path.is_absolute() else REPO_ROOT / path
+    with _indexes_lock:
+        index = _indexes.get(str(path))
+        if index is None:
+            try:
+                index = DedupIndex(path)
+            except sqlite3.Error:
+                return None
+            _indexes[str(path)] = index
+        return index
+
+
+def sheet_sink(spreadsheet_id: str, tab: str) -> str:
+    return f"sheets:{spreadsheet_id}:{tab}"
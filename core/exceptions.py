@@ -19,6 +19,11 @@ class SiteDown(ScraperError):
     pass
 
 
+class SourceUnchanged(ScraperError):
+    """Raised when a conditional fetch finds the roster unchanged since the last successful run."""
+    pass
+
+
 class ParseError(ScraperError):
     """Raised when HTML/JSON parsing fails to extract expected data."""
     pass
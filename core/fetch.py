@@ -0,0 +1,207 @@
+"""
+Async fetch engine — concurrent GETs/form posts for requests-based solvers.
+
+Solvers hand over a batch of requests (detail pages, A–Z letter searches,
+pagination) and get results back as they complete, or in submission order.
+Concurrency is bounded per host (`http.per_host_concurrency`) and requests
+still go through core.http sessions, so keep-alive pooling and the per-host
+rate limit apply unchanged.
+
+The blocking requests calls run on one process-wide executor sized by
+`http.fetch_workers`, so any number of counties can fetch concurrently from one
+event loop (or from the daemon's worker threads) without a thread per county.
+requests.Session is not thread-safe, so each executor thread sends through its
+own copy of the engine's session (same connection pool, headers and cookies);
+cookies the copies receive are merged back once a batch is done.
+
+Usage (sync, from an existing scrape_<county>()):
+    from core.fetch import FetchRequest, fetch_all
+    posts = [FetchRequest(action, method="POST", data={"LastName": l}) for l in letters]
+    for result in fetch_all(posts, session=session):       # submission order
+        if result.ok:
+            parse(result.text)
+
+Usage (async, many counties in one loop):
+    engine = FetchEngine(county="bay", headers=HEADERS)
+    async for result in engine.as_completed(requests):
+        ...
+"""
+
+import time
+import asyncio
+import threading
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from core.http import get_session
+from core.rate_limit import host_of
+
+
+@dataclass
+class FetchRequest:
+    """One HTTP request in a batch. `tag` is passed through to the result untouched."""
+    url: str
+    method: str = "GET"
+    params: dict = None
+    data: dict = None
+    headers: dict = None
+    timeout: float = None
+    tag: object = None
+
+
+@dataclass
+class FetchResult:
+    """Outcome of a FetchRequest; `error` is set (and `response` None) on failure."""
+    request: FetchRequest
+    response: object = None
+    error: Exception = None
+    elapsed_s: float = 0.0
+    index: int = field(default=0, repr=False)
+
+    @property
+    def status(self):
+        return self.response.status_code if self.response is not None else None
+
+    @property
+    def ok(self) -> bool:
+        return self.response is not None and self.response.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.response.text if self.response is not None else ""
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _fetch_settings() -> dict:
+    from core.config_loader import load_global_config
+    http = load_global_config().get("http", {}) or {}
+    return {
+        "per_host": int(http.get("per_host_concurrency", 4)),
+        "workers": int(http.get("fetch_workers", 16)),
+    }
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_fetch_settings()["workers"], thread_name_prefix="fetch"
+            )
+        return _executor
+
+
+def _clone_session(session: requests.Session) -> requests.Session:
+    """A Session on `session`'s adapters (connection pools) with copies of its headers, cookies and settings."""
+    clone = requests.Session()
+    clone.headers = session.headers.copy()
+    clone.cookies = session.cookies.copy()
+    clone.auth = session.auth
+    clone.proxies = dict(session.proxies)
+    clone.params = dict(session.params)
+    clone.verify = session.verify
+    clone.cert = session.cert
+    clone.hooks = {event: list(hooks) for event, hooks in session.hooks.items()}
+    clone.adapters = session.adapters.copy()
+    return clone
+
+
+class FetchEngine:
+    """
+    Runs FetchRequests concurrently for one county (one session / cookie jar).
+
+    Args:
+        county: County key — selects the core.http pool and rate limit.
+        headers: Solver HEADERS for a new session (ignored if session given).
+        session: Reuse an existing session (e.g. one holding ASP.NET cookies).
+        per_host: Max in-flight requests per host; default from global.yaml.
+    """
+
+    def __init__(self, county: str = None, headers: dict = None, session=None, per_host: int = None):
+        self.session = session or get_session(county, headers)
+        self.per_host = per_host or _fetch_settings()["per_host"]
+        self._host_limits = {}
+        self._local = threading.local()
+        self._clones = []
+        self._clones_lock = threading.Lock()
+
+    def _limit(self, host: str) -> asyncio.Semaphore:
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.per_host)
+        return self._host_limits[host]
+
+    def _thread_session(self) -> requests.Session:
+        """This executor thread's copy of the session (made on its first request)."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            with self._clones_lock:
+                session = self._local.session = _clone_session(self.session)
+                self._clones.append(session)
+        return session
+
+    def merge_cookies(self) -> None:
+        """Copy cookies set on the per-thread sessions back into the engine's session."""
+        with self._clones_lock:
+            for clone in self._clones:
+                self.session.cookies.update(clone.cookies)
+
+    def _send(self, request: FetchRequest):
+        return self._thread_session().request(
+            request.method, request.url, params=request.params, data=request.data,
+            headers=request.headers, timeout=request.timeout,
+        )
+
+    async def fetch(self, request: FetchRequest, index: int = 0) -> FetchResult:
+        """Run one request; never raises — failures come back in result.error."""
+        async with self._limit(host_of(request.url)):
+            start = time.monotonic()
+            loop = asyncio.get_running_loop()
+            try:
+                response = await loop.run_in_executor(_get_executor(), self._send, request)
+                return FetchResult(request, response, None, time.monotonic() - start, index)
+            except Exception as e:
+                return FetchResult(request, None, e, time.monotonic() - start, index)
+
+    async def as_completed(self, requests):
+        """Async-iterate results in completion order."""
+        tasks = [asyncio.ensure_future(self.fetch(r, i)) for i, r in enumerate(requests)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            self.merge_cookies()
+
+    async def gather(self, requests) -> list:
+        """All results, in submission order."""
+        try:
+            return list(await asyncio.gather(*(self.fetch(r, i) for i, r in enumerate(requests))))
+        finally:
+            self.merge_cookies()
+
+
+def fetch_all(requests, county: str = None, headers: dict = None, session=None,
+              per_host: int = None, ordered: bool = True) -> list:
+    """
+    Sync wrapper: run a batch concurrently and return its FetchResults.
+
+    ordered=True returns submission order; False returns completion order.
+    Safe to call from any thread that is not already running an event loop.
+    """
+    requests = list(requests)
+    if not requests:
+        return []
+    engine = FetchEngine(county, headers, session, per_host)
+
+    async def _run():
+        if ordered:
+            return await engine.gather(requests)
+        return [result async for result in engine.as_completed(requests)]
+
+    return asyncio.run(_run())
@@ -0,0 +1,297 @@
+"""
+HTTP client factory — pooled, keep-alive requests sessions for solvers.
+
+Every requests-based solver gets its session here instead of building its own
+`requests.Session()`:
+
+  - One connection pool per county, kept for the life of the process, so
+    keep-alive connections survive across requests, solvers' sessions and
+    daemon cycles (each session still starts with a fresh cookie jar).
+  - gzip/deflate (and br when brotli is installed) negotiated by default.
+  - Default timeout from `scraping.request_timeout_seconds` when a call
+    passes none.
+  - Every request waits on its host's bucket in core.rate_limit.
+  - Telemetry: per-county counters in http_stats(), plus add_hook() callbacks.
+  - conditional_get(): roster pages/PDFs are re-requested with the ETag /
+    Last-Modified (and a body hash) from the last successful run; an
+    unchanged source raises SourceUnchanged so the pipeline can stop early.
+
+Pool sizes come from the `http` section of config/global.yaml.
+
+Usage:
+    from core.http import get_session
+    session = get_session("bay", HEADERS)
+    resp = session.get(BASE_URL)                 # pooled, throttled, default timeout
+
+    from core.http import add_hook
+    add_hook(lambda event: print(event["county"], event["status"], event["elapsed_s"]))
+
+    from core.http import conditional_get
+    resp = conditional_get(session, ROSTER_URL)  # raises SourceUnchanged on 304 / same body
+
+Validators seen during a run stay pending until run_pipeline calls
+commit_validators(county) after the records are written, so a failed run
+never hides a change from the next one. They are stored in
+`http.validator_cache` (default output/state/http_validators.json).
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+
+from core.exceptions import SourceUnchanged
+from core.rate_limit import throttle
+
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": DEFAULT_ACCEPT_ENCODING,
+    "Connection": "keep-alive",
+}
+
+
+_adapters = {}
+_adapters_lock = threading.Lock()
+_hooks = []
+_stats = {}
+_stats_lock = threading.Lock()
+_validators = None      # {county: {key: {etag, last_modified, sha256}}} as last committed
+_pending = {}           # Same shape, seen during the current run
+_validators_lock = threading.Lock()
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+class PooledAdapter(HTTPAdapter):
+    """
+    HTTPAdapter shared by all sessions of one county.
+
+    Applies the default timeout, waits on the host rate limit and reports
+    telemetry. close() is a no-op so a solver closing its session does not
+    drop the shared pool; shutdown() really closes it.
+    """
+
+    def __init__(self, county: str = None, timeout: float = 30.0, **kwargs):
+        self.county = county
+        self.default_timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        throttle(request.url, self.county)
+        start = time.monotonic()
+        try:
+            response = super().send(request, timeout=timeout or self.default_timeout, **kwargs)
+        except Exception as e:
+            _record(self.county, request, None, time.monotonic() - start, e)
+            raise
+        _record(self.county, request, response, time.monotonic() - start, None)
+        return response
+
+    def close(self):
+        pass
+
+    def shutdown(self):
+        super().close()
+
+
+def _http_settings() -> dict:
+    from core.config_loader import load_global_config
+    config = load_global_config()
+    http = config.get("http", {}) or {}
+    scraping = config.get("scraping", {}) or {}
+    return {
+        "timeout": float(scraping.get("request_timeout_seconds", 30)),
+        "pool_connections": int(http.get("pool_connections", 10)),
+        "pool_maxsize": int(http.get("pool_maxsize", 10)),
+        "max_retries": int(http.get("max_retries", 0)),
+        "validator_cache": http.get("validator_cache", "output/state/http_validators.json"),
+    }
+
+
+def _adapter_for(county: str) -> PooledAdapter:
+    with _adapters_lock:
+        adapter = _adapters.get(county)
+        if adapter is None:
+            settings = _http_settings()
+            adapter = _adapters[county] = PooledAdapter(
+                county,
+                timeout=settings["timeout"],
+                pool_connections=settings["pool_connections"],
+                pool_maxsize=settings["pool_maxsize"],
+                max_retries=settings["max_retries"],
+            )
+        return adapter
+
+
+def get_session(county: str = None, headers: dict = None) -> requests.Session:
+    """
+    Return a requests.Session on the county's shared connection pool.
+
+    Args:
+        county: County key (as in config/counties/<county>.yaml); selects the
+            rate-limit settings and the pool. None uses global defaults.
+        headers: Extra/overriding headers (e.g. a solver's HEADERS).
+    """
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    if headers:
+        session.headers.update(headers)
+    adapter = _adapter_for(county)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _validator_path() -> Path:
+    path = Path(_http_settings()["validator_cache"])
+    return path if path.is_absolute() else REPO_ROOT / path
+
+
+def _load_validators() -> dict:
+    global _validators
+    if _validators is None:
+        try:
+            with open(_validator_path()) as f:
+                _validators = json.load(f) or {}
+        except (FileNotFoundError, json.JSONDecodeError):
+            _validators = {}
+    return _validators
+
+
+def _county_of(session, url: str):
+    return getattr(session.get_adapter(url), "county", None) or ""
+
+
+def check_unchanged(response, county: str, key: str = None):
+    """
+    Raise SourceUnchanged if `response` is a 304 or its body matches the last
+    committed run; otherwise remember its validators as pending for `county`.
+
+    `key` defaults to "METHOD url" — pass one for form posts whose URL alone
+    does not identify the result.
+    """
+    key = key or f"{response.request.method} {response.url}"
+    if response.status_code == 304:
+        raise SourceUnchanged(f"{county}: {key} not modified")
+    if response.status_code != 200:
+        return
+    entry = {
+        "etag": response.headers.get("ETag", ""),
+        "last_modified": response.headers.get("Last-Modified", ""),
+        "sha256": hashlib.sha256(response.content).hexdigest(),
+    }
+    with _validators_lock:
+        previous = _load_validators().get(county, {}).get(key)
+        _pending.setdefault(county, {})[key] = entry
+    if previous and previous.get("sha256") == entry["sha256"]:
+        raise SourceUnchanged(f"{county}: {key} unchanged")
+
+
+def conditional_get(session, url: str, **kwargs):
+    """
+    GET `url` with If-None-Match / If-Modified-Since from the last committed
+    run. Returns the response when the source changed; raises SourceUnchanged
+    on a 304 or a byte-identical body.
+    """
+    county = _county_of(session, url)
+    key = f"GET {url}"
+    with _validators_lock:
+        previous = _load_validators().get(county, {}).get(key) or {}
+    headers = dict(kwargs.pop("headers", None) or {})
+    if previous.get("etag"):
+        headers["If-None-Match"] = previous["etag"]
+    if previous.get("last_modified"):
+        headers["If-Modified-Since"] = previous["last_modified"]
+    response = session.get(url, headers=headers, **kwargs)
+    check_unchanged(response, county, key)
+    return response
+
+
+def commit_validators(county: str):
+    """Persist the county's pending validators (call once its records are written)."""
+    with _validators_lock:
+        pending = _pending.pop(county, None)
+        if not pending:
+            return
+        validators = _load_validators()
+        validators.setdefault(county, {}).update(pending)
+        path = _validator_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(validators, f, indent=2, sort_keys=True)
+        os.replace(tmp, path)
+
+
+def discard_validators(county: str):
+    """Drop the county's pending validators (failed/dry run, or a rejected page)."""
+    with _validators_lock:
+        _pending.pop(county, None)
+
+
+def add_hook(callback):
+    """
+    Register callback(event) for every request. event keys: county, method,
+    host, status (None on error), elapsed_s, error.
+    """
+    _hooks.append(callback)
+
+
+def _record(county, request, response, elapsed, error):
+    from core.rate_limit import host_of
+    key = county or ""
+    with _stats_lock:
+        entry = _stats.setdefault(key, {"requests": 0, "errors": 0, "seconds": 0.0, "status": {}})
+        entry["requests"] += 1
+        entry["seconds"] += elapsed
+        if response is None:
+            entry["errors"] += 1
+        else:
+            status = str(response.status_code)
+            entry["status"][status] = entry["status"].get(status, 0) + 1
+    if not _hooks:
+        return
+    event = {
+        "county": county,
+        "method": request.method,
+        "host": host_of(request.url),
+        "status": response.status_code if response is not None else None,
+        "elapsed_s": round(elapsed, 3),
+        "error": repr(error) if error else None,
+    }
+    for hook in list(_hooks):
+        try:
+            hook(event)
+        except Exception as e:
+            sys.stderr.write(f"⚠️ HTTP telemetry hook failed: {e}\n")
+
+
+def http_stats() -> dict:
+    """Per-county counters: requests, errors, seconds (time to response headers), status counts."""
+    with _stats_lock:
+        return {
+            county: {**entry, "seconds": round(entry["seconds"], 2), "status": dict(entry["status"])}
+            for county, entry in _stats.items()
+        }
+
+
+def shutdown():
+    """Close every pooled connection (e.g. at daemon exit)."""
+    with _adapters_lock:
+        adapters = list(_adapters.values())
+        _adapters.clear()
+    for adapter in adapters:
+        adapter.shutdown()
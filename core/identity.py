@@ -0,0 +1,303 @@
+"""
+Person identity — one stable Person_Key for the same person across bookings
+and counties.
+
+County + Booking_Number identifies a booking, not a person: someone booked in
+Lee and then Collier, or re-booked next week, looks like a stranger. The
+person index resolves each record to a person:
+
+  1. A booking already resolved keeps its person (re-runs are stable).
+  2. A county's own person ID (e.g. Lee's permId, Palm Beach's jacket
+     number — what solvers put in Person_ID) links to the person it was
+     first seen with. Person_ID itself is never changed.
+  3. Otherwise the record is compared only with people in its block —
+     Soundex of the last name + birth year — and matches on the same full
+     DOB with a compatible first name (equal, a prefix like JON/JONATHAN,
+     or one typo like JON/JOHN; both first names must be known). Blocking
+     keeps this close to linear.
+
+Unmatched records create a person whose ID is derived from name + DOB, so
+the same first sighting gets the same ID even if the index is rebuilt.
+Records without a parseable DOB and last name are left unresolved (no
+Person_Key).
+
+The index is SQLite (WAL) at `identity.index_path`; one resolve() call does
+a handful of batched queries and one write transaction per chunk.
+
+Usage:
+    from core.identity import get_person_index
+    persons = get_person_index()            # None when identity.enabled is false
+    counts = persons.resolve(batch)         # sets Person_Key in place
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+import unicodedata
+from datetime import datetime
+from pathlib import Path
+
+from core.config_loader import load_global_config
+from core.normalizer import normalize_date
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_INDEX_PATH = "output/state/person_index.sqlite3"
+_QUERY_CHUNK = 400
+
+NAME_SUFFIXES = {"JR", "SR", "II", "III", "IV", "V"}
+_NON_ALPHA = re.compile(r"[^A-Z ]+")
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS persons (
+    person_id  TEXT PRIMARY KEY,
+    block      TEXT NOT NULL,
+    last_name  TEXT NOT NULL,
+    first_name TEXT NOT NULL,
+    dob        TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS persons_block ON persons (block);
+CREATE TABLE IF NOT EXISTS person_bookings (
+    county    TEXT NOT NULL,
+    booking   TEXT NOT NULL,
+    person_id TEXT NOT NULL,
+    PRIMARY KEY (county, booking)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS person_source_ids (
+    county    TEXT NOT NULL,
+    source_id TEXT NOT NULL,
+    person_id TEXT NOT NULL,
+    PRIMARY KEY (county, source_id)
+) WITHOUT ROWID;
+"""
+
+_SOUNDEX_CODES = {c: d for d, letters in {
+    "1": "BFPV", "2": "CGJKQSXZ", "3": "DT", "4": "L", "5": "MN", "6": "R",
+}.items() for c in letters}
+
+
+def normalize_name(value) -> str:
+    """Uppercase ASCII letters and single spaces, without suffixes (JR, III, ...)."""
+    text = unicodedata.normalize("NFKD", str(value or "")).encode("ascii", "ignore").decode()
+    text = _NON_ALPHA.sub(" ", text.upper().replace("'", "").replace("-", ""))
+    return " ".join(t for t in text.split() if t not in NAME_SUFFIXES)
+
+
+def soundex(name: str) -> str:
+    """American Soundex of the first word of `name` ('' if it has no letters)."""
+    word = normalize_name(name).replace(" ", "")
+    if not word:
+        return ""
+    code, last = word[0], _SOUNDEX_CODES.get(word[0], "")
+    for c in word[1:]:
+        digit = _SOUNDEX_CODES.get(c, "")
+        if digit and digit != last:
+            code += digit
+            if len(code) == 4:
+                break
+        if c not in "HW":
+            last = digit
+    return code.ljust(4, "0")
+
+
+def split_name(record) -> tuple[str, str]:
+    """(last, first) normalized, falling back to Full_Name ("LAST, FIRST M" or "FIRST M LAST")."""
+    last = normalize_name(record.get("Last_Name"))
+    first = normalize_name(record.get("First_Name"))
+    if last and first:
+        return last, first.split()[0]
+    full = str(record.get("Full_Name") or "")
+    if "," in full:
+        last_part, _, first_part = full.partition(",")
+        last, first = last or normalize_name(last_part), first or normalize_name(first_part)
+    else:
+        tokens = normalize_name(full).split()
+        if tokens:
+            last = last or tokens[-1]
+            first = first or (tokens[0] if len(tokens) > 1 else "")
+    return last, first.split()[0] if first else ""
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """True if `a` and `b` differ by at most one insertion, deletion or substitution."""
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    return a[i + (len(a) == len(b)):] == b[i + 1:]
+
+
+def _first_names_match(a: str, b: str) -> bool:
+    if not a or not b:
+        return False  # A bare last name + DOB is not enough to merge two people
+    if a == b:
+        return True
+    if min(len(a), len(b)) < 3:
+        return False
+    return a.startswith(b) or b.startswith(a) or _within_one_edit(a, b)
+
+
+def person_id_for(last: str, first: str, dob: str) -> str:
+    digest = hashlib.blake2b(f"{last}|{first}|{dob}".encode(), digest_size=6).hexdigest().upper()
+    return f"P-{digest}"
+
+
+class PersonIndex:
+    """SQLite-backed person index. See module docstring. Thread-safe."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def _pairs(self, table: str, column: str, keys: list) -> dict:
+        """{(county, key): person_id} for (county, key) pairs present in `table`."""
+        found = {}
+        for start in range(0, len(keys), _QUERY_CHUNK):
+            part = keys[start:start + _QUERY_CHUNK]
+            values = ",".join("(?, ?)" for _ in part)
+            rows = self._conn.execute(
+                f"SELECT county, {column}, person_id FROM {table} "
+                f"WHERE (county, {column}) IN (VALUES {values})",
+                [v for pair in part for v in pair],
+            )
+            found.update(((c, k), pid) for c, k, pid in rows)
+        return found
+
+    def _blocks(self, blocks: list) -> dict:
+        """{block: [(person_id, last, first, dob), ...]} for the given blocks."""
+        people = {b: [] for b in blocks}
+        for start in range(0, len(blocks), _QUERY_CHUNK):
+            part = blocks[start:start + _QUERY_CHUNK]
+            rows = self._conn.execute(
+                f"SELECT block, person_id, last_name, first_name, dob FROM persons "
+                f"WHERE block IN ({','.join('?' for _ in part)})",
+                part,
+            )
+            for block, *person in rows:
+                people[block].append(tuple(person))
+        return people
+
+    def resolve(self, records, county_name: str = "", commit: bool = True) -> dict:
+        """
+        Set Person_Key on each record (dicts or a RecordBatch, in place);
+        the county's Person_ID is only read.
+
+        Returns counts: matched (existing person), new (person created),
+        unresolved (no DOB / last name). With commit=False nothing is stored.
+        """
+        counts = {"matched": 0, "new": 0, "unresolved": 0}
+        rows = []
+        for record in records:
+            county = str(record.get("County") or county_name).strip()
+            booking = str(record.get("Booking_Number") or "").strip()
+            last, first = split_name(record)
+            dob = normalize_date(str(record.get("DOB") or ""), county, "DOB")
+            rows.append({
+                "record": record,
+                "county": county,
+                "booking": booking,
+                "source_id": str(record.get("Person_ID") or "").strip(),
+                "last": last,
+                "first": first,
+                "dob": dob if _DATE_RE.match(dob) else "",
+            })
+        if not rows:
+            return counts
+
+        now = datetime.now().isoformat(timespec="seconds")
+        new_persons, seen, bookings, source_ids = {}, {}, {}, {}
+        with self._lock:
+            by_booking = self._pairs(
+                "person_bookings", "booking", [(r["county"], r["booking"]) for r in rows if r["booking"]]
+            )
+            by_source = self._pairs(
+                "person_source_ids", "source_id",
+                [(r["county"], r["source_id"]) for r in rows if r["source_id"]],
+            )
+            for r in rows:
+                r["block"] = f"{soundex(r['last'])}:{r['dob'][:4]}" if r["last"] and r["dob"] else ""
+            people = self._blocks(sorted({r["block"] for r in rows if r["block"]}))
+
+            for r in rows:
+                pid = by_booking.get((r["county"], r["booking"])) or by_source.get((r["county"], r["source_id"]))
+                if pid is None and r["block"]:
+                    for person_id, last, first, dob in people[r["block"]]:
+                        if dob == r["dob"] and _first_names_match(first, r["first"]):
+                            pid = person_id
+                            break
+                    if pid is None:
+                        pid = person_id_for(r["last"], r["first"], r["dob"])
+                        new_persons[pid] = (pid, r["block"], r["last"], r["first"], r["dob"], now, now)
+                        people[r["block"]].append((pid, r["last"], r["first"], r["dob"]))
+                        counts["new"] += 1
+                    else:
+                        counts["matched"] += 1
+                elif pid is not None:
+                    counts["matched"] += 1
+                if pid is None:
+                    counts["unresolved"] += 1
+                    continue
+
+                if r["source_id"]:
+                    source_ids[(r["county"], r["source_id"])] = pid
+                if r["booking"]:
+                    bookings[(r["county"], r["booking"])] = pid
+                seen[pid] = now
+                r["record"]["Person_Key"] = pid
+
+            if commit:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO persons VALUES (?, ?, ?, ?, ?, ?, ?)", list(new_persons.values())
+                    )
+                    self._conn.executemany(
+                        "UPDATE persons SET last_seen = ? WHERE person_id = ?",
+                        [(ts, pid) for pid, ts in seen.items() if pid not in new_persons],
+                    )
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO person_bookings VALUES (?, ?, ?)",
+                        [(c, b, pid) for (c, b), pid in bookings.items()],
+                    )
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO person_source_ids VALUES (?, ?, ?)",
+                        [(c, s, pid) for (c, s), pid in source_ids.items()],
+                    )
+        return counts
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_indexes: dict[str, PersonIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_person_index():
+    """The process-wide PersonIndex, or None when `identity.enabled` is off or the file can't be opened."""
+    settings = load_global_config().get("identity", {}) or {}
+    if settings.get("enabled", True) is False:
+        return None
+    path = Path(settings.get("index_path", DEFAULT_INDEX_PATH))
+    path = path if path.is_absolute() else REPO_ROOT / path
+    with _indexes_lock:
+        index = _indexes.get(str(path))
+        if index is None:
+            try:
+                index = PersonIndex(path)
+            except sqlite3.Error:
+                return None
+            _indexes[str(path)] = index
+        return index
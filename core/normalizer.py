@@ -8,8 +8,10 @@ Usage:
     normalized = normalize_records(raw_records, "charlotte")
 """
 
+import sys
 import json
 import re
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -18,6 +20,12 @@ REPO_ROOT = Path(__file__).resolve().parent.parent
 ALIASES_PATH = REPO_ROOT / "config" / "field_aliases.json"
 
 _aliases_cache = None
+_alias_index = None     # (exact, folded): lower-cased alias → canonical, punctuation-free alias → canonical
+_given_index = (None, None)  # (aliases dict passed to _resolve_field, its compiled index)
+_plans = {}             # county → {raw key tuple: canonical name tuple}
+MAX_PLANS_PER_COUNTY = 64
+
+_FOLD_RE = re.compile(r"[^a-z0-9]")
 
 
 def _load_aliases() -> dict:
@@ -29,22 +37,68 @@ def _load_aliases() -> dict:
     return _aliases_cache
 
 
-def _resolve_field(raw_key: str, aliases: dict) -> str:
+def _fold(key: str) -> str:
+    """Case-, whitespace- and punctuation-insensitive form of a field name."""
+    return _FOLD_RE.sub("", key.lower())
+
+
+def _build_index(aliases: dict) -> tuple[dict, dict]:
+    """
+    Compile the alias file into reverse lookups.
+
+    The first canonical field listing an alias wins, as in the original
+    linear scan; exact (lower-cased) matches take precedence over folded ones
+    so e.g. "CaseNumber" still maps to Case_Number, not Booking_Number.
+    """
+    exact, folded = {}, {}
+    for canonical, alias_list in aliases.items():
+        for alias in alias_list:
+            exact.setdefault(alias.lower().strip(), canonical)
+            folded.setdefault(_fold(alias), canonical)
+    return exact, folded
+
+
+def _get_index(aliases: dict = None) -> tuple[dict, dict]:
+    """Compiled index for the alias file, or for `aliases` (rebuilt only when a different dict is passed)."""
+    global _alias_index, _given_index
+    if aliases is None:
+        if _alias_index is None:
+            _alias_index = _build_index(_load_aliases())
+        return _alias_index
+    if _given_index[0] is not aliases:
+        _given_index = (aliases, _build_index(aliases))
+    return _given_index[1]
+
+
+def _resolve_field(raw_key: str, aliases: dict = None) -> str:
     """
     Resolve a raw field name to its canonical schema name using aliases.
 
     Args:
         raw_key: The raw field name from a scraper
-        aliases: The alias mapping dict
+        aliases: Alias mapping to resolve against (default: the compiled
+            config/field_aliases.json index)
 
     Returns:
         Canonical field name, or the original key if no alias matches
     """
-    raw_lower = raw_key.lower().strip()
-    for canonical, alias_list in aliases.items():
-        if raw_lower in [a.lower() for a in alias_list]:
-            return canonical
-    return raw_key
+    exact, folded = _get_index(aliases)
+    canonical = exact.get(raw_key.lower().strip())
+    if canonical is None:
+        canonical = folded.get(_fold(raw_key))
+    return canonical or raw_key
+
+
+def _mapping_plan(keys: tuple, county_name: str) -> tuple:
+    """Canonical names for a record shape, resolved once per county and key set."""
+    plans = _plans.setdefault(county_name, {})
+    plan = plans.get(keys)
+    if plan is None:
+        plan = tuple(_resolve_field(k) for k in keys)
+        if len(plans) >= MAX_PLANS_PER_COUNTY:
+            plans.clear()  # Shapes are unstable for this county; start over
+        plans[keys] = plan
+    return plan
 
 
 def normalize_bond_amount(value) -> str:
@@ -61,31 +115,106 @@ def normalize_bond_amount(value) -> str:
         return "0"
 
 
-def normalize_date(value: str) -> str:
+DATE_FORMATS = [
+    "%m/%d/%Y",
+    "%Y-%m-%d",
+    "%m-%d-%Y",
+    "%m/%d/%y",
+    "%Y/%m/%d",
+    "%d-%b-%Y",
+]
+
+_US_DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})$")
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})$")
+
+_date_formats = {}      # (county, field) → last format that parsed
+_date_stats = {}        # (county, field) → {"parsed": n, "unparsed": n}
+_date_lock = threading.Lock()
+
+
+def _fast_date(value: str, fmt: str) -> str:
+    """Regex path for the two common shapes; '' if `value` is not in `fmt`."""
+    if fmt == "%m/%d/%Y":
+        m = _US_DATE_RE.match(value)
+        month, day, year = (m.groups() if m else (0, 0, 0))
+    elif fmt == "%Y-%m-%d":
+        m = _ISO_DATE_RE.match(value)
+        year, month, day = (m.groups() if m else (0, 0, 0))
+    else:
+        return ""
+    if not m:
+        return ""
+    year, month, day = int(year), int(month), int(day)
+    try:
+        datetime(year, month, day)
+    except ValueError:
+        return ""
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+def _parse_date(value: str, fmt: str) -> str:
+    if fmt in ("%m/%d/%Y", "%Y-%m-%d"):
+        return _fast_date(value, fmt)
+    try:
+        return datetime.strptime(value, fmt).strftime("%Y-%m-%d")
+    except ValueError:
+        return ""
+
+
+def _count_date(key: tuple, parsed: bool):
+    with _date_lock:
+        entry = _date_stats.setdefault(key, {"parsed": 0, "unparsed": 0})
+        entry["parsed" if parsed else "unparsed"] += 1
+
+
+def normalize_date(value: str, county: str = "", field: str = "") -> str:
     """
     Normalize date strings to YYYY-MM-DD format.
     Handles: MM/DD/YYYY, YYYY-MM-DD, M/D/YYYY, etc.
+
+    The format that last worked for (county, field) is tried first, so a
+    county's dates normally cost a single parse; the full DATE_FORMATS list
+    is only walked when that misses. Results are counted in date_stats().
     """
     if not value:
         return ""
     value = value.strip().split()[0]  # Take just the date part if datetime
 
-    formats = [
-        "%m/%d/%Y",
-        "%Y-%m-%d",
-        "%m-%d-%Y",
-        "%m/%d/%y",
-        "%Y/%m/%d",
-        "%d-%b-%Y",
-    ]
-    for fmt in formats:
-        try:
-            return datetime.strptime(value, fmt).strftime("%Y-%m-%d")
-        except ValueError:
+    key = (county, field)
+    memo = _date_formats.get(key)
+    if memo:
+        result = _parse_date(value, memo)
+        if result:
+            _count_date(key, True)
+            return result
+
+    for fmt in DATE_FORMATS:
+        if fmt == memo:
             continue
+        result = _parse_date(value, fmt)
+        if result:
+            _date_formats[key] = fmt
+            _count_date(key, True)
+            return result
+
+    _count_date(key, False)
     return value  # Return as-is if no format matched
 
 
+def date_stats() -> dict:
+    """Per "county/field" counts of parsed and unparseable dates, with the unparseable rate and memoized format."""
+    with _date_lock:
+        stats = {}
+        for (county, field), entry in _date_stats.items():
+            total = entry["parsed"] + entry["unparsed"]
+            stats[f"{county or '-'}/{field or '-'}"] = {
+                **entry,
+                "unparsed_rate": round(entry["unparsed"] / total, 3) if total else 0.0,
+                "format": _date_formats.get((county, field), ""),
+            }
+        return stats
+
+
 def normalize_record(raw: dict, county_name: str) -> dict:
     """
     Normalize a single raw record dict to the canonical schema.
@@ -97,12 +226,11 @@ def normalize_record(raw: dict, county_name: str) -> dict:
     Returns:
         Normalized record dict with canonical field names
     """
-    aliases = _load_aliases()
     normalized = {}
 
-    # Map raw keys to canonical names
-    for raw_key, value in raw.items():
-        canonical = _resolve_field(raw_key, aliases)
+    # Map raw keys to canonical names (one plan per record shape)
+    plan = _mapping_plan(tuple(raw), county_name)
+    for canonical, value in zip(plan, raw.values()):
         if canonical not in normalized or not normalized[canonical]:
             normalized[canonical] = value
 
@@ -118,13 +246,21 @@ def normalize_record(raw: dict, county_name: str) -> dict:
     if "Bond_Amount" in normalized:
         normalized["Bond_Amount"] = normalize_bond_amount(normalized["Bond_Amount"])
     if "Booking_Date" in normalized:
-        normalized["Booking_Date"] = normalize_date(normalized["Booking_Date"])
+        normalized["Booking_Date"] = normalize_date(normalized["Booking_Date"], county_name, "Booking_Date")
     if "DOB" in normalized:
-        normalized["DOB"] = normalize_date(normalized["DOB"])
+        normalized["DOB"] = normalize_date(normalized["DOB"], county_name, "DOB")
 
     return normalized
 
 
 def normalize_records(raw_records: list[dict], county_name: str) -> list[dict]:
-    """Normalize a list of raw records."""
-    return [normalize_record(r, county_name) for r in raw_records]
+    """Normalize a list of raw records, warning when dates could not be parsed."""
+    before = {f: _date_stats.get((county_name, f), {}).get("unparsed", 0) for f in ("Booking_Date", "DOB")}
+    records = [normalize_record(r, county_name) for r in raw_records]
+    for field, count in before.items():
+        unparsed = _date_stats.get((county_name, field), {}).get("unparsed", 0) - count
+        if unparsed:
+            sys.stderr.write(
+                f"⚠️ [{county_name}] {unparsed}/{len(records)} {field} values unparseable (kept as-is)\n"
+            )
+    return records
@@ -0,0 +1,89 @@
+"""
+Orchestration helpers — shared by scripts/run_all.py and scripts/run_daemon.py.
+
+Classifies counties for concurrency caps and runs a county pipeline in-process.
+
+Usage:
+    from core.orchestrator import ConcurrencySlots, county_class, run_one
+    entry = run_one("charlotte", dry_run=True)
+"""
+
+import time
+import importlib
+
+
+def county_class(config: dict) -> str:
+    """Return the concurrency class for a county: 'browser' or 'requests'."""
+    scraper = config.get("scraper", {}) or {}
+    needs_browser = scraper.get("needs_browser", config.get("needs_browser", False))
+    return "browser" if needs_browser else "requests"
+
+
+def county_platform(config: dict) -> str:
+    """Return the county's scraper.platform (empty string if unset)."""
+    return (config.get("scraper", {}) or {}).get("platform", "") or ""
+
+
+class ConcurrencySlots:
+    """
+    Tracks running counties against per-class and per-platform caps.
+
+    A cap of 0 (or a missing key) means unlimited. The dispatcher only starts a
+    county when every cap it falls under has a free slot, so worker threads
+    never sit blocked on a semaphore while other counties could be running.
+    """
+
+    def __init__(self, class_limits: dict = None, platform_limits: dict = None):
+        self.class_limits = class_limits or {}
+        self.platform_limits = platform_limits or {}
+        self.running = {}
+
+    def _keys(self, cls: str, platform: str) -> list[tuple[str, int]]:
+        keys = []
+        if self.class_limits.get(cls):
+            keys.append((f"class:{cls}", int(self.class_limits[cls])))
+        if platform and self.platform_limits.get(platform):
+            keys.append((f"platform:{platform}", int(self.platform_limits[platform])))
+        return keys
+
+    def can_start(self, cls: str, platform: str) -> bool:
+        return all(self.running.get(k, 0) < limit for k, limit in self._keys(cls, platform))
+
+    def acquire(self, cls: str, platform: str):
+        for key, _ in self._keys(cls, platform):
+            self.running[key] = self.running.get(key, 0) + 1
+
+    def release(self, cls: str, platform: str):
+        for key, _ in self._keys(cls, platform):
+            self.running[key] = max(0, self.running.get(key, 0) - 1)
+
+
+def run_one(county: str, dry_run: bool = False) -> dict:
+    """Run a single county pipeline in-process and return a summary entry."""
+    started = time.monotonic()
+    entry = {"status": "ok", "error": None}
+    try:
+        runner = importlib.import_module(f"counties.{county}.runner")
+        stats = runner.run_pipeline(county, dry_run=dry_run)
+        if stats is None:
+            entry["status"] = "failed"
+            entry["error"] = "solver failed (see county log)"
+            stats = {}
+        elif stats.get("errors"):
+            entry["status"] = "failed"
+            entry["error"] = str(stats.get("errors"))
+        entry.update({
+            "total": stats.get("total", 0),
+            "new": stats.get("new", 0),
+            "dupes": stats.get("dupes", 0),
+            "qualified": stats.get("qualified", 0),
+            "changed": stats.get("changed", 0),
+            "unchanged_records": stats.get("unchanged_records", 0),
+            "unchanged": stats.get("unchanged", False),
+        })
+    except (Exception, SystemExit) as e:
+        # Some solvers sys.exit() on missing deps — never let one county kill the run
+        entry["status"] = "failed"
+        entry["error"] = f"{type(e).__name__}: {e}"
+    entry["duration_s"] = round(time.monotonic() - started, 1)
+    return entry
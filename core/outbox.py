@@ -0,0 +1,703 @@
+"""
+Write-behind outbox — durable local queue between run_pipeline and its sinks.
+
+A Sheets or Mongo outage used to cost the run its writes (only the JSON dump
+survived), and every write sat in the scrape's critical path. With the
+outbox, run_pipeline commits each normalized chunk to a local SQLite queue
+(WAL, like the dedup index) and moves on; background sink workers deliver:
+
+  - "sheets": records per county via SheetsWriter.write_records() + flush(),
+    then the run's Ingestion_Log row (with the counts actually written) and
+    rotate(); rows of one run keep their newest-first order
+  - "mongo":  records via write_to_mongo()
+  - "slack":  messages from core.writers.slack_notifier
+
+Each entry has an idempotency key: County|Booking_Number for records (a
+hash of the record's content when it has no Booking_Number), the run for
+its log row, a random one for Slack messages. Putting a key that is
+still queued replaces its payload (duplicate upserts coalesce into the
+newest one) and delivering an old payload never deletes a newer one. A
+failed delivery is retried with exponential backoff; an entry being
+delivered is leased, so a crashed worker's entries come back after
+`lease_seconds`. Delivery is at-least-once; the Sheets dedup index and Mongo
+upserts make repeats harmless.
+
+Several processes share one outbox file (output/state is one volume / host
+directory). Each process owns the entries it put and heartbeats while it
+runs; it only claims its own entries and those of owners gone quiet for
+`lease_seconds`. A run's Sheets row offset and counts live in the
+outbox_runs table, so whichever process delivers its later chunks or its
+log row carries on from there, and a run's Sheets entries never overtake an
+earlier one still waiting for a retry.
+
+A group that fails with an outage (connection errors, timeouts, 429 / 5xx)
+is retried whole and does not use up `max_attempts`. Any other error is
+narrowed down by bisecting the group, so only the entries that are
+rejected on their own are retried; Slack messages are settled one by one.
+An entry rejected `max_attempts` times (per sink) moves to the outbox_dead
+table, reported in summary() and put back by requeue_dead().
+
+Settings are `outbox` in config/global.yaml; `enabled: false` writes
+synchronously again. One-shot processes (a runner, run_all.py) call
+drain_outbox() before exiting: it waits up to `drain_on_exit_seconds` for
+Sheets and Mongo delivery of the runs this process put and returns False if
+any of their records are left or dead-lettered, so the run exits non-zero.
+Whatever is left goes out with the next process that starts the workers
+(the daemon starts them at launch).
+
+Usage:
+    from core.outbox import get_outbox
+    outbox = get_outbox()                       # None when disabled
+    outbox.put_records(batch, "lee", run_id, spreadsheet_id=sheets_id, mongo=True)
+    outbox.start()
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from core.batch import RecordBatch
+from core.config_loader import load_global_config
+
+logger = logging.getLogger(__name__)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_OUTBOX_PATH = "output/state/outbox.sqlite3"
+DATA_SINKS = ('sheets', 'mongo')  # What a one-shot run must deliver before it exits
+ORDERED_SINKS = ('sheets',)  # A run's entries are delivered in the order they were put
+TRANSIENT_STATUSES = {408, 429, 500, 502, 503, 504}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id         INTEGER PRIMARY KEY AUTOINCREMENT,
+    sink       TEXT NOT NULL,
+    key        TEXT NOT NULL,
+    county     TEXT NOT NULL,
+    payload    TEXT NOT NULL,
+    version    INTEGER NOT NULL DEFAULT 1,
+    attempts   INTEGER NOT NULL DEFAULT 0,
+    next_try   REAL NOT NULL,
+    last_error TEXT NOT NULL DEFAULT '',
+    created_at TEXT NOT NULL,
+    run        TEXT NOT NULL DEFAULT '',
+    owner      TEXT NOT NULL DEFAULT '',
+    rejected   INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (sink, key)
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (sink, next_try);
+CREATE TABLE IF NOT EXISTS outbox_dead (
+    id         INTEGER PRIMARY KEY,
+    sink       TEXT NOT NULL,
+    key        TEXT NOT NULL,
+    county     TEXT NOT NULL,
+    payload    TEXT NOT NULL,
+    attempts   INTEGER NOT NULL,
+    last_error TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    dead_at    TEXT NOT NULL,
+    run        TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS outbox_runs (
+    run        TEXT PRIMARY KEY,
+    stats      TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS outbox_owners (
+    owner      TEXT PRIMARY KEY,
+    pid        INTEGER NOT NULL,
+    heartbeat  REAL NOT NULL
+);
+"""
+
+# Columns added after the first release; older outbox files get them on open
+_ADDED_COLUMNS = {
+    'outbox': ("run TEXT NOT NULL DEFAULT ''", "owner TEXT NOT NULL DEFAULT ''",
+               "rejected INTEGER NOT NULL DEFAULT 0"),
+    'outbox_dead': ("run TEXT NOT NULL DEFAULT ''",),
+}
+
+# Rejections (failures that are not an outage) before an entry is dead-lettered (0 = never)
+DEFAULT_MAX_ATTEMPTS = {'sheets': 10, 'mongo': 10, 'slack': 10}
+
+_SHEET_COUNTS = ('total_records', 'new_records', 'duplicates_skipped', 'qualified_records')
+
+
+def transient_error(error: Exception) -> bool:
+    """
+    True for an outage rather than a bad entry: HTTP 408 / 429 / 5xx (gspread,
+    requests and urllib errors), other connection errors and timeouts, and
+    pymongo's ConnectionFailure family.
+    """
+    if any(cls.__name__ in ('ConnectionFailure', 'AutoReconnect') for cls in type(error).__mro__):
+        return True
+    status = getattr(getattr(error, 'response', None), 'status_code', None)
+    if status is None and isinstance(error, OSError) and isinstance(getattr(error, 'code', None), int):
+        status = error.code  # urllib's HTTPError
+    if status is not None:
+        return status in TRANSIENT_STATUSES
+    return isinstance(error, OSError)
+
+
+def record_key(doc: dict, county: str) -> str:
+    """
+    Idempotency key of a record: County|Booking_Number, or County|#<content
+    hash> without a Booking_Number (Scrape_Timestamp left out, so the same
+    record put again still coalesces).
+    """
+    county = str(doc.get('County') or county).strip()
+    booking = str(doc.get('Booking_Number') or '').strip()
+    if booking:
+        return f"{county}|{booking}"
+    content = json.dumps({k: v for k, v in doc.items() if k != 'Scrape_Timestamp'}, sort_keys=True, default=str)
+    return f"{county}|#{hashlib.blake2b(content.encode(), digest_size=12).hexdigest()}"
+
+
+class Entry:
+    """One claimed outbox row; `settled` once done() / failed() has recorded its outcome."""
+
+    __slots__ = ('id', 'version', 'sink', 'key', 'county', 'payload', 'attempts', 'settled')
+
+    def __init__(self, id, version, sink, key, county, payload, attempts):
+        self.id = id
+        self.version = version
+        self.sink = sink
+        self.key = key
+        self.county = county
+        self.payload = json.loads(payload)
+        self.attempts = attempts
+        self.settled = False
+
+
+class Outbox:
+    """SQLite-backed write-behind queue with one worker thread per sink. See module docstring."""
+
+    def __init__(self, path, batch_size: int = 500, retry_seconds: float = 5.0,
+                 max_backoff: float = 900.0, max_attempts=None,
+                 lease_seconds: float = 600.0, poll_seconds: float = 5.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = max(1, int(batch_size))
+        self.retry_seconds = float(retry_seconds)
+        self.max_backoff = float(max_backoff)
+        # An int applies to every sink; a mapping overrides DEFAULT_MAX_ATTEMPTS per sink
+        if isinstance(max_attempts, dict):
+            self.max_attempts = {**DEFAULT_MAX_ATTEMPTS, **{k: int(v) for k, v in max_attempts.items()}}
+        elif max_attempts is not None:
+            self.max_attempts = {sink: int(max_attempts) for sink in SINKS}
+        else:
+            self.max_attempts = dict(DEFAULT_MAX_ATTEMPTS)
+        self.lease_seconds = float(lease_seconds)
+        self.poll_seconds = float(poll_seconds)
+        self._lock = threading.Lock()
+        # Autocommit; _tx() opens BEGIN IMMEDIATE so claims are exclusive across processes
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        for table, added in _ADDED_COLUMNS.items():
+            columns = {row[1] for row in self._conn.execute(f"PRAGMA table_info({table})")}
+            for column in added:
+                if column.split()[0] not in columns:  # Outbox file from before these columns
+                    self._conn.execute(f"ALTER TABLE {table} ADD COLUMN {column}")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS outbox_run ON outbox (sink, run, id)")
+        # This process's entries: only it delivers them while its heartbeat is fresh
+        self.owner = uuid.uuid4().hex
+        self.runs = set()
+        self._wake = {sink: threading.Event() for sink in SINKS}
+        self._workers: Dict[str, threading.Thread] = {}
+        self._stop = threading.Event()
+        self.stats = {'queued': 0, 'delivered': 0, 'failed': 0, 'dropped': 0, 'dead': 0}
+
+    @contextmanager
+    def _tx(self):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _beat(self, conn, now: float) -> None:
+        conn.execute(
+            "INSERT INTO outbox_owners (owner, pid, heartbeat) VALUES (?, ?, ?) "
+            "ON CONFLICT (owner) DO UPDATE SET heartbeat = excluded.heartbeat",
+            (self.owner, os.getpid(), now),
+        )
+
+    # ------------------------------------------------------------------
+    # Producers
+    # ------------------------------------------------------------------
+
+    def put(self, sink: str, items: list, run: str = '') -> int:
+        """
+        Queue [(key, county, payload), ...] of `run` for `sink` in one transaction.
+        A key still queued gets the new payload (and a fresh retry budget).
+        """
+        if not items:
+            return 0
+        now = time.time()
+        created = datetime.now().isoformat(timespec="seconds")
+        rows = [
+            (sink, key, county, json.dumps(payload, default=str), now, created, run, self.owner)
+            for key, county, payload in items
+        ]
+        with self._tx() as conn:
+            self._beat(conn, now)
+            conn.executemany(
+                "INSERT INTO outbox (sink, key, county, payload, next_try, created_at, run, owner) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (sink, key) DO UPDATE SET "
+                "payload = excluded.payload, county = excluded.county, version = version + 1, "
+                "attempts = 0, last_error = '', rejected = 0, run = excluded.run, owner = excluded.owner, "
+                "next_try = MAX(next_try, excluded.next_try)",
+                rows,
+            )
+        if run:
+            self.runs.add(run)
+        self.stats['queued'] += len(rows)
+        self._wake[sink].set()
+        return len(rows)
+
+    def put_records(self, records, county: str, run_id: str,
+                    spreadsheet_id: Optional[str] = None, mongo: bool = False) -> int:
+        """Queue a chunk for the Sheets tab of `spreadsheet_id` and/or Mongo. Returns records queued."""
+        keyed = [(record_key(doc, county), doc) for doc in RecordBatch.from_records(records).to_documents()]
+        if spreadsheet_id:
+            self.put('sheets', [
+                (key, county, {'kind': 'record', 'run': run_id, 'spreadsheet_id': spreadsheet_id, 'record': doc})
+                for key, doc in keyed
+            ], run=run_id)
+        if mongo:
+            self.put('mongo', [(key, county, {'record': doc}) for key, doc in keyed], run=run_id)
+        return len(keyed) if spreadsheet_id or mongo else 0
+
+    def put_log(self, county: str, run_id: str, spreadsheet_id: Optional[str], total: int,
+                changed: int = 0, unchanged: int = 0, error: Optional[str] = None) -> None:
+        """
+        Queue the run's Ingestion_Log row; written after the run's records, with
+        their counts. `total` is everything scraped, `unchanged` the part skipped.
+        """
+        if spreadsheet_id:
+            self.put('sheets', [(f"log|{run_id}", county, {
+                'kind': 'log', 'run': run_id, 'spreadsheet_id': spreadsheet_id, 'total': total,
+                'changed': changed, 'unchanged': unchanged, 'error': error,
+            })], run=run_id)
+
+    def put_slack(self, text: str, webhook_url: Optional[str] = None, county: str = '') -> None:
+        self.put('slack', [(uuid.uuid4().hex, county, {'text': text, 'webhook_url': webhook_url})])
+
+    # ------------------------------------------------------------------
+    # Delivery
+    # ------------------------------------------------------------------
+
+    def claim(self, sink: str, limit: int) -> List[Entry]:
+        """
+        Lease up to `limit` due entries of `sink`, oldest first: this process's
+        own, and those of owners whose heartbeat is older than lease_seconds
+        (which it adopts). In ORDERED_SINKS an entry waits while an earlier one
+        of its run is leased or backing off after an outage.
+        """
+        now = time.time()
+        ordered = (
+            "AND (o.run = '' OR NOT EXISTS (SELECT 1 FROM outbox p WHERE p.sink = o.sink AND p.run = o.run "
+            "AND p.id < o.id AND p.next_try > :now AND p.rejected = 0)) "
+        ) if sink in ORDERED_SINKS else ""
+        with self._tx() as conn:
+            self._beat(conn, now)
+            rows = conn.execute(
+                "SELECT id, version, sink, key, county, payload, attempts FROM outbox o "
+                "WHERE sink = :sink AND next_try <= :now "
+                "AND (owner = :owner OR owner NOT IN (SELECT owner FROM outbox_owners WHERE heartbeat > :alive)) "
+                f"{ordered}ORDER BY id LIMIT :limit",
+                {'sink': sink, 'now': now, 'owner': self.owner, 'alive': now - self.lease_seconds, 'limit': limit},
+            ).fetchall()
+            conn.executemany(
+                "UPDATE outbox SET next_try = ?, owner = ? WHERE id = ?",
+                [(now + self.lease_seconds, self.owner, row[0]) for row in rows],
+            )
+        return [Entry(*row) for row in rows]
+
+    def done(self, entries: List[Entry]) -> None:
+        """Delete delivered entries (unless a newer payload was put meanwhile; that one is now due)."""
+        now = time.time()
+        with self._tx() as conn:
+            conn.executemany("DELETE FROM outbox WHERE id = ? AND version = ?", [(e.id, e.version) for e in entries])
+            conn.executemany("UPDATE outbox SET next_try = ? WHERE id = ?", [(now, e.id) for e in entries])
+        for entry in entries:
+            entry.settled = True
+        self.stats['delivered'] += len(entries)
+
+    def failed(self, entries: List[Entry], error: Exception, transient: bool = False) -> None:
+        """
+        Schedule a retry with exponential backoff (plus jitter). Entries
+        rejected (not `transient`) as often as their sink's max_attempts move
+        to outbox_dead; an outage never dead-letters anything.
+        """
+        now = time.time()
+        dead = []
+        with self._tx() as conn:
+            conn.executemany(
+                "UPDATE outbox SET attempts = attempts + 1, last_error = ?, next_try = ?, rejected = ? WHERE id = ?",
+                [(str(error)[:500], now + self._backoff(e.attempts + 1), int(not transient), e.id) for e in entries],
+            )
+            for entry in entries:
+                limit = self.max_attempts.get(entry.sink, 0)
+                if not transient and limit > 0 and entry.attempts + 1 >= limit:
+                    dead.append(entry)
+            if dead:
+                dead_at = datetime.now().isoformat(timespec="seconds")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO outbox_dead "
+                    "(id, sink, key, county, payload, attempts, last_error, created_at, dead_at, run) "
+                    "SELECT id, sink, key, county, payload, attempts, last_error, created_at, ?, run "
+                    "FROM outbox WHERE id = ? AND version = ?",
+                    [(dead_at, e.id, e.version) for e in dead],
+                )
+                conn.executemany("DELETE FROM outbox WHERE id = ? AND version = ?", [(e.id, e.version) for e in dead])
+        for entry in entries:
+            entry.settled = True
+        self.stats['failed'] += len(entries)
+        if dead:
+            self.stats['dead'] += len(dead)
+            logger.error(
+                f"Outbox: {len(dead)} {entries[0].sink} entries failed {self.max_attempts[entries[0].sink]} times "
+                f"and were moved to outbox_dead: {error}"
+            )
+
+    def requeue_dead(self, sink: Optional[str] = None) -> int:
+        """Put dead-lettered entries (of `sink`, or all) back in the queue with a fresh retry budget."""
+        where, params = ("WHERE sink = ?", (sink,)) if sink else ("", ())
+        now = time.time()
+        with self._tx() as conn:
+            rows = conn.execute(
+                f"SELECT id, sink, key, county, payload, created_at, run FROM outbox_dead {where}", params
+            ).fetchall()
+            # A key queued again since it died already carries a newer payload; keep that one
+            conn.executemany(
+                "INSERT OR IGNORE INTO outbox (sink, key, county, payload, next_try, created_at, run, owner) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(s, k, c, p, now, created, run, self.owner) for _, s, k, c, p, created, run in rows],
+            )
+            conn.executemany("DELETE FROM outbox_dead WHERE id = ?", [(row[0],) for row in rows])
+        for woken in {row[1] for row in rows}:
+            if woken in self._wake:
+                self._wake[woken].set()
+        return len(rows)
+
+    def _backoff(self, attempts: int) -> float:
+        delay = min(self.max_backoff, self.retry_seconds * 2 ** (attempts - 1))
+        return delay + random.uniform(0, delay / 10)
+
+    def deliver(self, sink: str) -> int:
+        """Claim one batch of `sink` and hand it to the sink, per county. Returns entries claimed."""
+        entries = self.claim(sink, self.batch_size)
+        groups: Dict[str, List[Entry]] = {}
+        for entry in entries:
+            groups.setdefault(entry.county, []).append(entry)
+        for county, group in groups.items():
+            error = self._deliver_group(sink, county, group)
+            if error is not None:
+                unsettled = [entry for entry in group if not entry.settled]
+                logger.warning(f"Outbox: {sink} delivery of {len(unsettled)} {county} entries failed, will retry: {error}")
+                self.failed(unsettled, error, transient=True)
+        return len(entries)
+
+    def _deliver_group(self, sink: str, county: str, entries: List[Entry]) -> Optional[Exception]:
+        """
+        Hand `entries` to the sink. A rejection is bisected until the entries
+        that fail on their own are found and retried alone; returns the outage
+        that stopped delivery (the caller backs off the rest), else None.
+        """
+        try:
+            SINKS[sink](self, county, entries)
+        except Exception as e:
+            # A sink may already have settled some entries itself (Slack, per message)
+            unsettled = [entry for entry in entries if not entry.settled]
+            if not unsettled:
+                return None
+            if transient_error(e):
+                return e
+            if len(unsettled) == 1:
+                logger.warning(f"Outbox: {sink} rejected {unsettled[0].key}, will retry: {e}")
+                self.failed(unsettled, e)
+                return None
+            middle = len(unsettled) // 2
+            for half in (unsettled[:middle], unsettled[middle:]):
+                error = self._deliver_group(sink, county, half)
+                if error is not None:
+                    return error
+            return None
+        self.done([entry for entry in entries if not entry.settled])
+        return None
+
+    def _work(self, sink: str) -> None:
+        while not self._stop.is_set():
+            try:
+                claimed = self.deliver(sink)
+            except Exception as e:
+                logger.error(f"Outbox: {sink} worker error: {e}", exc_info=True)
+                claimed = 0
+            if not claimed:
+                self._wake[sink].wait(self.poll_seconds)
+                self._wake[sink].clear()
+
+    def start(self) -> None:
+        """Start the sink workers (idempotent); they drain at exit for up to drain_on_exit_seconds."""
+        with self._lock:
+            if self._workers:
+                return
+            for sink in SINKS:
+                thread = threading.Thread(target=self._work, args=(sink,), name=f"outbox-{sink}", daemon=True)
+                self._workers[sink] = thread
+                thread.start()
+        atexit.register(self._drain_at_exit)
+
+    def stop(self) -> None:
+        self._stop.set()
+        for event in self._wake.values():
+            event.set()
+
+    def _count(self, table: str, sink: Optional[str], runs) -> int:
+        clauses, params = [], []
+        if sink is not None:
+            clauses.append("sink = ?")
+            params.append(sink)
+        if runs is not None:
+            runs = list(runs)
+            clauses.append(f"run IN ({', '.join('?' * len(runs))})")
+            params.extend(runs)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {table} {where}", params).fetchone()[0]
+
+    def pending(self, sink: Optional[str] = None, runs=None) -> int:
+        """Entries not yet delivered, of `sink` and / or `runs` (dead-lettered ones are not pending)."""
+        return self._count("outbox", sink, runs)
+
+    def dead(self, sink: Optional[str] = None, runs=None) -> int:
+        """Dead-lettered entries, of `sink` and / or `runs`."""
+        return self._count("outbox_dead", sink, runs)
+
+    def drain(self, timeout: float, sinks=None, runs=None) -> bool:
+        """
+        Wait up to `timeout` seconds for the workers to deliver everything (or
+        the entries of `sinks` and / or `runs`). True if none are left.
+        """
+        deadline = time.monotonic() + timeout
+        while sum(self.pending(sink, runs) for sink in sinks or (None,)):
+            if time.monotonic() >= deadline or self._stop.is_set():
+                return False
+            for event in self._wake.values():
+                event.set()
+            time.sleep(min(1.0, max(0.0, deadline - time.monotonic())))
+        return True
+
+    def _drain_at_exit(self) -> None:
+        settings = load_global_config().get("outbox", {}) or {}
+        timeout = float(settings.get("drain_on_exit_seconds", 120))
+        left = self.pending(runs=self.runs)
+        if left and not self.drain(timeout, runs=self.runs):
+            logger.warning(f"Outbox: {self.pending(runs=self.runs)} entries left for the next run ({self.path})")
+        # Gone: other processes may adopt whatever is left right away
+        with self._tx() as conn:
+            conn.execute("DELETE FROM outbox_owners WHERE owner = ?", (self.owner,))
+
+    def run_stats(self, run_id: str) -> dict:
+        """Sheets counts written so far for `run_id` (its next chunk goes below them)."""
+        with self._lock:
+            row = self._conn.execute("SELECT stats FROM outbox_runs WHERE run = ?", (run_id,)).fetchone()
+        stats = dict.fromkeys(_SHEET_COUNTS, 0)
+        if row:
+            stats.update(json.loads(row[0]))
+        return stats
+
+    def save_run_stats(self, runs: Dict[str, Optional[dict]]) -> None:
+        """Store {run_id: stats} after a Sheets write; None forgets a finished run."""
+        updated = datetime.now().isoformat(timespec="seconds")
+        with self._tx() as conn:
+            conn.executemany(
+                "INSERT INTO outbox_runs (run, stats, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (run) DO UPDATE SET stats = excluded.stats, updated_at = excluded.updated_at",
+                [(run_id, json.dumps(stats), updated) for run_id, stats in runs.items() if stats is not None],
+            )
+            conn.executemany(
+                "DELETE FROM outbox_runs WHERE run = ?",
+                [(run_id,) for run_id, stats in runs.items() if stats is None],
+            )
+
+    def summary(self) -> dict:
+        """Counters plus pending / dead entries per sink."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT sink, COUNT(*), SUM(attempts > 0), MIN(created_at) FROM outbox GROUP BY sink"
+            ).fetchall()
+            dead = self._conn.execute("SELECT sink, COUNT(*) FROM outbox_dead GROUP BY sink").fetchall()
+        out = dict(self.stats)
+        out['pending'] = {sink: count for sink, count, _, _ in rows}
+        out['retrying'] = {sink: retrying or 0 for sink, _, retrying, _ in rows}
+        out['oldest'] = {sink: oldest for sink, _, _, oldest in rows}
+        out['dead_letters'] = dict(dead)
+        return out
+
+
+# ----------------------------------------------------------------------
+# Sinks: (outbox, county, entries) -> None, raise to retry the group's
+# entries the sink has not settled itself with outbox.done()
+# ----------------------------------------------------------------------
+
+def _deliver_sheets(outbox: Outbox, county: str, entries: List[Entry]) -> None:
+    from core.writers.sheets_writer import SheetsWriter
+
+    writers = {}
+    for spreadsheet_id in {e.payload['spreadsheet_id'] for e in entries}:
+        writers[spreadsheet_id] = SheetsWriter(spreadsheet_id)
+
+    # Consecutive records of one run go in one write_records()
+    runs = []
+    for entry in entries:
+        payload = entry.payload
+        if payload['kind'] == 'record' and runs and runs[-1][0] == ('record', payload['run'], payload['spreadsheet_id']):
+            runs[-1][1].append(payload['record'])
+        else:
+            runs.append(((payload['kind'], payload['run'], payload['spreadsheet_id']),
+                         [payload['record']] if payload['kind'] == 'record' else payload))
+
+    # Counts (and row offsets) so far come from outbox_runs, whichever process wrote the
+    # run's earlier chunks; they are stored only once this group is flushed
+    results = {run_id: outbox.run_stats(run_id) for (_, run_id, _), _ in runs}
+    for (kind, run_id, spreadsheet_id), body in runs:
+        writer = writers[spreadsheet_id]
+        result = results[run_id]
+        if result is None:  # Re-put after its log row in this group: a fresh start
+            result = results[run_id] = dict.fromkeys(_SHEET_COUNTS, 0)
+        if kind == 'record':
+            written = writer.write_records(body, county=county, row=2 + result['new_records'])
+            for key in _SHEET_COUNTS:
+                result[key] += written.get(key, 0)
+        else:
+            writer.log_ingestion(county, dict(
+                result,
+                total_records=body['total'],
+                changed_records=body.get('changed', 0),
+                unchanged_records=body.get('unchanged', 0),
+            ), error=body.get('error'))
+            logger.info(
+                f"Outbox: {county} Sheets {result['new_records']} new, "
+                f"{result['duplicates_skipped']} dupes, {result['qualified_records']} qualified"
+            )
+            results[run_id] = None
+    for writer in writers.values():
+        writer.flush()
+    outbox.save_run_stats(results)
+    for writer in writers.values():
+        try:
+            writer.rotate(county)
+        except Exception as e:
+            logger.error(f"Sheets rotation failed (non-fatal): {e}", exc_info=True)
+
+
+def _deliver_mongo(outbox: Outbox, county: str, entries: List[Entry]) -> None:
+    from core.writers.mongo_writer import write_to_mongo
+
+    write_to_mongo([e.payload['record'] for e in entries], county=county, strict=True)
+
+
+def _deliver_slack(outbox: Outbox, county: str, entries: List[Entry]) -> None:
+    from core.writers.slack_notifier import post_slack
+
+    for entry in entries:
+        url = entry.payload.get('webhook_url') or os.getenv("SLACK_WEBHOOK_URL")
+        if not url:
+            outbox.stats['dropped'] += 1  # Same as sending without a webhook: nothing to retry
+            continue
+        # Settled one by one: a failed post neither resends the messages before it nor holds up the rest
+        try:
+            post_slack(entry.payload['text'], url)
+        except Exception as e:
+            logger.warning(f"Outbox: Slack post failed, will retry: {e}")
+            outbox.failed([entry], e, transient=transient_error(e))
+        else:
+            outbox.done([entry])
+
+
+SINKS: Dict[str, Callable] = {
+    'sheets': _deliver_sheets,
+    'mongo': _deliver_mongo,
+    'slack': _deliver_slack,
+}
+
+
+_outboxes: Dict[str, Outbox] = {}
+_outboxes_lock = threading.Lock()
+
+
+def get_outbox():
+    """The process-wide Outbox, or None when `outbox.enabled` is off or the file can't be opened."""
+    settings = load_global_config().get("outbox", {}) or {}
+    if settings.get("enabled", True) is False:
+        return None
+    path = Path(settings.get("path", DEFAULT_OUTBOX_PATH))
+    path = path if path.is_absolute() else REPO_ROOT / path
+    with _outboxes_lock:
+        outbox = _outboxes.get(str(path))
+        if outbox is None:
+            try:
+                outbox = Outbox(
+                    path,
+                    batch_size=settings.get("batch_size", 500),
+                    retry_seconds=settings.get("retry_seconds", 5),
+                    max_backoff=settings.get("max_backoff_seconds", 900),
+                    max_attempts=settings.get("max_attempts"),
+                    lease_seconds=settings.get("lease_seconds", 600),
+                    poll_seconds=settings.get("poll_seconds", 5),
+                )
+            except sqlite3.Error:
+                return None
+            _outboxes[str(path)] = outbox
+        return outbox
+
+
+def drain_outbox(timeout: Optional[float] = None) -> bool:
+    """
+    For one-shot processes: wait up to `timeout` (default drain_on_exit_seconds)
+    for the Sheets and Mongo entries of the runs this process put. Returns
+    False, logging an error, if any are left or were dead-lettered; other
+    processes' entries and Slack messages don't count.
+    """
+    if timeout is None:
+        settings = load_global_config().get("outbox", {}) or {}
+        timeout = float(settings.get("drain_on_exit_seconds", 120))
+    with _outboxes_lock:
+        outboxes = [outbox for outbox in _outboxes.values() if outbox._workers and outbox.runs]
+    delivered = True
+    for outbox in outboxes:
+        runs = set(outbox.runs)
+        if not outbox.drain(timeout, sinks=DATA_SINKS, runs=runs):
+            left = {sink: outbox.pending(sink, runs) for sink in DATA_SINKS}
+            logger.error(f"Outbox: entries still undelivered after {timeout:.0f}s {left} ({outbox.path})")
+            delivered = False
+        dead = {sink: outbox.dead(sink, runs) for sink in DATA_SINKS}
+        if any(dead.values()):
+            logger.error(f"Outbox: entries of this run were dead-lettered {dead} ({outbox.path})")
+            delivered = False
+    return delivered
+
+
+def outbox_stats() -> dict:
+    """summary() of the process-wide outbox (empty when it was never opened or is off)."""
+    with _outboxes_lock:
+        outboxes = list(_outboxes.values())
+    return outboxes[0].summary() if outboxes else {}
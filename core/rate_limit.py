@@ -0,0 +1,141 @@
+"""
+Per-host rate limiting — token buckets shared by every session and browser tab.
+
+Each host gets one bucket for the whole process: `burst` requests may go out
+back to back, then requests flow at `rate` per second. Callers only wait when
+the bucket is empty, and counties that share a host (e.g. the Revize
+`cms.revize.com` family) share its budget — the strictest configured limit wins.
+
+Settings come from the county YAML, falling back to `scraping` in global.yaml:
+
+    scraper:
+      rate_limit:
+        rate: 3.0        # requests per second, sustained
+        burst: 5         # requests allowed back to back
+
+    scraping:
+      rate_limit_delay_seconds: 1.0   # default rate = 1 / delay
+      rate_limit_burst: 3
+
+Sessions from core.http.get_session() are throttled automatically; browser
+navigations go through core.browser.navigate() (and fetch_details()), and
+non-DrissionPage drivers call throttle() themselves.
+
+Usage:
+    from core.rate_limit import throttle
+    throttle(detail_url, "osceola")         # before a Playwright/Selenium navigation
+"""
+
+import time
+import threading
+from urllib.parse import urlparse
+
+from core.exceptions import ConfigError
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks only when the bucket is empty."""
+
+    def __init__(self, rate: float, burst: float = 1):
+        self.rate = max(float(rate), 1e-6)
+        self.burst = max(float(burst), 1.0)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.waits = 0
+        self.waited_seconds = 0.0
+
+    def tighten(self, rate: float, burst: float):
+        """Lower the limits to the stricter of current and given settings."""
+        with self._lock:
+            self.rate = min(self.rate, max(float(rate), 1e-6))
+            self.burst = min(self.burst, max(float(burst), 1.0))
+            self._tokens = min(self._tokens, self.burst)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Take `tokens`, sleeping until they are available. Returns seconds waited."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve now (tokens may go negative) so concurrent callers queue fairly
+            self._tokens -= tokens
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.requests += 1
+            if delay:
+                self.waits += 1
+                self.waited_seconds += delay
+        if delay:
+            time.sleep(delay)
+        return delay
+
+
+_buckets = {}
+_configured = set()  # (host, county) pairs whose settings were already applied
+_buckets_lock = threading.Lock()
+
+
+def host_of(url: str) -> str:
+    """Bucket key for a URL (lower-cased host, no port); '' if none."""
+    return (urlparse(url).hostname or "").lower()
+
+
+def rate_limit_settings(config: dict) -> tuple[float, float]:
+    """Return (rate, burst) for a merged county config."""
+    scraping = config.get("scraping", {}) or {}
+    delay = float(scraping.get("rate_limit_delay_seconds", 1.0) or 1.0)
+    limits = (config.get("scraper", {}) or {}).get("rate_limit", {}) or {}
+    rate = float(limits.get("rate", 1.0 / delay))
+    burst = float(limits.get("burst", scraping.get("rate_limit_burst", 3)))
+    return rate, burst
+
+
+def get_bucket(host: str, county: str = None) -> TokenBucket:
+    """
+    Return the process-wide bucket for a host.
+
+    The first caller creates it from its county's settings; later callers
+    from other counties can only make it stricter.
+    """
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is not None and (host, county) in _configured:
+            return bucket
+
+    from core.config_loader import load_config, load_global_config
+    try:
+        config = load_config(county) if county else load_global_config()
+    except ConfigError:
+        config = load_global_config()
+    rate, burst = rate_limit_settings(config)
+
+    with _buckets_lock:
+        _configured.add((host, county))
+        bucket = _buckets.get(host)
+        if bucket is None:
+            bucket = _buckets[host] = TokenBucket(rate, burst)
+            return bucket
+    if rate < bucket.rate or burst < bucket.burst:
+        bucket.tighten(rate, burst)
+    return bucket
+
+
+def throttle(url: str, county: str = None) -> float:
+    """Wait for the URL's host budget. Returns seconds waited."""
+    return get_bucket(host_of(url), county).acquire()
+
+
+def stats() -> dict:
+    """Per-host counters: requests, waits, waited_seconds, rate, burst."""
+    with _buckets_lock:
+        return {
+            host: {
+                "requests": b.requests,
+                "waits": b.waits,
+                "waited_seconds": round(b.waited_seconds, 2),
+                "rate": b.rate,
+                "burst": b.burst,
+            }
+            for host, b in _buckets.items()
+        }
@@ -0,0 +1,127 @@
+"""
+Cron schedules — parses the 5-field `schedule_cron` expressions used in county configs.
+
+Supports `*`, `*/n`, `a-b`, `a-b/n`, `a,b,c` per field (minute hour day-of-month
+month day-of-week). Day-of-week 0 and 7 are both Sunday. When both day fields
+are restricted, a day matches if EITHER matches (standard cron semantics).
+
+Usage:
+    from core.schedule import CronSchedule, get_schedule_cron
+    cron = CronSchedule(get_schedule_cron(config))
+    next_run = cron.next_after(datetime.now())
+"""
+
+from datetime import datetime, timedelta
+from core.exceptions import ConfigError
+
+
+_FIELD_RANGES = [
+    (0, 59),   # minute
+    (0, 23),   # hour
+    (1, 31),   # day of month
+    (1, 12),   # month
+    (0, 7),    # day of week (0/7 = Sunday)
+]
+
+
+def _parse_field(text: str, low: int, high: int) -> set[int]:
+    """Expand one cron field into the set of values it matches."""
+    values = set()
+    for part in text.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step <= 0:
+                raise ValueError(f"bad step: {step_text}")
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(part)
+            end = high if step > 1 else start
+        if start < low or end > high or start > end:
+            raise ValueError(f"{part} out of range {low}-{high}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronSchedule:
+    """A parsed 5-field cron expression."""
+
+    def __init__(self, expr: str):
+        fields = (expr or "").split()
+        if len(fields) != 5:
+            raise ConfigError(f"Invalid cron expression (need 5 fields): {expr!r}")
+        try:
+            parsed = [_parse_field(f, lo, hi) for f, (lo, hi) in zip(fields, _FIELD_RANGES)]
+        except ValueError as e:
+            raise ConfigError(f"Invalid cron expression {expr!r}: {e}")
+
+        self.expr = expr
+        self.minutes, self.hours, self.days, self.months, dows = parsed
+        # Cron Sunday is 0 or 7; Python's weekday() has Monday=0 … Sunday=6
+        self.weekdays = {(d - 1) % 7 for d in dows}
+        self._dom_restricted = fields[2] != "*"
+        self._dow_restricted = fields[4] != "*"
+
+    def _day_matches(self, dt: datetime) -> bool:
+        dom = dt.day in self.days
+        dow = dt.weekday() in self.weekdays
+        if self._dom_restricted and self._dow_restricted:
+            return dom or dow
+        if self._dom_restricted:
+            return dom
+        if self._dow_restricted:
+            return dow
+        return True
+
+    def matches(self, dt: datetime) -> bool:
+        """True if the schedule fires at dt's minute."""
+        return (
+            dt.minute in self.minutes and dt.hour in self.hours
+            and dt.month in self.months and self._day_matches(dt)
+        )
+
+    def next_after(self, dt: datetime) -> datetime:
+        """
+        Return the first fire time strictly after dt (minute resolution).
+
+        Skips whole months/days/hours that cannot match instead of stepping
+        minute by minute, so even sparse schedules resolve in a few hundred steps.
+        """
+        t = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = t + timedelta(days=366 * 5)
+        while t < limit:
+            if t.month not in self.months:
+                t = (t.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+                continue
+            if not self._day_matches(t):
+                t = t.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if t.hour not in self.hours:
+                t = t.replace(minute=0) + timedelta(hours=1)
+                continue
+            if t.minute not in self.minutes:
+                t += timedelta(minutes=1)
+                continue
+            return t
+        raise ConfigError(f"Cron expression never fires: {self.expr!r}")
+
+    def __repr__(self):
+        return f"CronSchedule({self.expr!r})"
+
+
+def get_schedule_cron(config: dict) -> str:
+    """
+    Return a county's cron expression.
+
+    County YAMLs use `schedule: {cron: ...}`; `_defaults.yaml` provides the
+    flat `schedule_cron` fallback.
+    """
+    schedule = config.get("schedule") or {}
+    if isinstance(schedule, dict) and schedule.get("cron"):
+        return schedule["cron"]
+    return config.get("schedule_cron", "")
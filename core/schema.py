@@ -1,7 +1,7 @@
 """
 Schema validation and column ordering.
 
-Loads config/schema.json and validates records against the 34-column standard.
+Loads config/schema.json and validates records against the 35-column standard.
 
 Usage:
     from core.schema import validate_record, get_column_order
@@ -30,7 +30,7 @@ def _load_schema() -> dict:
 
 
 def get_column_order() -> list[str]:
-    """Return the canonical 34-column order."""
+    """Return the canonical 35-column order."""
     return _load_schema()["columns"]
 
 
@@ -76,7 +76,7 @@ def record_to_row(record: dict) -> list:
         record: Dict with field names as keys.
 
     Returns:
-        List of values in the 34-column order.
+        List of values in the 35-column order.
     """
     columns = get_column_order()
     defaults = get_defaults()
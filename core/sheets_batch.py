@@ -0,0 +1,248 @@
+"""
+Batched Sheets writes — queue row inserts, send them as two API calls.
+
+gspread's insert_rows() is two HTTP requests (an insertDimension, then a
+USER_ENTERED values update), and a county run makes one per chunk for its
+tab, again for Qualified_Arrests and once more for Ingestion_Log. With every
+county running that exhausts the per-minute write quota (429s).
+
+SheetsBatch collects the inserts of every SheetsWriter in the process (all
+counties, all tabs of one spreadsheet) and flush() sends them as:
+
+  1. one spreadsheets.batchUpdate holding an insertDimension per queued
+     insert, in queue order, so each insert's row means what it did when
+     it was queued;
+  2. one values.batchUpdate (USER_ENTERED, same parsing as insert_rows)
+     writing every block at its final position.
+
+A flush happens when `sheets.batch.max_rows` rows are queued, when the
+oldest queued insert is `sheets.batch.max_delay_seconds` old (checked as
+inserts arrive and by flush_due(), which the daemon calls each tick), when
+a writer flushes at the end of its run, and at interpreter exit. A queued
+insert's on_written callback (the dedup index update) runs only once its
+flush succeeded; a failed flush marks its inserts failed and the writers
+that queued them raise from SheetsWriter.flush().
+
+`sheets.batch.enabled: false` in config/global.yaml writes immediately again.
+
+Usage:
+    from core.sheets_batch import get_batch
+    batch = get_batch(spreadsheet)            # None when batching is off
+    op = batch.add(worksheet, rows, row=2)
+    batch.flush()
+    if op.error: ...
+"""
+
+import atexit
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from core.config_loader import load_global_config
+
+logger = logging.getLogger(__name__)
+
+
+class PendingInsert:
+    """One queued insert_rows(): `rows` at 1-based `row` of `worksheet`."""
+
+    __slots__ = ('worksheet', 'row', 'rows', 'keys', 'on_written', 'done', 'error')
+
+    def __init__(self, worksheet, rows: list, row: int, keys=(), on_written: Optional[Callable] = None):
+        self.worksheet = worksheet
+        self.row = row
+        self.rows = rows
+        self.keys = list(keys)
+        self.on_written = on_written
+        self.done = False
+        self.error: Optional[Exception] = None
+
+
+def _a1(title: str, row: int) -> str:
+    return "'{}'!A{}".format(title.replace("'", "''"), row)
+
+
+def _final_blocks(ops: List[PendingInsert]) -> list:
+    """
+    Where each insert's rows sit once all inserts are applied in order:
+    [(title, 0-based start, rows)]. A later insert at or above an earlier
+    block pushes it down; one landing inside it splits it.
+    """
+    tabs: Dict[int, list] = {}
+    titles: Dict[int, str] = {}
+    for op in ops:
+        sheet_id, start, n = op.worksheet.id, op.row - 1, len(op.rows)
+        titles[sheet_id] = op.worksheet.title
+        blocks = tabs.setdefault(sheet_id, [])
+        for block in list(blocks):
+            if block[0] >= start:
+                block[0] += n
+            elif start < block[0] + len(block[1]):
+                cut = start - block[0]
+                blocks.append([start + n, block[1][cut:]])
+                block[1] = block[1][:cut]
+        blocks.append([start, op.rows])
+    return [(titles[sid], start, rows) for sid, blocks in tabs.items() for start, rows in blocks if rows]
+
+
+class SheetsBatch:
+    """Process-wide insert queue for one spreadsheet. See module docstring. Thread-safe."""
+
+    def __init__(self, spreadsheet, max_rows: int = 5000, max_delay: float = 30.0):
+        self.spreadsheet = spreadsheet
+        self.max_rows = max(1, int(max_rows))
+        self.max_delay = float(max_delay)
+        self._pending: List[PendingInsert] = []
+        self._inflight: List[PendingInsert] = []
+        self._rows = 0
+        self._oldest: Optional[float] = None
+        self._lock = threading.Lock()        # The queue
+        self._flush_lock = threading.Lock()  # One flush at a time
+        self.stats = {'flushes': 0, 'inserts': 0, 'rows': 0, 'requests': 0, 'failed': 0}
+
+    def add(self, worksheet, rows: list, row: int = 2, keys=(), on_written: Optional[Callable] = None) -> PendingInsert:
+        """Queue an insert; flushes first if the queue is over its size or age limit."""
+        op = PendingInsert(worksheet, rows, row, keys, on_written)
+        with self._lock:
+            self._pending.append(op)
+            self._rows += len(rows)
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            full = self._rows >= self.max_rows
+        if full or self._is_stale():
+            self.flush()
+        return op
+
+    def queued_keys(self, title: str) -> set:
+        """Keys of inserts for tab `title` that are queued or being sent."""
+        with self._lock:
+            return {key for op in self._pending + self._inflight if op.worksheet.title == title for key in op.keys}
+
+    def _is_stale(self) -> bool:
+        with self._lock:
+            return self._oldest is not None and time.monotonic() - self._oldest >= self.max_delay
+
+    def hold(self):
+        """Context manager: no flush starts while held (e.g. while rows are moved off a tab)."""
+        return self._flush_lock
+
+    def flush_due(self) -> int:
+        """Flush only if the oldest queued insert has waited max_delay. Returns inserts sent."""
+        return self.flush() if self._is_stale() else 0
+
+    def flush(self) -> int:
+        """Send everything queued. Errors are recorded on each insert, not raised. Returns inserts sent."""
+        with self._flush_lock:
+            with self._lock:
+                ops, self._pending = self._pending, []
+                self._inflight = ops
+                self._rows, self._oldest = 0, None
+            if not ops:
+                return 0
+            try:
+                self._send(ops)
+            except Exception as e:
+                logger.warning(f"Batched Sheets flush of {len(ops)} inserts failed: {e}")
+                self.stats['failed'] += len(ops)
+                for op in ops:
+                    op.error, op.done = e, True
+            else:
+                self.stats['flushes'] += 1
+                self.stats['inserts'] += len(ops)
+                self.stats['rows'] += sum(len(op.rows) for op in ops)
+                for op in ops:
+                    op.done = True
+                    if op.on_written is not None:
+                        try:
+                            op.on_written()
+                        except Exception as e:
+                            logger.warning(f"Post-write callback for '{op.worksheet.title}' failed: {e}")
+            finally:
+                with self._lock:
+                    self._inflight = []
+            return len(ops)
+
+    def _send(self, ops: List[PendingInsert]) -> None:
+        self.spreadsheet.batch_update({'requests': [
+            {'insertDimension': {
+                'range': {
+                    'sheetId': op.worksheet.id, 'dimension': 'ROWS',
+                    'startIndex': op.row - 1, 'endIndex': op.row - 1 + len(op.rows),
+                },
+                'inheritFromBefore': False,
+            }}
+            for op in ops
+        ]})
+        self.stats['requests'] += 1
+        try:
+            self.spreadsheet.values_batch_update({
+                'valueInputOption': 'USER_ENTERED',
+                'data': [{'range': _a1(title, start + 1), 'values': rows} for title, start, rows in _final_blocks(ops)],
+            })
+            self.stats['requests'] += 1
+        except Exception:
+            self._undo_inserts(ops)
+            raise
+
+    def _undo_inserts(self, ops: List[PendingInsert]) -> None:
+        """Remove the blank rows inserted for `ops` (best effort, newest first)."""
+        try:
+            self.spreadsheet.batch_update({'requests': [
+                {'deleteDimension': {'range': {
+                    'sheetId': op.worksheet.id, 'dimension': 'ROWS',
+                    'startIndex': op.row - 1, 'endIndex': op.row - 1 + len(op.rows),
+                }}}
+                for op in reversed(ops)
+            ]})
+        except Exception as e:
+            logger.warning(f"Could not remove blank rows after a failed Sheets flush: {e}")
+
+
+_batches: Dict[str, SheetsBatch] = {}
+_batches_lock = threading.Lock()
+
+
+def get_batch(spreadsheet) -> Optional[SheetsBatch]:
+    """The process-wide SheetsBatch for `spreadsheet`, or None when `sheets.batch.enabled` is off."""
+    settings = (load_global_config().get('sheets', {}) or {}).get('batch', {}) or {}
+    if settings.get('enabled', True) is False:
+        return None
+    with _batches_lock:
+        batch = _batches.get(spreadsheet.id)
+        if batch is None:
+            batch = SheetsBatch(
+                spreadsheet,
+                max_rows=settings.get('max_rows', 5000),
+                max_delay=settings.get('max_delay_seconds', 30),
+            )
+            _batches[spreadsheet.id] = batch
+        return batch
+
+
+def flush_due() -> int:
+    """flush_due() on every batch (the daemon's tick)."""
+    with _batches_lock:
+        batches = list(_batches.values())
+    return sum(batch.flush_due() for batch in batches)
+
+
+def flush_all() -> int:
+    """Flush every batch now."""
+    with _batches_lock:
+        batches = list(_batches.values())
+    return sum(batch.flush() for batch in batches)
+
+
+def batch_stats() -> dict:
+    """Totals across batches: flushes, inserts, rows, requests (HTTP calls), failed."""
+    totals = {'flushes': 0, 'inserts': 0, 'rows': 0, 'requests': 0, 'failed': 0}
+    with _batches_lock:
+        for batch in _batches.values():
+            for key in totals:
+                totals[key] += batch.stats[key]
+    return totals
+
+
+# Nothing queued is lost when a one-shot run (run_county.py / run_all.py) exits
+atexit.register(flush_all)
@@ -0,0 +1,196 @@
+"""
+Sheets API quota — pace every Google Sheets call to stay under the quota.
+
+The Sheets API allows a fixed number of read and write requests per minute
+(per user and per project). gspread sends whatever it is asked to, so a burst
+of counties meets a wall of 429s, then idles. install_quota(client) routes all
+of a gspread client's HTTP requests through one process-wide SheetsQuota:
+
+  - reads (GET, batchGet, getByDataFilter) and writes (everything else) each
+    get a sliding one-minute window; a call waits until its window has room
+  - 429 / 503 responses are retried (up to `max_retries`) after the
+    server's Retry-After, else truncated exponential backoff with jitter,
+    and the whole window of that kind pauses meanwhile so other threads
+    don't keep spending quota. A 500 may come after the request was
+    applied, so it is retried only for requests that are safe to repeat:
+    reads and values writes other than append (not e.g. a batchUpdate
+    insertDimension, which would insert its rows twice)
+  - quota_stats() counts calls, retries, bytes sent / received and seconds
+    spent waiting (included in run_all.py --json)
+
+Limits come from `sheets.quota` in config/global.yaml; `enabled: false`
+leaves clients untouched.
+
+Usage:
+    from core.sheets_quota import install_quota
+    client = install_quota(gspread.authorize(credentials))
+"""
+
+import json
+import random
+import threading
+import time
+from collections import deque
+
+from core.config_loader import load_global_config
+
+RETRY_STATUSES = {429, 503}         # Rejected unapplied: any request may be resent
+IDEMPOTENT_RETRY_STATUSES = {500}   # Possibly applied: resent only if repeating is harmless
+_READ_SUFFIXES = (":batchGet", ":getByDataFilter", ":batchGetByDataFilter")
+_IDEMPOTENT_WRITE_SUFFIXES = ("/values:batchUpdate", "/values:batchClear", ":clear")
+
+
+def _status(exc) -> int:
+    return getattr(getattr(exc, 'response', None), 'status_code', None) or 0
+
+
+def _retry_after(exc):
+    """Seconds from the error response's Retry-After header, if any."""
+    headers = getattr(getattr(exc, 'response', None), 'headers', None) or {}
+    try:
+        return max(0.0, float(headers.get('Retry-After')))
+    except (TypeError, ValueError):
+        return None
+
+
+def _body_size(kwargs: dict) -> int:
+    if kwargs.get('json') is not None:
+        return len(json.dumps(kwargs['json']))
+    data = kwargs.get('data')
+    return len(data) if isinstance(data, (bytes, str)) else 0
+
+
+class SheetsQuota:
+    """Sliding-window read/write budgets with 429 backoff. Thread-safe."""
+
+    def __init__(self, reads_per_minute: int = 60, writes_per_minute: int = 60,
+                 window: float = 60.0, max_retries: int = 5, max_backoff: float = 64.0):
+        self.limits = {'read': max(1, int(reads_per_minute)), 'write': max(1, int(writes_per_minute))}
+        self.window = float(window)
+        self.max_retries = int(max_retries)
+        self.max_backoff = float(max_backoff)
+        self._sent = {'read': deque(), 'write': deque()}
+        self._paused_until = {'read': 0.0, 'write': 0.0}
+        self._lock = threading.Lock()
+        self.stats = {
+            'read_calls': 0, 'write_calls': 0, 'retries': 0, 'errors': 0,
+            'bytes_sent': 0, 'bytes_received': 0, 'throttled_seconds': 0.0,
+        }
+
+    @staticmethod
+    def kind(method: str, endpoint: str) -> str:
+        """'read' or 'write' quota for a request."""
+        if method.upper() == 'GET' or str(endpoint).split('?')[0].endswith(_READ_SUFFIXES):
+            return 'read'
+        return 'write'
+
+    @classmethod
+    def idempotent(cls, method: str, endpoint: str) -> bool:
+        """True if sending the request twice leaves the sheet as sending it once."""
+        if cls.kind(method, endpoint) == 'read':
+            return True
+        path = str(endpoint).split('?')[0]
+        if method.upper() == 'PUT' and '/values/' in path:
+            return True  # values.update
+        return path.endswith(_IDEMPOTENT_WRITE_SUFFIXES)
+
+    def acquire(self, kind: str) -> float:
+        """Block until a `kind` call fits in the window (and any 429 pause is over). Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                sent = self._sent[kind]
+                while sent and now - sent[0] >= self.window:
+                    sent.popleft()
+                delay = self._paused_until[kind] - now
+                if delay <= 0 and len(sent) < self.limits[kind]:
+                    sent.append(now)
+                    self.stats['throttled_seconds'] += waited
+                    return waited
+                if delay <= 0:
+                    delay = sent[0] + self.window - now
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, kind: str, seconds: float) -> None:
+        """Hold every `kind` call for `seconds` (after a 429)."""
+        with self._lock:
+            self._paused_until[kind] = max(self._paused_until[kind], time.monotonic() + seconds)
+
+    def call(self, request, method: str, endpoint: str, *args, **kwargs):
+        """Run `request(method, endpoint, ...)` within budget, retrying 429/503 (and 500 if idempotent)."""
+        kind = self.kind(method, endpoint)
+        retry_statuses = RETRY_STATUSES | (IDEMPOTENT_RETRY_STATUSES if self.idempotent(method, endpoint) else set())
+        sent = _body_size(kwargs)
+        for attempt in range(self.max_retries + 1):
+            self.acquire(kind)
+            with self._lock:
+                self.stats[f'{kind}_calls'] += 1
+                self.stats['bytes_sent'] += sent
+            try:
+                response = request(method, endpoint, *args, **kwargs)
+            except Exception as e:
+                if _status(e) not in retry_statuses or attempt == self.max_retries:
+                    with self._lock:
+                        self.stats['errors'] += 1
+                    raise
+                wait = _retry_after(e)
+                if wait is None:
+                    wait = min(self.max_backoff, 2 ** attempt + random.uniform(0, 1))
+                self.pause(kind, wait)
+                with self._lock:
+                    self.stats['retries'] += 1
+                continue
+            content = getattr(response, 'content', None)
+            if content is not None:
+                with self._lock:
+                    self.stats['bytes_received'] += len(content)
+            return response
+
+
+_quota = None
+_quota_lock = threading.Lock()
+
+
+def get_quota():
+    """The process-wide SheetsQuota, or None when `sheets.quota.enabled` is off."""
+    global _quota
+    settings = (load_global_config().get('sheets', {}) or {}).get('quota', {}) or {}
+    if settings.get('enabled', True) is False:
+        return None
+    with _quota_lock:
+        if _quota is None:
+            _quota = SheetsQuota(
+                reads_per_minute=settings.get('reads_per_minute', 60),
+                writes_per_minute=settings.get('writes_per_minute', 60),
+                max_retries=settings.get('max_retries', 5),
+            )
+        return _quota
+
+
+def install_quota(client):
+    """Route a gspread client's requests through the shared quota. Returns the client."""
+    quota = get_quota()
+    # gspread 6 sends through client.http_client.request, gspread 5 through client.request
+    target = getattr(client, 'http_client', None) or client
+    if quota is None or getattr(target, '_sheets_quota', None) is quota:
+        return client
+    request = target.request
+
+    def paced_request(method, endpoint, *args, **kwargs):
+        return quota.call(request, method, endpoint, *args, **kwargs)
+
+    target.request = paced_request
+    target._sheets_quota = quota
+    return client
+
+
+def quota_stats() -> dict:
+    """Counters of the shared quota (empty when it was never used or is off)."""
+    with _quota_lock:
+        if _quota is None:
+            return {}
+        stats = dict(_quota.stats)
+    stats['throttled_seconds'] = round(stats['throttled_seconds'], 1)
+    return stats
@@ -27,9 +27,11 @@ import datetime
 import requests
 from bs4 import BeautifulSoup
 
+from core.http import conditional_get, get_session
+
 
 def scrape_smartcop(base_url: str, county: str, jail_path: str = "/smartwebclient/Jail.aspx",
-                    timeout: int = 30, load_all: bool = True) -> list:
+                    timeout: int = 30, load_all: bool = True, watermark: dict = None) -> list:
     """
     Scrape a SmartCOP jail roster site.
 
@@ -39,6 +41,8 @@ def scrape_smartcop(base_url: str, county: str, jail_path: str = "/smartwebclien
         jail_path: Path to jail page (varies slightly between sites)
         timeout: HTTP request timeout in seconds
         load_all: If True, attempt to load all pages via AJAX pagination
+        watermark: The county's core.watermark mark; "Load More Results" stops
+            once a batch reaches a booking the last run already returned
 
     Returns:
         list[dict] — arrest records matching the 34-column schema
@@ -46,16 +50,10 @@ def scrape_smartcop(base_url: str, county: str, jail_path: str = "/smartwebclien
     url = f"{base_url.rstrip('/')}{jail_path}"
     sys.stderr.write(f"[{county.upper()}] SmartCOP scraper → {url}\n")
 
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
-                       '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-    })
+    session = get_session(county.lower().replace(" ", "_"))
 
     try:
-        resp = session.get(url, timeout=timeout)
+        resp = conditional_get(session, url, timeout=timeout)
         resp.raise_for_status()
     except requests.RequestException as e:
         sys.stderr.write(f"[{county.upper()}] FAIL: {e}\n")
@@ -72,7 +70,8 @@ def scrape_smartcop(base_url: str, county: str, jail_path: str = "/smartwebclien
     # Load additional results via AJAX if available
     all_html = resp.text
     if load_all:
-        all_html = _load_all_results(session, url, soup, all_html, county)
+        known = {str(b).strip() for b in (watermark or {}).get('booking_numbers') or []}
+        all_html = _load_all_results(session, url, soup, all_html, county, known=known)
 
     # Re-parse with all results
     soup = BeautifulSoup(all_html, 'html.parser')
@@ -84,8 +83,23 @@ def scrape_smartcop(base_url: str, county: str, jail_path: str = "/smartwebclien
     return records
 
 
-def _load_all_results(session, url, soup, html, county, max_iterations=20):
-    """Load all pages via AJAX AddMoreResults endpoint."""
+def _card_bookings(soup):
+    """Booking numbers of the inmate cards in a parsed page or AJAX fragment."""
+    bookings = set()
+    for row in soup.find_all('tr', style=lambda s: s and 'InmateRecordRow' in str(s)):
+        booking = _parse_single_inmate(row, '', '').get('Booking_Number')
+        if booking:
+            bookings.add(str(booking).strip())
+    return bookings
+
+
+def _seen_booking(soup, known):
+    """True if a card in the parsed HTML has a booking number the last run already returned."""
+    return not known.isdisjoint(_card_bookings(soup))
+
+
+def _load_all_results(session, url, soup, html, county, max_iterations=20, known=None):
+    """Load all pages via AJAX AddMoreResults endpoint, stopping at `known` bookings."""
     # Extract ASP.NET form data for AJAX calls
     load_more = soup.find(id='LoadMoreRow')
     if not load_more:
@@ -97,6 +111,9 @@ def _load_all_results(session, url, soup, html, county, max_iterations=20):
 
     if records_loaded == 0:
         return html
+    if known and _seen_booking(soup, known):
+        sys.stderr.write(f"[{county.upper()}] Reached last run's bookings on first page\n")
+        return html
 
     for i in range(max_iterations):
         try:
@@ -135,6 +152,8 @@ def _load_all_results(session, url, soup, html, county, max_iterations=20):
 
             if results_attempted > results_returned:
                 break  # No more results
+            if known and _seen_booking(BeautifulSoup(new_html, 'html.parser'), known):
+                break  # Caught up with the previous run
 
         except Exception as e:
             sys.stderr.write(f"[{county.upper()}] AJAX pagination stopped: {e}\n")
@@ -1,14 +1,29 @@
 """
-Anti-bot evasion utilities — Cloudflare waits, fingerprint helpers.
+Anti-bot evasion utilities — Cloudflare waits, page-readiness waits, fingerprint helpers.
 
 Usage:
     from core.stealth import wait_for_cloudflare
     if not wait_for_cloudflare(page):
         raise ScraperBlocked("Cloudflare did not clear")
+
+    from core.stealth import wait_for_ready, page_time
+    navigate(page, url, "sarasota")      # core.browser.navigate
+    wait_for_ready(page, "css:#results", network_idle=True, county="sarasota", step="search")
+
+    t0 = page_time(page)                 # before an action that fires XHR
+    button.click()
+    wait_for_ready(page, xhr="/api/", since=t0, county="duval", step="search")
+
+Readiness conditions can be overridden per county and step in the county YAML:
+
+    scraper:
+      ready:
+        search: {selector: "css:table.results", network_idle: false, timeout: 15}
 """
 
 import sys
 import time
+import threading
 
 
 def wait_for_cloudflare(page, max_wait: int = 20) -> bool:
@@ -33,6 +48,153 @@ def wait_for_cloudflare(page, max_wait: int = 20) -> bool:
     return False
 
 
+_READY_JS_STATE = "return [document.readyState, performance.getEntriesByType('resource').length];"
+
+_READY_JS_XHR = """
+return performance.getEntriesByType('resource').some(function (e) {
+    return (e.initiatorType === 'xmlhttprequest' || e.initiatorType === 'fetch')
+        && e.name.indexOf(arguments[0]) >= 0 && e.responseEnd >= arguments[1];
+});
+"""
+
+_wait_stats = {}
+_wait_stats_lock = threading.Lock()
+
+
+def page_time(page) -> float:
+    """The page's performance.now() in ms — pass as wait_for_ready(since=...)."""
+    try:
+        return float(page.run_js("return performance.now();"))
+    except Exception:
+        return 0.0
+
+
+# (county, step) → (config_mtime, `scraper.ready.<step>`); wait_for_ready runs per detail
+# page, so the county config is only merged again when one of its files changes
+_ready_cache = {}
+
+
+def _ready_overrides(county: str, step: str) -> dict:
+    from core.config_loader import config_mtime, load_config
+    mtime = config_mtime(county)
+    cached = _ready_cache.get((county, step))
+    if cached is None or cached[0] != mtime:
+        scraper = load_config(county).get("scraper", {}) or {}
+        cached = (mtime, dict((scraper.get("ready", {}) or {}).get(step, {}) or {}))
+        _ready_cache[(county, step)] = cached
+    return cached[1]
+
+
+def _ready_settings(county: str, step: str, defaults: dict) -> dict:
+    """Merge code defaults with `scraper.ready.<step>` from the county YAML."""
+    settings = dict(defaults)
+    if county and step:
+        try:
+            settings.update(_ready_overrides(county, step))
+        except Exception as e:
+            sys.stderr.write(f"   ⚠️ Ready settings for {county}/{step} unavailable: {e}\n")
+    selector = settings.get("selector")
+    settings["selector"] = [selector] if isinstance(selector, str) else list(selector or [])
+    return settings
+
+
+def _record_wait(county: str, step: str, condition: str, seconds: float):
+    with _wait_stats_lock:
+        entry = _wait_stats.setdefault((county or "", step or ""), {
+            "waits": 0, "timeouts": 0, "total_seconds": 0.0, "max_seconds": 0.0, "by": {},
+        })
+        entry["waits"] += 1
+        entry["total_seconds"] += seconds
+        entry["max_seconds"] = max(entry["max_seconds"], seconds)
+        entry["by"][condition] = entry["by"].get(condition, 0) + 1
+        if condition == "timeout":
+            entry["timeouts"] += 1
+
+
+def wait_for_ready(page, selector=None, network_idle: bool = False, xhr: str = None,
+                   timeout: float = 10.0, since: float = 0.0, idle_seconds: float = 0.5,
+                   navigation: bool = False, county: str = None, step: str = None) -> bool:
+    """
+    Wait until the page is usable, instead of sleeping a fixed time.
+
+    Returns True as soon as ANY configured condition holds:
+      - selector:     a DrissionPage locator (or list of them) is present
+      - network_idle: document is complete and no new resources loaded for idle_seconds
+      - xhr:          an XHR/fetch whose URL contains this text finished after `since`
+                      (a page_time() mark; 0 = any since the last navigation)
+
+    Pass navigation=True after a click/back() that reloads the whole page, so
+    the old document's elements are not mistaken for the new one's (waits up
+    to 3s for the load to start, in case the click turned out to be AJAX).
+
+    Returns False on timeout. `county`/`step` apply `scraper.ready.<step>`
+    overrides from the county YAML and key the timing stats in wait_stats().
+    """
+    settings = _ready_settings(county, step, {
+        "selector": selector, "network_idle": network_idle, "xhr": xhr, "timeout": timeout,
+        "navigation": navigation,
+    })
+    selectors = settings["selector"]
+    timeout = float(settings["timeout"])
+
+    start = time.monotonic()
+    deadline = start + timeout
+    if settings["navigation"]:
+        try:
+            page.wait.load_start(timeout=min(timeout, 3))
+        except Exception:
+            pass
+    last_resources, idle_since = None, start
+    while True:
+        condition = None
+        for locator in selectors:
+            try:
+                if page.ele(locator, timeout=0):
+                    condition = "selector"
+                    break
+            except Exception:
+                continue
+        if condition is None and settings["xhr"]:
+            try:
+                if page.run_js(_READY_JS_XHR, settings["xhr"], since):
+                    condition = "xhr"
+            except Exception:
+                pass
+        if condition is None and settings["network_idle"]:
+            try:
+                ready_state, resources = page.run_js(_READY_JS_STATE)
+            except Exception:
+                ready_state, resources = "", None
+            now = time.monotonic()
+            if ready_state != "complete" or resources != last_resources:
+                last_resources, idle_since = resources, now
+            elif now - idle_since >= idle_seconds:
+                condition = "network_idle"
+
+        now = time.monotonic()
+        if condition or now >= deadline:
+            _record_wait(county, step, condition or "timeout", now - start)
+            if not condition:
+                sys.stderr.write(f"   ⏳ Page not ready after {timeout:g}s ({county or '?'}/{step or '?'})\n")
+            return bool(condition)
+        time.sleep(0.1)
+
+
+def wait_stats() -> dict:
+    """Per (county, step) wait timings: waits, timeouts, total/avg/max seconds, hits by condition."""
+    with _wait_stats_lock:
+        return {
+            f"{county}/{step}": {
+                **entry,
+                "total_seconds": round(entry["total_seconds"], 2),
+                "avg_seconds": round(entry["total_seconds"] / entry["waits"], 2),
+                "max_seconds": round(entry["max_seconds"], 2),
+                "by": dict(entry["by"]),
+            }
+            for (county, step), entry in _wait_stats.items()
+        }
+
+
 def random_delay(min_seconds: float = 0.5, max_seconds: float = 2.0):
     """Add a random delay to avoid detection patterns."""
     import random
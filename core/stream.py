@@ -0,0 +1,81 @@
+"""
+Streaming helpers — let run_pipeline process solver output in bounded chunks.
+
+A solver may return a list (classic), or yield records / lists of records
+(streaming: a `stream_<county>()` generator). Either way run_pipeline walks
+iter_chunks() and runs dedup → score → Sheets → JSON → Mongo per chunk, so
+memory stays flat regardless of days_back and everything flushed before a
+mid-scrape crash is kept.
+
+Chunk size comes from `pipeline.chunk_size` in config/global.yaml.
+
+Usage:
+    from core.stream import StreamDedup, iter_chunks
+    dedup = StreamDedup("lee")
+    for chunk in iter_chunks(stream_lee(), 200):     # RecordBatch chunks
+        unique = dedup.filter(chunk)
+"""
+
+import sys
+
+from core.batch import RecordBatch
+
+
+def iter_chunks(records, size: int = 200):
+    """
+    Yield RecordBatch chunks of at most `size` records.
+
+    `records` is a list of dicts, a RecordBatch, or an iterable yielding dicts
+    and/or lists of dicts (a solver flushing a page at a time).
+    """
+    size = max(1, int(size))
+    if isinstance(records, (list, RecordBatch)):
+        for start in range(0, len(records), size):
+            if isinstance(records, RecordBatch):
+                yield records.take(range(start, min(start + size, len(records))))
+            else:
+                yield RecordBatch.from_records(records[start:start + size])
+        return
+
+    buffer = []
+    try:
+        for item in records:
+            if isinstance(item, dict):
+                buffer.append(item)
+            else:
+                buffer.extend(item)
+            while len(buffer) >= size:
+                yield RecordBatch.from_records(buffer[:size])
+                del buffer[:size]
+    except Exception:
+        if buffer:
+            yield RecordBatch.from_records(buffer)  # Keep what the solver collected before failing
+        raise
+    if buffer:
+        yield RecordBatch.from_records(buffer)
+
+
+class StreamDedup:
+    """Booking_Number + County dedup across every chunk of one run."""
+
+    def __init__(self, county_name: str = ""):
+        self.county_name = county_name
+        self.seen = set()
+        self.duplicates = 0
+
+    def filter(self, batch: RecordBatch) -> RecordBatch:
+        keep = []
+        for i, (county, booking) in enumerate(zip(batch.column("County"), batch.column("Booking_Number"))):
+            booking = str(booking or "").strip()
+            if booking:
+                key = f"{str(county or '').strip()}|{booking}"
+                if key in self.seen:
+                    continue
+                self.seen.add(key)
+            keep.append(i)
+        removed = len(batch) - len(keep)
+        if not removed:
+            return batch
+        self.duplicates += removed
+        sys.stderr.write(f"🔍 [{self.county_name}] Dedup: {removed} duplicates removed from chunk\n")
+        return batch.take(keep)
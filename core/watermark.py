@@ -0,0 +1,132 @@
+"""
+High-water marks — where each county's last successful run left off.
+
+run_pipeline() loads the county's mark before calling the solver and advances
+it after the records are written, so scheduled runs only fetch the new slice:
+
+  - days_back is narrowed to "days since the newest booking seen" plus
+    `incremental.overlap_days` (never wider than the configured window).
+  - Solvers that accept a `watermark` argument get the mark itself and can
+    stop paging as soon as they reach bookings they have already returned
+    (Lee's API pagination, SmartCOP's "Load More Results").
+
+Marks live in one JSON file (`incremental.state_path`, default
+output/state/watermarks.json). A mark never moves backwards, and a county
+with `scraper.incremental: false` always gets a full scrape.
+
+Usage:
+    from core.watermark import load_watermark, incremental_days_back, advance_watermark
+    mark = load_watermark("lee", config)          # None → full scrape
+    if mark:
+        config['scraper']['days_back'] = incremental_days_back(mark, config)
+    ...
+    advance_watermark("lee", records, config)
+"""
+
+import os
+import json
+import threading
+from datetime import date, datetime
+from pathlib import Path
+
+from core.normalizer import normalize_date
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_STATE_PATH = "output/state/watermarks.json"
+RECENT_BOOKINGS = 50  # Booking numbers kept per county for "already seen" checks
+
+_lock = threading.Lock()
+
+
+def _settings(config: dict) -> dict:
+    inc = (config or {}).get("incremental", {}) or {}
+    scraper = (config or {}).get("scraper", {}) or {}
+    return {
+        "enabled": bool(inc.get("enabled", True)) and scraper.get("incremental", True) is not False,
+        "overlap_days": int(inc.get("overlap_days", 1)),
+        "state_path": inc.get("state_path", DEFAULT_STATE_PATH),
+    }
+
+
+def _state_file(config: dict) -> Path:
+    path = Path(_settings(config)["state_path"])
+    return path if path.is_absolute() else REPO_ROOT / path
+
+
+def _read_state(path: Path) -> dict:
+    try:
+        with open(path) as f:
+            return json.load(f) or {}
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _booking_date(record: dict, county: str = "") -> str:
+    """Record's booking date as YYYY-MM-DD, or '' if it cannot be parsed (counted per county in date_stats())."""
+    county = str(record.get("County") or county).strip()
+    value = normalize_date(str(record.get("Booking_Date", "") or ""), county, "Booking_Date")
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        return ""
+    return value
+
+
+def load_watermark(county: str, config: dict) -> dict:
+    """
+    Return the county's mark, or None when there is none or incremental mode is off.
+
+    Keys: booking_date (YYYY-MM-DD), booking_number (newest), booking_numbers
+    (most recent RECENT_BOOKINGS), records, updated_at.
+    """
+    if not _settings(config)["enabled"]:
+        return None
+    with _lock:
+        return _read_state(_state_file(config)).get(county) or None
+
+
+def incremental_days_back(watermark: dict, config: dict) -> int:
+    """days_back covering everything since the mark plus the overlap, capped at the configured window."""
+    days_back = int(config["scraper"]["days_back"])
+    if not watermark or not watermark.get("booking_date"):
+        return days_back
+    last = datetime.strptime(watermark["booking_date"], "%Y-%m-%d").date()
+    since = max(0, (date.today() - last).days) + _settings(config)["overlap_days"]
+    return max(1, min(days_back, since))
+
+
+def advance_watermark(county: str, records: list[dict], config: dict) -> dict:
+    """Move the county's mark forward to the newest booking in `records` and persist it."""
+    settings = _settings(config)
+    if not settings["enabled"] or not records:
+        return None
+
+    dated = [(d, r) for r in records if (d := _booking_date(r, county))]
+    dated.sort(key=lambda pair: pair[0], reverse=True)
+    numbers = [str(r.get("Booking_Number", "")).strip() for _, r in dated]
+    numbers = [n for n in numbers if n]
+
+    path = _state_file(config)
+    with _lock:
+        state = _read_state(path)
+        mark = dict(state.get(county) or {})
+        previous = [n for n in mark.get("booking_numbers", []) if n not in numbers]
+        newest = dated[0][0] if dated else ""
+        if newest and newest >= mark.get("booking_date", ""):
+            mark["booking_date"] = newest
+            mark["booking_number"] = numbers[0] if numbers else mark.get("booking_number", "")
+            seen = numbers + previous
+        else:
+            seen = previous + numbers
+        mark["booking_numbers"] = seen[:RECENT_BOOKINGS]
+        mark["records"] = len(records)
+        mark["updated_at"] = datetime.now().isoformat(timespec="seconds")
+        state[county] = mark
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+        os.replace(tmp, path)
+    return mark
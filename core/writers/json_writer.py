@@ -10,17 +10,19 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+from core.batch import RecordBatch
+
 
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 
 
-def write_json(records: list[dict], county_name: str, stage: str = "raw",
+def write_json(records, county_name: str, stage: str = "raw",
                output_base: str = None) -> Path:
     """
     Write records to a JSON file in the output directory.
 
     Args:
-        records: List of record dicts
+        records: List of record dicts, or a RecordBatch
         county_name: County name (used for folder)
         stage: One of "raw", "normalized", "failed"
         output_base: Override output base dir (default: output/)
@@ -40,12 +42,62 @@ def write_json(records: list[dict], county_name: str, stage: str = "raw",
     filename = f"{date_str}_{stage}.json"
     filepath = output_dir / filename
 
+    if isinstance(records, RecordBatch):
+        records = records.to_documents()
+
     with open(filepath, "w") as f:
         json.dump(records, f, indent=2, default=str)
 
     return filepath
 
 
+class JsonArrayWriter:
+    """
+    Writes the same file as write_json(), one chunk at a time, so a streaming
+    run never holds all its records. The file is created on the first write
+    (an empty run leaves any earlier file alone) and finished by close().
+
+    Usage:
+        with JsonArrayWriter("lee", stage="normalized") as out:
+            for chunk in chunks:
+                out.write(chunk)
+    """
+
+    def __init__(self, county_name: str, stage: str = "raw", output_base: str = None):
+        base = Path(output_base) if output_base else REPO_ROOT / "output"
+        date_str = datetime.now().strftime("%Y-%m-%d")
+        self.path = base / stage / county_name / f"{date_str}_{stage}.json"
+        self._file = None
+        self.count = 0
+
+    def write(self, records) -> None:
+        if isinstance(records, RecordBatch):
+            records = records.to_documents()
+        if not records:
+            return
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "w")
+            self._file.write("[")
+        for record in records:
+            self._file.write(",\n  " if self.count else "\n  ")
+            self._file.write(json.dumps(record, default=str))
+            self.count += 1
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.write("\n]")
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
 def write_json_output(*args, **kwargs):
     """
     Wrapper that handles both calling conventions:
@@ -58,7 +110,7 @@ def write_json_output(*args, **kwargs):
 
     if len(args) >= 2:
         # Detect swapped args: if first arg is a string, it's the county name
-        if isinstance(args[0], str) and isinstance(args[1], list):
+        if isinstance(args[0], str) and isinstance(args[1], (list, RecordBatch)):
             # Swapped: (county_name, records, ...) → fix to (records, county_name, ...)
             args = (args[1], args[0]) + args[2:]
 
@@ -3,7 +3,8 @@
 MongoDB Writer — core/writers/mongo_writer.py
 
 Writes normalized arrest records to MongoDB Atlas using bulk upsert.
-Dedup key: (County, Booking_Number)
+Dedup key: (County, Booking_Number). Keys written are recorded under the
+"mongo" sink of the local dedup index (core/dedup_index.py).
 
 Usage:
     from core.writers.mongo_writer import write_to_mongo, ping_mongo
@@ -16,6 +17,11 @@ import os
 import logging
 from datetime import datetime, timezone
 
+from core.batch import RecordBatch
+from core.dedup_index import get_index
+
+MONGO_SINK = "mongo"
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,17 +62,21 @@ def ping_mongo() -> bool:
         client.close()
 
 
-def write_to_mongo(records: list, county: str = "Unknown") -> dict:
+def write_to_mongo(records, county: str = "Unknown", strict: bool = False) -> dict:
     """
     Bulk upsert arrest records into MongoDB Atlas.
 
     Args:
-        records: List of normalized arrest record dicts.
+        records: List of normalized arrest record dicts, or a RecordBatch.
         county: County name (used as fallback if not in record).
+        strict: Raise when MongoDB is unavailable or the write fails instead
+            of logging it (the outbox retries on exceptions).
 
     Returns:
         dict with stats: { inserted, updated, errors, total }
     """
+    if isinstance(records, RecordBatch):
+        records = records.to_documents()
     stats = {"inserted": 0, "updated": 0, "errors": 0, "total": len(records)}
 
     if not records:
@@ -75,6 +85,8 @@ def write_to_mongo(records: list, county: str = "Unknown") -> dict:
 
     client = _get_client()
     if not client:
+        if strict:
+            raise ConnectionError("MongoDB unavailable — records not written")
         logger.warning("MongoDB unavailable — records not written")
         return stats
 
@@ -92,6 +104,7 @@ def write_to_mongo(records: list, county: str = "Unknown") -> dict:
         )
 
         operations = []
+        keys = []
         now = datetime.now(timezone.utc).isoformat()
 
         for record in records:
@@ -110,6 +123,7 @@ def write_to_mongo(records: list, county: str = "Unknown") -> dict:
             doc.setdefault("_source", "swfl-arrest-scrapers")
             doc.setdefault("_pipeline_version", "2.0")
 
+            keys.append((rec_county, booking_num))
             operations.append(
                 UpdateOne(
                     {"County": rec_county, "Booking_Number": booking_num},
@@ -122,6 +136,12 @@ def write_to_mongo(records: list, county: str = "Unknown") -> dict:
             result = collection.bulk_write(operations, ordered=False)
             stats["inserted"] = result.upserted_count
             stats["updated"] = result.modified_count
+            try:
+                index = get_index()
+                if index is not None:
+                    index.add(MONGO_SINK, keys)
+            except Exception as e:
+                logger.warning(f"Could not update dedup index: {e}")
             logger.info(
                 f"MongoDB: {stats['inserted']} inserted, "
                 f"{stats['updated']} updated, "
@@ -132,6 +152,8 @@ def write_to_mongo(records: list, county: str = "Unknown") -> dict:
             logger.warning("No valid operations to write to MongoDB")
 
     except Exception as e:
+        if strict:
+            raise
         logger.error(f"MongoDB bulk write failed: {e}", exc_info=True)
         stats["errors"] = len(records)
     finally:
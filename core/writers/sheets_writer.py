@@ -2,12 +2,30 @@
 Google Sheets Writer — core/writers/sheets_writer.py
 
 Writes arrest records to Google Sheets with:
-- 34-column header in row 1 (auto-created if missing)
+- Canonical header (HEADER_ROW) in row 1 (auto-created if missing)
 - NEW RECORDS INSERTED AT ROW 2 (newest first — today's arrests at top)
-- Deduplication by County + Booking_Number
+- Deduplication by County + Booking_Number (local index, core/dedup_index.py)
 - Qualified_Arrests cross-posting for high-score leads
 - Ingestion logging
 
+Worksheet handles, "header is in place" and (with the dedup index off) key
+sets are cached per tab for the life of the process, so repeated writes in a
+run don't re-read row 1 or the tab; when keys must come from the sheet only
+the County / Booking_Number columns (B:C) are read. clear_sheet_cache()
+forgets it all (the daemon does so when idle).
+
+Every API call is paced by the shared read/write quota (core/sheets_quota.py).
+Inserts are queued on the process-wide SheetsBatch (core/sheets_batch.py)
+and sent with other counties' as batchUpdate calls; call flush() at the end
+of a run to send them and surface any failure (`sheets.batch.enabled: false`
+writes immediately).
+
+Because every insert shifts the whole tab, tabs are kept short: rotate()
+moves rows past `sheets.rotation` (max_rows / max_days) in one block to
+"<tab> Archive YYYY-MM" tabs, in this spreadsheet or in
+`archive_spreadsheet_id`. Archived keys stay in the dedup index, and seeding
+it from the sheet reads the archive tabs too.
+
 Ported from python_scrapers/writers/sheets_writer.py with row-2 insert fix.
 """
 
@@ -15,15 +33,26 @@ import os
 import json
 import base64
 import logging
+import threading
+import time
+from contextlib import nullcontext
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timedelta
+from pathlib import Path
 
 import gspread
 from google.oauth2.service_account import Credentials
 
+from core.batch import RecordBatch
+from core.config_loader import load_global_config
+from core.dedup import batch_keys
+from core.dedup_index import get_index, sheet_sink
+from core.sheets_batch import get_batch
+from core.sheets_quota import install_quota
+
 logger = logging.getLogger(__name__)
 
-# 34-column canonical header (matches ArrestRecord.get_header_row())
+# Canonical header: ArrestRecord.get_header_row() plus Person_Key (core/identity.py)
 HEADER_ROW = [
     "Scrape_Timestamp", "County", "Booking_Number", "Person_ID", "Full_Name",
     "First_Name", "Middle_Name", "Last_Name", "DOB", "Arrest_Date", "Arrest_Time",
@@ -31,9 +60,53 @@ HEADER_ROW = [
     "Race", "Sex", "Height", "Weight", "Address", "City", "State", "ZIP",
     "Mugshot_URL", "Charges", "Bond_Amount", "Bond_Paid", "Bond_Type",
     "Court_Type", "Case_Number", "Court_Date", "Court_Time", "Court_Location",
-    "Detail_URL", "Lead_Score", "Lead_Status", "LastChecked", "LastCheckedMode"
+    "Detail_URL", "Lead_Score", "Lead_Status", "LastChecked", "LastCheckedMode",
+    "Person_Key"
 ]
 
+# Scrape_Timestamp / log Timestamp as Sheets may display them
+_TIME_FORMATS = ('%m/%d/%Y %H:%M:%S', '%m/%d/%Y %H:%M', '%m/%d/%Y')
+
+
+def _column_letter(n: int) -> str:
+    """A1 letters of 1-based column `n` ('AM' for 39)."""
+    letters = ''
+    while n > 0:
+        n, rem = divmod(n - 1, 26)
+        letters = chr(ord('A') + rem) + letters
+    return letters
+
+
+def _row_time(value) -> Optional[datetime]:
+    """Parse a timestamp cell; None if empty or unrecognized."""
+    text = str(value or '').strip()
+    if not text:
+        return None
+    try:
+        return datetime.fromisoformat(text[:19].replace(' ', 'T', 1))
+    except ValueError:
+        pass
+    for fmt in _TIME_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _row_keys(values: list) -> set:
+    """(County, Booking_Number) pairs from B:C rows."""
+    keys = set()
+    for row in values:
+        if len(row) > 1 and row[0] and row[1]:
+            keys.add((row[0].strip(), row[1].strip()))
+    return keys
+
+
+def _rotation_settings() -> dict:
+    return (load_global_config().get('sheets', {}) or {}).get('rotation', {}) or {}
+
+
 SCOPES = [
     'https://www.googleapis.com/auth/spreadsheets',
     'https://www.googleapis.com/auth/drive'
@@ -62,6 +135,114 @@ def _build_credentials(credentials_path: Optional[str] = None) -> Credentials:
     return Credentials.from_service_account_file(credentials_path, scopes=SCOPES)
 
 
+# Authorized clients and opened spreadsheets, reused for the life of the process.
+# A cold authorize + open_by_key costs several round trips; the daemon and
+# parallel run_all create a SheetsWriter per county run.
+_clients: Dict[str, gspread.Client] = {}
+_spreadsheets: Dict[str, gspread.Spreadsheet] = {}
+_client_lock = threading.Lock()
+
+
+def get_client(credentials_path: Optional[str] = None) -> gspread.Client:
+    """Return an authorized gspread client, cached per credentials source."""
+    key = credentials_path or os.getenv('GOOGLE_SERVICE_ACCOUNT_KEY_PATH') or 'env'
+    with _client_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = install_quota(gspread.authorize(_build_credentials(credentials_path)))
+            _clients[key] = client
+        return client
+
+
+def open_spreadsheet(spreadsheet_id: str, credentials_path: Optional[str] = None) -> gspread.Spreadsheet:
+    """Open a spreadsheet by key, cached per ID."""
+    client = get_client(credentials_path)
+    with _client_lock:
+        spreadsheet = _spreadsheets.get(spreadsheet_id)
+        if spreadsheet is None:
+            spreadsheet = client.open_by_key(spreadsheet_id)
+            _spreadsheets[spreadsheet_id] = spreadsheet
+        return spreadsheet
+
+
+class _TabState:
+    """What a run knows about one tab: its handle, header state, keys (index off)."""
+
+    __slots__ = ('worksheet', 'header_ok', 'keys', 'lock')
+
+    def __init__(self, worksheet: gspread.Worksheet):
+        self.worksheet = worksheet
+        self.header_ok = False
+        self.keys: Optional[set] = None
+        self.lock = threading.Lock()
+
+
+# (spreadsheet_id, tab title) -> _TabState
+_tab_states: Dict[tuple, _TabState] = {}
+_tab_lock = threading.Lock()
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+DEFAULT_ROTATION_STATE_PATH = "output/state/rotation_marks.json"
+
+# Rotation marks ("<spreadsheet_id>|<tab>" -> {'rows': estimated data rows, 'next_check':
+# epoch seconds}) live in `sheets.rotation.state_path`, so one-shot runs and outbox
+# deliveries don't re-read column A each time. Rows this process inserted since rotate()
+# last folded them into the tab's mark:
+_rotation_added: Dict[tuple, int] = {}
+_rotation_lock = threading.Lock()
+
+
+def _rotation_state_file() -> Path:
+    path = Path(_rotation_settings().get('state_path', DEFAULT_ROTATION_STATE_PATH))
+    return path if path.is_absolute() else REPO_ROOT / path
+
+
+def _read_rotation_state(path: Path) -> dict:
+    try:
+        with open(path) as f:
+            return json.load(f) or {}
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _write_rotation_state(path: Path, state: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix('.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def _load_rotation_mark(key: tuple) -> Optional[dict]:
+    """The tab's stored mark, with the rows this process inserted since added to it."""
+    path = _rotation_state_file()
+    with _rotation_lock:
+        added = _rotation_added.pop(key, 0)
+        state = _read_rotation_state(path)
+        mark = state.get('|'.join(key))
+        if mark is not None and added:
+            mark['rows'] += added
+            _write_rotation_state(path, state)
+        return mark
+
+
+def _save_rotation_mark(key: tuple, rows: int, next_check: float) -> None:
+    path = _rotation_state_file()
+    with _rotation_lock:
+        _rotation_added.pop(key, None)  # Counted in `rows`
+        state = _read_rotation_state(path)
+        state['|'.join(key)] = {'rows': rows, 'next_check': next_check}
+        _write_rotation_state(path, state)
+
+
+def clear_sheet_cache(spreadsheet_id: Optional[str] = None) -> None:
+    """Forget cached tab state (for one spreadsheet, or all), e.g. after editing tabs by hand."""
+    with _tab_lock:
+        for key in [k for k in _tab_states if spreadsheet_id in (None, k[0])]:
+            del _tab_states[key]
+
+
 class SheetsWriter:
     """
     Writes arrest records to Google Sheets.
@@ -69,7 +250,9 @@ class SheetsWriter:
     Key behavior:
     - Header locked in row 1
     - New records INSERT at row 2 (pushing older records down)
-    - Deduplication by County:Booking_Number composite key
+    - Deduplication by County:Booking_Number composite key, answered from
+      the local dedup index (seeded from the tab once, then kept current on
+      each successful insert) instead of reading the whole tab per write
     """
 
     QUALIFIED_SHEET = 'Qualified_Arrests'
@@ -77,9 +260,58 @@ class SheetsWriter:
 
     def __init__(self, spreadsheet_id: str, credentials_path: Optional[str] = None):
         self.spreadsheet_id = spreadsheet_id
-        creds = _build_credentials(credentials_path)
-        self.client = gspread.authorize(creds)
-        self.spreadsheet = self.client.open_by_key(spreadsheet_id)
+        self.credentials_path = credentials_path
+        self.client = get_client(credentials_path)
+        self.spreadsheet = open_spreadsheet(spreadsheet_id, credentials_path)
+        self.batch = get_batch(self.spreadsheet)
+        self._queued = []  # This writer's inserts waiting on the batch
+
+    @property
+    def deferred(self) -> bool:
+        """True when inserts are only sent on flush() (or when the batch fills up)."""
+        return self.batch is not None
+
+    def _state(self, sheet: gspread.Worksheet) -> _TabState:
+        return self._tab(sheet.title)
+
+    def _tab(self, name: str) -> _TabState:
+        """Cached state of a tab, opening (or creating) it on first use."""
+        key = (self.spreadsheet_id, name)
+        with _tab_lock:
+            state = _tab_states.get(key)
+        if state is None:
+            try:
+                worksheet = self.spreadsheet.worksheet(name)
+            except gspread.WorksheetNotFound:
+                worksheet = self.spreadsheet.add_worksheet(title=name, rows=1000, cols=len(HEADER_ROW))
+            with _tab_lock:
+                state = _tab_states.setdefault(key, _TabState(worksheet))
+        return state
+
+    def _insert(self, sheet: gspread.Worksheet, rows: list, row: int, keys: list = None) -> None:
+        """insert_rows() now, or queued on the batch; `keys` go to the dedup index once written."""
+        keys = [(str(c).strip(), str(b).strip()) for c, b in keys or ()]
+        with _rotation_lock:
+            key = (self.spreadsheet_id, sheet.title)
+            _rotation_added[key] = _rotation_added.get(key, 0) + len(rows)
+        if self.batch is not None:
+            self._queued.append(self.batch.add(
+                sheet, rows, row, keys,
+                on_written=(lambda: self._remember(sheet, keys)) if keys else None,
+            ))
+            return
+        try:
+            sheet.insert_rows(rows, row=row, value_input_option='USER_ENTERED')
+        except Exception:
+            self._forget(sheet)
+            raise
+        if keys:
+            self._remember(sheet, keys)
+
+    def _forget(self, sheet: gspread.Worksheet) -> None:
+        """Drop a tab's cached state after a failed write (it may have been renamed, cleared, ...)."""
+        with _tab_lock:
+            _tab_states.pop((self.spreadsheet_id, sheet.title), None)
 
     # ------------------------------------------------------------------
     # Public API
@@ -87,19 +319,22 @@ class SheetsWriter:
 
     def write_records(
         self,
-        records: List[Dict[str, Any]],
+        records,
         county: str,
-        deduplicate: bool = True
+        deduplicate: bool = True,
+        row: int = 2
     ) -> Dict[str, Any]:
         """
-        Write arrest record dicts to the county's sheet tab.
+        Write arrest records to the county's sheet tab.
 
         Records are inserted at ROW 2 so newest arrests appear at top.
 
         Args:
-            records: List of record dicts (keys matching HEADER_ROW)
+            records: RecordBatch, or list of record dicts (keys matching HEADER_ROW)
             county: County name (used as sheet tab name)
             deduplicate: Skip records whose Booking_Number already exists
+            row: Insert position; a streaming run passes 2 + rows already
+                written so its later (older) chunks land below earlier ones
 
         Returns:
             Stats dict with new_records, duplicates_skipped, qualified_records
@@ -116,42 +351,42 @@ class SheetsWriter:
         if not records:
             return stats
 
+        batch = RecordBatch.from_records(records)
         sheet = self._get_or_create_sheet(county)
         self._ensure_header(sheet)
 
         # Get existing dedup keys
+        keys = batch_keys(batch, county)
         existing_keys = set()
         if deduplicate:
-            existing_keys = self._get_existing_keys(sheet)
-
-        # Filter duplicates and build rows
-        new_rows = []
-        for record in records:
-            booking = record.get('Booking_Number', '')
-            rec_county = record.get('County', county)
-            dedup_key = f"{rec_county}:{booking}"
+            existing_keys = self._get_existing_keys(sheet, keys)
 
+        # Filter duplicates column-wise
+        new_indices = []
+        for i, dedup_key in enumerate(keys):
             if deduplicate and dedup_key in existing_keys:
                 stats['duplicates_skipped'] += 1
                 continue
+            new_indices.append(i)
 
-            row = self._record_to_row(record, county)
-            new_rows.append(row)
+        if not new_indices:
+            return stats
+
+        new_batch = batch.take(new_indices)
+        new_rows = self._batch_to_rows(new_batch, county)
 
-            # Track qualified
+        # Track qualified
+        qualified_rows = []
+        for new_row, score, status in zip(new_rows, new_batch.column('Lead_Score'), new_batch.column('Lead_Status')):
             try:
-                score = int(record.get('Lead_Score', 0))
-                status = record.get('Lead_Status', '')
-                if score >= self.QUALIFIED_MIN_SCORE and status != 'Disqualified':
+                if int(score or 0) >= self.QUALIFIED_MIN_SCORE and status != 'Disqualified':
                     stats['qualified_records'] += 1
+                    qualified_rows.append(new_row)
             except (ValueError, TypeError):
                 pass
 
-        if not new_rows:
-            return stats
-
         # INSERT at row 2 (newest first) — batch insert
-        sheet.insert_rows(new_rows, row=2, value_input_option='USER_ENTERED')
+        self._insert(sheet, new_rows, row, [(r[1], r[2]) for r in new_rows])
         stats['new_records'] = len(new_rows)
 
         logger.info(
@@ -160,10 +395,6 @@ class SheetsWriter:
         )
 
         # Cross-post qualified records to Qualified_Arrests sheet
-        qualified_rows = [
-            r for r, rec in zip(new_rows, records)
-            if int(rec.get('Lead_Score', 0)) >= self.QUALIFIED_MIN_SCORE
-        ]
         if qualified_rows:
             self._write_qualified(qualified_rows)
 
@@ -172,20 +403,30 @@ class SheetsWriter:
     def log_ingestion(
         self, county: str, stats: Dict[str, Any], error: Optional[str] = None
     ) -> None:
-        """Log scraper run to the 'Logs' sheet tab."""
+        """
+        Log scraper run to the 'Logs' sheet tab.
+
+        `stats` is write_records()'s result, with total_records set to the
+        number of records scraped and changed_records / unchanged_records
+        from the change detector (unchanged bookings are never written).
+        """
         try:
-            sheet = self._get_or_create_sheet('Ingestion_Log')
+            state = self._tab('Ingestion_Log')
+            sheet = state.worksheet
             log_headers = [
                 'Timestamp', 'County', 'Total_Records', 'New_Records',
-                'Duplicates_Skipped', 'Qualified_Records', 'Status', 'Error'
+                'Duplicates_Skipped', 'Qualified_Records', 'Status', 'Error',
+                'Changed_Records', 'Unchanged_Records'
             ]
-            # Ensure header
-            try:
-                if sheet.row_values(1) != log_headers:
-                    sheet.update('A1:H1', [log_headers], value_input_option='USER_ENTERED')
-                    sheet.freeze(rows=1)
-            except Exception:
-                sheet.update('A1:H1', [log_headers], value_input_option='USER_ENTERED')
+            # Ensure header (checked once per run)
+            if not state.header_ok:
+                try:
+                    if sheet.row_values(1) != log_headers:
+                        sheet.update('A1:J1', [log_headers], value_input_option='USER_ENTERED')
+                        sheet.freeze(rows=1)
+                except Exception:
+                    sheet.update('A1:J1', [log_headers], value_input_option='USER_ENTERED')
+                state.header_ok = True
 
             log_row = [
                 datetime.utcnow().isoformat(),
@@ -195,94 +436,264 @@ class SheetsWriter:
                 stats.get('duplicates_skipped', 0),
                 stats.get('qualified_records', 0),
                 'ERROR' if error else 'SUCCESS',
-                error or ''
+                error or '',
+                stats.get('changed_records', 0),
+                stats.get('unchanged_records', 0),
             ]
-            sheet.insert_rows([log_row], row=2, value_input_option='USER_ENTERED')
+            self._insert(sheet, [log_row], 2)
         except Exception as e:
             logger.warning(f"Could not log ingestion: {e}")
 
+    def flush(self) -> None:
+        """
+        Send queued inserts (everyone's, not just this writer's) and raise
+        the first error any of this writer's inserts hit. No-op when not batching.
+        """
+        if self.batch is None:
+            return
+        self.batch.flush()
+        queued, self._queued = self._queued, []
+        failed = [op for op in queued if op.error is not None]
+        for op in failed:
+            self._forget(op.worksheet)
+        if failed:
+            raise failed[0].error
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
     def _get_or_create_sheet(self, name: str) -> gspread.Worksheet:
-        try:
-            return self.spreadsheet.worksheet(name)
-        except gspread.WorksheetNotFound:
-            return self.spreadsheet.add_worksheet(title=name, rows=1000, cols=len(HEADER_ROW))
+        return self._tab(name).worksheet
 
     def _ensure_header(self, sheet: gspread.Worksheet) -> None:
-        """Write header to row 1 if missing or wrong."""
+        """Write header to row 1 if missing or wrong (read once per tab per run)."""
+        state = self._state(sheet)
+        if state.header_ok:
+            return
         try:
             existing = sheet.row_values(1)
             if existing == HEADER_ROW:
+                state.header_ok = True
                 return
         except Exception:
             pass
 
-        col_letter = chr(ord('A') + len(HEADER_ROW) - 1)  # 'AM' for 39 cols
-        # For columns > Z, we need AA+ notation
-        n = len(HEADER_ROW)
-        if n <= 26:
-            col_letter = chr(ord('A') + n - 1)
-        else:
-            col_letter = chr(ord('A') + (n - 1) // 26 - 1) + chr(ord('A') + (n - 1) % 26)
-
+        if sheet.col_count < len(HEADER_ROW):
+            sheet.add_cols(len(HEADER_ROW) - sheet.col_count)  # Tabs created before a column was added
+        col_letter = _column_letter(len(HEADER_ROW))  # 'AN' for 40 cols
         sheet.update(f'A1:{col_letter}1', [HEADER_ROW], value_input_option='USER_ENTERED')
         sheet.format(f'A1:{col_letter}1', {
             'textFormat': {'bold': True},
             'backgroundColor': {'red': 0.0, 'green': 0.66, 'blue': 0.42}
         })
         sheet.freeze(rows=1)
-
-    def _get_existing_keys(self, sheet: gspread.Worksheet) -> set:
-        """Get County:Booking_Number composite keys from existing rows."""
+        state.header_ok = True
+
+    def rebuild_index(self, name: str) -> int:
+        """Re-seed the dedup index for a tab from its current rows. Returns the key count."""
+        sheet = self._get_or_create_sheet(name)
+        self._state(sheet).keys = None
+        index = get_index()
+        keys = self._read_tab_keys(sheet)
+        if index is None or keys is None:
+            return 0
+        return index.rebuild(sheet_sink(self.spreadsheet_id, sheet.title), keys)
+
+    def _get_existing_keys(self, sheet: gspread.Worksheet, keys: list) -> set:
+        """(County, Booking_Number) pairs among `keys` that the tab already has."""
+        queued = self.batch.queued_keys(sheet.title) & set(keys) if self.batch is not None else set()
+        index = get_index()
+        if index is None:
+            # No index: read the tab once per run, then keep the set current in _remember()
+            state = self._state(sheet)
+            with state.lock:
+                if state.keys is None:
+                    state.keys = self._read_tab_keys(sheet)
+                return (state.keys & set(keys) if state.keys is not None else set()) | queued
+        sink = sheet_sink(self.spreadsheet_id, sheet.title)
+        if not index.is_seeded(sink):
+            existing = self._read_tab_keys(sheet)
+            if existing is None:
+                return queued
+            index.rebuild(sink, existing)
+            logger.info(f"Seeded dedup index for '{sheet.title}' with {len(existing)} keys")
+        return index.known(sink, keys) | queued
+
+    def _read_sheet_keys(self, sheet: gspread.Worksheet) -> Optional[set]:
+        """County/Booking_Number pairs from every row of the tab (None if unreadable)."""
         try:
-            all_values = sheet.get_all_values()
-            if len(all_values) <= 1:
-                return set()
-
-            # County = col index 1, Booking_Number = col index 2
-            keys = set()
-            for row in all_values[1:]:
-                if len(row) > 2 and row[1] and row[2]:
-                    keys.add(f"{row[1]}:{row[2]}")
-            return keys
+            # County = column B, Booking_Number = column C; the other 37 columns aren't downloaded
+            values = sheet.get('B2:C')
         except Exception as e:
             logger.warning(f"Could not read existing keys: {e}")
-            return set()
+            return None
+        return _row_keys(values)
+
+    def _read_tab_keys(self, sheet: gspread.Worksheet) -> Optional[set]:
+        """_read_sheet_keys() plus the keys of the tab's archive tabs (None if the tab is unreadable)."""
+        keys = self._read_sheet_keys(sheet)
+        if keys is None:
+            return None
+        try:
+            archive = self._archive_spreadsheet()
+            titles = self._archive_titles(archive, sheet.title)
+            if titles:
+                ranges = ["'{}'!B2:C".format(t.replace("'", "''")) for t in titles]
+                for value_range in archive.values_batch_get(ranges).get('valueRanges', []):
+                    keys |= _row_keys(value_range.get('values', []))
+        except Exception as e:
+            logger.warning(f"Could not read archived keys of '{sheet.title}': {e}")
+        return keys
+
+    def _remember(self, sheet: gspread.Worksheet, keys: list) -> None:
+        """Record keys of rows just inserted (only once the insert succeeded)."""
+        index = get_index()
+        if index is None:
+            state = self._state(sheet)
+            with state.lock:
+                if state.keys is not None:
+                    state.keys.update((str(c).strip(), str(b).strip()) for c, b in keys)
+            return
+        try:
+            index.add(sheet_sink(self.spreadsheet_id, sheet.title), keys)
+        except Exception as e:
+            # The next run may re-insert these rows; rebuild_index() resyncs
+            logger.warning(f"Could not update dedup index for '{sheet.title}': {e}")
+
+    # ------------------------------------------------------------------
+    # Rotation
+    # ------------------------------------------------------------------
+
+    def rotate(self, name: str) -> int:
+        """
+        Move the rows of tab `name` past the `sheets.rotation` limits to
+        "<name> Archive YYYY-MM" tabs (by Scrape_Timestamp). Returns rows moved.
+
+        Rows are newest first, so the rows to move are one block at the
+        bottom: one read, one insert per archive month, one delete_rows().
+        Nothing is read while the tab's estimated size is under the limit
+        and its last check is less than check_interval_minutes old. Batched
+        inserts don't flush meanwhile, so rows can't shift under the move.
+        """
+        settings = _rotation_settings()
+        max_rows = int(settings.get('max_rows', 20000) or 0)
+        max_days = float(settings.get('max_days', 0) or 0)
+        if settings.get('enabled', True) is False or not (max_rows or max_days):
+            return 0
+        min_move = max(1, int(settings.get('min_move', 1000)))
+        interval = float(settings.get('check_interval_minutes', 60)) * 60
+
+        mark_key = (self.spreadsheet_id, name)
+        mark = _load_rotation_mark(mark_key)
+        if mark is not None and time.time() < mark['next_check'] and (
+                not max_rows or mark['rows'] < max_rows + min_move):
+            return 0
+
+        sheet = self._get_or_create_sheet(name)
+        with self.batch.hold() if self.batch is not None else nullcontext():
+            times = sheet.col_values(1)[1:]
+            start = min(len(times), max_rows) if max_rows else len(times)
+            if max_days:
+                cutoff = datetime.utcnow() - timedelta(days=max_days)
+                for i, value in enumerate(times[:start]):
+                    when = _row_time(value)
+                    if when is not None and when < cutoff:
+                        start = i
+                        break
+            moving = len(times) - start
+            next_check = time.time() + interval
+            if moving < min_move:
+                _save_rotation_mark(mark_key, len(times), next_check)
+                return 0
+
+            first, last = start + 2, len(times) + 1
+            header = sheet.row_values(1) or HEADER_ROW
+            months: Dict[str, list] = {}
+            for row in sheet.get(f'A{first}:{_column_letter(len(header))}{last}'):
+                if any(row):
+                    when = _row_time(row[0])
+                    months.setdefault(when.strftime('%Y-%m') if when else '', []).append(row)
+
+            # Copy first, then delete: a failure in between leaves rows in both places, never neither
+            archive = self._archive_spreadsheet()
+            for month, rows in months.items():
+                tab = self._archive_tab(archive, f'{name} Archive {month}'.rstrip(), header)
+                tab.insert_rows(rows, row=2, value_input_option='USER_ENTERED')
+            sheet.delete_rows(first, last)
+            _save_rotation_mark(mark_key, start, next_check)
+
+        logger.info(f"Rotated {moving} rows of '{name}' into {len(months)} archive tab(s)")
+        return moving
+
+    def rotate_shared(self) -> int:
+        """
+        rotate() the tabs every county writes to (Qualified_Arrests,
+        Ingestion_Log). Call only while no county is writing.
+        """
+        return sum(self.rotate(name) for name in (self.QUALIFIED_SHEET, 'Ingestion_Log'))
+
+    def _archive_spreadsheet(self) -> gspread.Spreadsheet:
+        archive_id = _rotation_settings().get('archive_spreadsheet_id') or ''
+        if not archive_id or archive_id == self.spreadsheet_id:
+            return self.spreadsheet
+        return open_spreadsheet(archive_id, self.credentials_path)
+
+    @staticmethod
+    def _archive_titles(archive: gspread.Spreadsheet, name: str) -> list:
+        prefix = f'{name} Archive'
+        return [ws.title for ws in archive.worksheets() if ws.title == prefix or ws.title.startswith(prefix + ' ')]
+
+    @staticmethod
+    def _archive_tab(archive: gspread.Spreadsheet, title: str, header: list) -> gspread.Worksheet:
+        """An archive tab, created with the live tab's header if missing."""
+        try:
+            tab = archive.worksheet(title)
+        except gspread.WorksheetNotFound:
+            tab = archive.add_worksheet(title=title, rows=2, cols=len(header))
+            tab.update(f'A1:{_column_letter(len(header))}1', [header], value_input_option='USER_ENTERED')
+            tab.freeze(rows=1)
+            return tab
+        if tab.col_count < len(header):
+            # The live tab gained columns since this archive tab was made
+            tab.add_cols(len(header) - tab.col_count)
+            tab.update(f'A1:{_column_letter(len(header))}1', [header], value_input_option='USER_ENTERED')
+        return tab
+
+    def _batch_to_rows(self, batch: RecordBatch, county: str) -> list:
+        """Convert a batch to row lists in header order (all values as strings)."""
+        now = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+        rows = []
+        for row in batch.to_rows(HEADER_ROW):
+            row = [str(v) for v in row]
+            # Ensure County is set
+            if not row[1]:
+                row[1] = county
+            # Ensure Scrape_Timestamp is set
+            if not row[0]:
+                row[0] = now
+            rows.append(row)
+        return rows
 
     def _record_to_row(self, record: dict, county: str) -> list:
-        """Convert a record dict to a row list in header order."""
-        row = []
-        for col in HEADER_ROW:
-            val = record.get(col, '')
-            if val is None:
-                val = ''
-            row.append(str(val))
-        # Ensure County is set
-        if not row[1]:
-            row[1] = county
-        # Ensure Scrape_Timestamp is set
-        if not row[0]:
-            row[0] = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
-        return row
+        """Convert a single record dict to a row list in header order."""
+        return self._batch_to_rows(RecordBatch.from_records([record]), county)[0]
 
     def _write_qualified(self, rows: list) -> None:
         """Cross-post qualified rows to the Qualified_Arrests sheet."""
         try:
             sheet = self._get_or_create_sheet(self.QUALIFIED_SHEET)
             self._ensure_header(sheet)
-            existing_keys = self._get_existing_keys(sheet)
+            keys = [(row[1].strip(), row[2].strip()) if len(row) > 2 else ('', '') for row in rows]
+            existing_keys = self._get_existing_keys(sheet, keys)
 
             new_rows = []
-            for row in rows:
-                key = f"{row[1]}:{row[2]}" if len(row) > 2 else ''
-                if key and key not in existing_keys:
+            for row, key in zip(rows, keys):
+                if all(key) and key not in existing_keys:
                     new_rows.append(row)
 
             if new_rows:
-                sheet.insert_rows(new_rows, row=2, value_input_option='USER_ENTERED')
+                self._insert(sheet, new_rows, 2, [(r[1], r[2]) for r in new_rows])
         except Exception as e:
             logger.warning(f"Could not write qualified records: {e}")
 
@@ -315,4 +726,21 @@ def write_to_sheets(
             raise ValueError("GOOGLE_SHEETS_ID environment variable not set")
 
     writer = SheetsWriter(spreadsheet_id, credentials_path)
-    return writer.write_records(records, county)
+    stats = writer.write_records(records, county)
+    writer.flush()
+    return stats
+
+
+def rotate_shared_tabs(spreadsheet_id: Optional[str] = None) -> int:
+    """
+    SheetsWriter.rotate_shared() for GOOGLE_SHEETS_ID (or `spreadsheet_id`).
+    Errors are logged, not raised. Returns rows moved.
+    """
+    spreadsheet_id = spreadsheet_id or os.getenv('GOOGLE_SHEETS_ID')
+    if not spreadsheet_id:
+        return 0
+    try:
+        return SheetsWriter(spreadsheet_id).rotate_shared()
+    except Exception as e:
+        logger.warning(f"Sheets rotation of shared tabs failed: {e}")
+        return 0
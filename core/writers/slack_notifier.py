@@ -1,6 +1,9 @@
 """
 Slack notifier — sends alerts and completion messages to Slack channels.
 
+With the outbox on (core/outbox.py), messages are queued there and sent by
+its Slack worker, retried until Slack accepts them.
+
 Usage:
     from core.writers.slack_notifier import notify_completion, notify_error
     notify_completion("charlotte", stats)
@@ -17,17 +20,33 @@ except ImportError:
     urlopen = None
 
 
+def post_slack(text: str, webhook_url: str):
+    """POST a message to a Slack webhook; raises on failure."""
+    payload = json.dumps({"text": text}).encode("utf-8")
+    req = Request(webhook_url, data=payload, headers={"Content-type": "application/json"})
+    urlopen(req, timeout=10)
+
+
 def _send_slack_message(text: str, webhook_url: str = None):
-    """Send a message to Slack via webhook."""
+    """Send a message to Slack via webhook (through the outbox when it is on)."""
     url = webhook_url or os.getenv("SLACK_WEBHOOK_URL")
     if not url:
         sys.stderr.write("⚠️ SLACK_WEBHOOK_URL not set, skipping notification\n")
         return
 
-    payload = json.dumps({"text": text}).encode("utf-8")
-    req = Request(url, data=payload, headers={"Content-type": "application/json"})
     try:
-        urlopen(req, timeout=10)
+        from core.outbox import get_outbox
+        outbox = get_outbox()
+    except Exception:
+        outbox = None
+    if outbox is not None:
+        # The env webhook is read at delivery time rather than stored in the queue
+        outbox.put_slack(text, webhook_url)
+        outbox.start()
+        return
+
+    try:
+        post_slack(text, url)
     except Exception as e:
         sys.stderr.write(f"⚠️ Slack notification failed: {e}\n")
 
@@ -13,7 +13,7 @@ import sys
 import json
 import time
 import datetime
-from core.browser import create_browser
+from core.browser import acquire_page, release_page
 from core.stealth import wait_for_cloudflare, clean_text
 from core.retry import retry
 from core.exceptions import ScraperBlocked, SiteDown
@@ -35,12 +35,12 @@ def scrape(config: dict) -> list[dict]:
     sys.stderr.write(f"🐊 {config['name']} County Scraper\n")
     sys.stderr.write(f"📅 Days back: {days_back}  |  📄 Max pages: {max_pages}\n")
 
-    page = create_browser(config)
+    page = acquire_page(config)  # tab in a pooled, warm Chromium
     records = []
 
     try:
         # TODO: 1. Navigate to the listing/search page
-        #   page.get(config["search_url"])
+        #   navigate(page, config["search_url"], "{county_key}")  # core.browser.navigate: throttled per host
         #   time.sleep(2)
 
         # TODO: 2. Handle Cloudflare if needed
@@ -54,7 +54,7 @@ def scrape(config: dict) -> list[dict]:
 
         # TODO: 4. Visit each detail page and extract data
         #   for booking_url in booking_links:
-        #       page.get(booking_url)
+        #       navigate(page, booking_url, "{county_key}")
         #       record = {
         #           "Booking_Number": "...",
         #           "Full_Name": "...",
@@ -75,10 +75,7 @@ def scrape(config: dict) -> list[dict]:
         sys.stderr.write(f"❌ Fatal error: {e}\n")
 
     finally:
-        try:
-            page.quit()
-        except Exception:
-            pass
+        release_page(page)
 
     sys.stderr.write(f"📊 Total records: {len(records)}\n")
     return records
@@ -9,19 +9,23 @@ Approach: ASP.NET WebForms with "View All" button.
 POST the form with ButtonView=View All + __VIEWSTATE token → parse GridView table.
 """
 
+import os
 import sys
 import json
 import time
 import re
 from datetime import datetime, timedelta
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
 try:
-    import requests
     from bs4 import BeautifulSoup
 except ImportError:
     sys.stderr.write("❌ Missing deps: pip install requests beautifulsoup4\n")
     sys.exit(1)
 
+from core.http import get_session
+
 
 BASE_URL = "https://asosite.alachuasheriff.org/ASOInmateLookup.aspx"
 HEADERS = {
@@ -46,8 +50,7 @@ def scrape_alachua(days_back=7, max_pages=20):
     sys.stderr.write(f"🐊 Alachua County Scraper\n")
     sys.stderr.write(f"📅 Days back: {days_back}\n")
 
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    session = get_session("alachua", HEADERS)
 
     # Step 1: GET the search page to harvest ASP.NET tokens
     try:
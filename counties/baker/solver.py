@@ -20,6 +20,8 @@ except ImportError:
     sys.stderr.write("[BAKER] Missing requests/bs4\n")
     sys.exit(1)
 
+from core.http import get_session
+
 BASE_URL = "https://www.bakersherifffl.org"
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -30,8 +32,7 @@ HEADERS = {
 def scrape_baker(days_back=7, max_pages=10):
     """Scrape Baker County inmate data."""
     sys.stderr.write(f"[BAKER] Starting → {BASE_URL}\n")
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    session = get_session("baker", HEADERS)
 
     try:
         resp = session.get(BASE_URL, timeout=30, allow_redirects=True)
@@ -21,12 +21,13 @@ BASE_URL = "http://smartweb.bradfordsheriff.org"
 JAIL_PATH = "/smartwebclient/Jail.aspx"
 
 
-def scrape_bradford(days_back=7, max_pages=10):
+def scrape_bradford(days_back=7, max_pages=10, watermark=None):
     """Scrape Bradford County jail roster via SmartCOP."""
     return scrape_smartcop(
         base_url=BASE_URL,
         county="Bradford",
         jail_path=JAIL_PATH,
+        watermark=watermark,
     )
 
 
@@ -9,19 +9,24 @@ Approach: POST form with date range fields → results table → detail pages.
 The search form at /Results accepts FromDate/ToDate, returns HTML table of bookings.
 """
 
+import os
 import sys
 import json
 import time
 import re
 from datetime import datetime, timedelta
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
 try:
-    import requests
     from bs4 import BeautifulSoup
 except ImportError:
     sys.stderr.write("❌ Missing deps: pip install requests beautifulsoup4\n")
     sys.exit(1)
 
+from core.http import get_session
+from core.dedup import KnownBookings
+
 
 BASE_URL = "https://inmatesearch.brevardsheriff.org"
 SEARCH_URL = f"{BASE_URL}/Results"
@@ -47,8 +52,7 @@ def scrape_brevard(days_back=7, max_pages=20):
     sys.stderr.write(f"🐊 Brevard County Scraper\n")
     sys.stderr.write(f"📅 Days back: {days_back}  |  📄 Max pages: {max_pages}\n")
 
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    session = get_session("brevard", HEADERS)
 
     # Load search page first to get any CSRF tokens
     try:
@@ -75,6 +79,7 @@ def scrape_brevard(days_back=7, max_pages=20):
 
     records = []
     page_num = 1
+    known = KnownBookings("Brevard", "brevard")
 
     while page_num <= max_pages:
         try:
@@ -108,16 +113,20 @@ def scrape_brevard(days_back=7, max_pages=20):
                         detail_record = _fetch_detail(session, href)
                         if detail_record:
                             records.append(detail_record)
-                            time.sleep(0.5)  # Be polite
                 else:
                     if page_num > 1:
                         sys.stderr.write(f"🏁 No more results on page {page_num}\n")
                     break
             else:
                 sys.stderr.write(f"📋 Found {len(rows)} rows on page {page_num}\n")
-                for row in rows:
-                    record = _parse_row(row, session)
-                    if record:
+                parsed = [record for record in map(_parse_row, rows) if record]
+                # Detail pages only for bookings not already stored (or due a recheck)
+                for record in known.filter(parsed, key=lambda r: r.get("Booking_Number")):
+                    if record.get("Detail_URL"):
+                        detail = _fetch_detail(session, record["Detail_URL"])
+                        if detail:
+                            record.update(detail)
+                    if record.get("Full_Name") or record.get("Booking_Number"):
                         records.append(record)
 
             # Check for next page
@@ -137,8 +146,8 @@ def scrape_brevard(days_back=7, max_pages=20):
     return records
 
 
-def _parse_row(row, session):
-    """Parse a table row or card element into a record dict."""
+def _parse_row(row):
+    """Parse a table row or card element into a record dict (detail page not fetched)."""
     try:
         cells = row.find_all("td")
         if len(cells) < 2:
@@ -158,6 +167,8 @@ def _parse_row(row, session):
             "State": "FL",
             "Facility": "Brevard County Jail",
         }
+        if detail_url:
+            record["Detail_URL"] = detail_url
 
         # Extract text from cells — adapt based on actual column layout
         texts = [c.get_text(strip=True) for c in cells]
@@ -171,13 +182,7 @@ def _parse_row(row, session):
         if len(texts) >= 4:
             record["Charges"] = texts[3]
 
-        # If we have a detail URL, fetch more info
-        if detail_url:
-            detail = _fetch_detail(session, detail_url)
-            if detail:
-                record.update(detail)
-
-        if record.get("Full_Name") or record.get("Booking_Number"):
+        if record.get("Full_Name") or record.get("Booking_Number") or detail_url:
             return record
     except Exception as e:
         sys.stderr.write(f"   ⚠️  Row parse error: {e}\n")
@@ -33,11 +33,9 @@ import re
 import json
 import os
 import datetime
-import time
-import urllib.request
-import urllib.error
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from core.http import get_session
 
 BASE_URL = "https://apps.sheriff.org"
 DETAIL_URL = f"{BASE_URL}/ArrestSearch/InmateDetail"
@@ -63,13 +61,20 @@ HEADERS = {
 STATE_FILE = os.path.join(os.path.dirname(__file__), '.last_known_ids')
 
 
+_session = None
+
+
 def _http_get(url):
-    """Fetch a URL using urllib (no external deps)."""
-    req = urllib.request.Request(url, headers=HEADERS)
+    """Fetch a URL over one keep-alive session (pooled and rate limited by core.http)."""
+    global _session
+    if _session is None:
+        _session = get_session("broward", HEADERS)
     try:
-        with urllib.request.urlopen(req, timeout=12) as resp:
-            return resp.read().decode('utf-8', errors='ignore')
-    except (urllib.error.HTTPError, urllib.error.URLError, Exception):
+        resp = _session.get(url, timeout=12)
+        if resp.status_code >= 400:
+            return None
+        return resp.content.decode('utf-8', errors='ignore')
+    except Exception:
         return None
 
 
@@ -113,7 +118,6 @@ def scrape_broward(days_back=2, max_pages=10):
                 consecutive_misses += 1
                 if jms_id > frontier and consecutive_misses > 8:
                     break
-            time.sleep(0.15)
 
         sys.stderr.write(f"[BROWARD]   Found {len(records)} records for {info['name']}\n")
         all_records.extend(records)
@@ -159,7 +163,6 @@ def _find_frontier(start_id):
             if step <= 1:
                 break
             step = step // 2
-        time.sleep(0.1)
 
     return current
 
@@ -11,7 +11,12 @@ import json
 import time
 import re
 import datetime
-from DrissionPage import ChromiumPage, ChromiumOptions
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from core.browser import acquire_page, release_page, fetch_details, navigate
+from core.dedup import KnownBookings
 
 
 def clean_text(text):
@@ -37,20 +42,8 @@ def clean_charge_text(raw_charge):
 
 
 def setup_browser():
-    """Configure and launch DrissionPage browser."""
-    co = ChromiumOptions()
-    co.auto_port()
-    co.headless(False)
-    co.set_argument('--no-sandbox')
-    co.set_argument('--disable-dev-shm-usage')
-    co.set_argument('--disable-blink-features=AutomationControlled')
-    co.set_argument('--window-size=1920,1080')
-    co.set_user_agent(
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-        'AppleWebKit/537.36 (KHTML, like Gecko) '
-        'Chrome/120.0.0.0 Safari/537.36'
-    )
-    return ChromiumPage(addr_or_opts=co)
+    """Lease a tab from the shared Chromium pool (headed — Cloudflare blocks headless)."""
+    return acquire_page({"headless": False})
 
 
 def wait_for_cloudflare(page, max_wait=20):
@@ -79,7 +72,7 @@ def collect_booking_links(page, max_pages=10):
         url = f"{base_url}/bookings" if current_page == 1 else f"{base_url}/bookings?page={current_page}"
         sys.stderr.write(f"\n📄 Loading page {current_page}: {url}\n")
 
-        page.get(url)
+        navigate(page, url, "charlotte")
         time.sleep(2)
 
         if not wait_for_cloudflare(page):
@@ -142,7 +135,7 @@ def extract_detail(page, booking_id, detail_url):
     }
 
     try:
-        page.get(detail_url)
+        page.get(detail_url)  # fetch_details() already throttled this URL
         time.sleep(2)
 
         if not wait_for_cloudflare(page):
@@ -297,25 +290,39 @@ def extract_detail(page, booking_id, detail_url):
 
 def scrape_charlotte(days_back=21, max_pages=10):
     """Main scraper: collect links → visit details → filter by date → output JSON."""
+    return list(stream_charlotte(days_back, max_pages))
+
+
+def stream_charlotte(days_back=21, max_pages=10):
+    """Like scrape_charlotte(), but yields each record as its detail page is parsed."""
     sys.stderr.write(f"🐊 Charlotte County Scraper (DrissionPage)\n")
     sys.stderr.write(f"📅 Days back: {days_back}  |  📄 Max pages: {max_pages}\n")
 
     cutoff_date = datetime.datetime.now() - datetime.timedelta(days=days_back)
     page = setup_browser()
 
+    details = None
     try:
         booking_links = collect_booking_links(page, max_pages)
 
         if not booking_links:
             sys.stderr.write("⚠️ No booking links found.\n")
-            return []
+            return
+
+        # Skip detail pages of bookings already stored (unless due a recheck)
+        booking_links = KnownBookings("Charlotte", "charlotte").filter(booking_links, key=lambda link: link[0])
+        if not booking_links:
+            sys.stderr.write("✅ Every listed booking is already known.\n")
+            return
 
-        arrests = []
-        for idx, (booking_id, detail_url) in enumerate(booking_links, 1):
+        count = 0
+        details = fetch_details(page, booking_links, extract_detail, county="charlotte")
+        for idx, ((booking_id, detail_url), record, error) in enumerate(details, 1):
             sys.stderr.write(f"\n🔍 [{idx}/{len(booking_links)}] {booking_id}\n")
 
             try:
-                record = extract_detail(page, booking_id, detail_url)
+                if error:
+                    raise error
 
                 # Date cutoff
                 if record.get('Booking_Date'):
@@ -325,7 +332,7 @@ def scrape_charlotte(days_back=21, max_pages=10):
                                 book_dt = datetime.datetime.strptime(record['Booking_Date'].split()[0], fmt)
                                 if book_dt < cutoff_date:
                                     sys.stderr.write(f"   ⏸️ Past cutoff ({record['Booking_Date']}), stopping.\n")
-                                    return arrests
+                                    return
                                 break
                             except ValueError:
                                 continue
@@ -333,7 +340,8 @@ def scrape_charlotte(days_back=21, max_pages=10):
                         pass
 
                 if record.get('Full_Name'):
-                    arrests.append(record)
+                    count += 1
+                    yield record
                     sys.stderr.write(f"   ✅ {record['Full_Name']}\n")
                 else:
                     sys.stderr.write(f"   ⚠️ No name extracted, skipping\n")
@@ -342,20 +350,15 @@ def scrape_charlotte(days_back=21, max_pages=10):
                 sys.stderr.write(f"   ⚠️ Error: {e}\n")
                 continue
 
-            time.sleep(1)
-
-        sys.stderr.write(f"\n📊 Total records: {len(arrests)}\n")
-        return arrests
+        sys.stderr.write(f"\n📊 Total records: {count}\n")
 
     except Exception as e:
         sys.stderr.write(f"❌ Fatal error: {e}\n")
-        return []
 
     finally:
-        try:
-            page.quit()
-        except:
-            pass
+        if details is not None:
+            details.close()  # Stop the prefetch workers and return their tabs before ours
+        release_page(page)
 
 
 def main():
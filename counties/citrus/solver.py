@@ -34,6 +34,8 @@ except ImportError:
     sys.stderr.write("[CITRUS] Missing requests/bs4\n")
     sys.exit(1)
 
+from core.http import conditional_get, get_session
+
 try:
     import pdfplumber
 except ImportError:
@@ -59,8 +61,7 @@ def scrape_citrus(days_back=7, max_pages=30):
         sys.stderr.write("[CITRUS] SKIP — pdfplumber not installed\n")
         return []
 
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    session = get_session("citrus", HEADERS)
 
     # Step 1: Get the page and find the PDF URL
     pdf_url = _find_pdf_url(session)
@@ -72,7 +73,7 @@ def scrape_citrus(days_back=7, max_pages=30):
 
     # Step 2: Download the PDF
     try:
-        resp = session.get(pdf_url, timeout=60)
+        resp = conditional_get(session, pdf_url, timeout=60)
         resp.raise_for_status()
     except requests.RequestException as e:
         sys.stderr.write(f"[CITRUS] FAIL downloading PDF: {e}\n")
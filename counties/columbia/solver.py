@@ -21,12 +21,13 @@ BASE_URL = "http://50.204.15.10"
 JAIL_PATH = "/smartwebclient/Jail.aspx"
 
 
-def scrape_columbia(days_back=7, max_pages=10):
+def scrape_columbia(days_back=7, max_pages=10, watermark=None):
     """Scrape Columbia County jail roster via SmartCOP."""
     return scrape_smartcop(
         base_url=BASE_URL,
         county="Columbia",
         jail_path=JAIL_PATH,
+        watermark=watermark,
     )
 
 
@@ -24,6 +24,9 @@ from bs4 import BeautifulSoup
 
 from DrissionPage import ChromiumPage, ChromiumOptions
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from core.browser import navigate
+
 
 INMATES_URL = "https://jail.desotosheriff.org/DCN/inmates"
 BASE_URL = "https://jail.desotosheriff.org"
@@ -95,7 +98,7 @@ def collect_links_from_current_page(page):
 
 def parse_all_roster_links(page):
     """Extract all inmate detail links across all pages."""
-    page.get(INMATES_URL)
+    navigate(page, INMATES_URL, "desoto")
     time.sleep(3)
     
     # Sort by Admit Date descending
@@ -159,7 +162,7 @@ def parse_all_roster_links(page):
 
 def extract_detail(page, url):
     """Extract arrest data from an inmate detail page."""
-    page.get(url)
+    navigate(page, url, "desoto")
     time.sleep(1.5)
     
     html = page.html
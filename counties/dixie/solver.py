@@ -21,12 +21,13 @@ BASE_URL = "http://smartcop.dixiecountysheriff.com"
 JAIL_PATH = "/smartwebclient/Jail.aspx"
 
 
-def scrape_dixie(days_back=7, max_pages=10):
+def scrape_dixie(days_back=7, max_pages=10, watermark=None):
     """Scrape Dixie County jail roster via SmartCOP."""
     return scrape_smartcop(
         base_url=BASE_URL,
         county="Dixie",
         jail_path=JAIL_PATH,
+        watermark=watermark,
     )
 
 
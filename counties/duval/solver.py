@@ -15,12 +15,14 @@ If API intercept fails, fall back to DOM scraping.
 import sys
 import json
 import os
-import time
 import re
 from datetime import datetime, timedelta
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
 try:
-    from DrissionPage import ChromiumPage, ChromiumOptions
+    from core.browser import acquire_page, release_page, navigate
+    from core.stealth import wait_for_ready, page_time
     HAS_DRISSION = True
 except ImportError:
     HAS_DRISSION = False
@@ -31,30 +33,8 @@ BASE_URL = "https://inmatesearch.jaxsheriff.org"
 
 
 def setup_browser(headed=False):
-    """Configure and return a DrissionPage browser instance."""
-    co = ChromiumOptions()
-    co.auto_port()
-
-    chrome_path = os.getenv("CHROME_PATH")
-    if chrome_path:
-        co.set_browser_path(chrome_path)
-
-    if not headed:
-        co.headless(True)
-        co.set_argument('--headless=new')
-
-    co.set_argument('--no-sandbox')
-    co.set_argument('--disable-dev-shm-usage')
-    co.set_argument('--disable-gpu')
-    co.set_argument('--disable-blink-features=AutomationControlled')
-    co.set_argument('--window-size=1920,1080')
-    co.set_user_agent(
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-        'AppleWebKit/537.36 (KHTML, like Gecko) '
-        'Chrome/120.0.0.0 Safari/537.36'
-    )
-
-    return ChromiumPage(addr_or_opts=co)
+    """Lease a tab from the shared Chromium pool (see core.browser)."""
+    return acquire_page({"headless": not headed})
 
 
 def scrape_duval(days_back=7, max_pages=20):
@@ -84,8 +64,10 @@ def scrape_duval(days_back=7, max_pages=20):
 
         # Start listening for API requests before navigating
         page.listen.start('api')
-        page.get(BASE_URL)
-        time.sleep(5)  # Wait for Angular to bootstrap
+        navigate(page, BASE_URL, "duval")
+        # Angular has bootstrapped once its first API call lands or the app renders controls
+        wait_for_ready(page, ["tag:button", "tag:input"], xhr="api", timeout=15,
+                       county="duval", step="bootstrap")
 
         sys.stderr.write(f"📡 Page title: {page.title}\n")
 
@@ -95,14 +77,18 @@ def scrape_duval(days_back=7, max_pages=20):
             # Try clicking a "Search" or "View All" button
             search_btn = page.ele('tag:button@@text():Search', timeout=5)
             if search_btn:
+                t0 = page_time(page)
                 search_btn.click()
-                time.sleep(3)
+                wait_for_ready(page, xhr="api", since=t0, network_idle=True,
+                               county="duval", step="search")
             else:
                 # Try submit button
                 submit_btn = page.ele('tag:button@@type=submit', timeout=3)
                 if submit_btn:
+                    t0 = page_time(page)
                     submit_btn.click()
-                    time.sleep(3)
+                    wait_for_ready(page, xhr="api", since=t0, network_idle=True,
+                                   county="duval", step="search")
         except Exception as e:
             sys.stderr.write(f"   ⚠️  No search button found, trying direct navigation: {e}\n")
 
@@ -145,10 +131,7 @@ def scrape_duval(days_back=7, max_pages=20):
     except Exception as e:
         sys.stderr.write(f"❌ Fatal error: {e}\n")
     finally:
-        try:
-            page.quit()
-        except Exception:
-            pass
+        release_page(page)
 
     sys.stderr.write(f"📊 Total records: {len(records)}\n")
     return records
@@ -280,8 +263,10 @@ def _scrape_dom(page, max_pages):
             next_btn = page.ele('tag:button@@text():Next', timeout=3) or \
                        page.ele('css:.mat-paginator-navigation-next', timeout=2)
             if next_btn and next_btn.attr('disabled') is None:
+                t0 = page_time(page)
                 next_btn.click()
-                time.sleep(2)
+                wait_for_ready(page, xhr="api", since=t0, network_idle=True,
+                               county="duval", step="next_page")
             else:
                 break
         except Exception:
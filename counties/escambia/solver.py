@@ -10,19 +10,24 @@ last name / first name and returns HTML table results. We search with empty
 fields to get all current inmates, then parse the results table.
 """
 
+import os
 import sys
 import json
 import time
 import re
 from datetime import datetime, timedelta
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
 try:
-    import requests
     from bs4 import BeautifulSoup
 except ImportError:
     sys.stderr.write("❌ Missing deps: pip install requests beautifulsoup4\n")
     sys.exit(1)
 
+from core.exceptions import SourceUnchanged
+from core.http import check_unchanged, get_session
+
 
 SEARCH_URL = "https://myescambia.com/our-services/corrections/inmate-lookup"
 HEADERS = {
@@ -46,8 +51,7 @@ def scrape_escambia(days_back=7, max_pages=20):
     sys.stderr.write(f"🐊 Escambia County Scraper\n")
     sys.stderr.write(f"📅 Days back: {days_back}  |  📄 Max pages: {max_pages}\n")
 
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    session = get_session("escambia", HEADERS)
 
     records = []
     page_num = 1
@@ -89,8 +93,11 @@ def scrape_escambia(days_back=7, max_pages=20):
             sys.stderr.write(f"📡 Submitting search form to {action}\n")
             resp = session.post(action, data=form_data, timeout=60)
             resp.raise_for_status()
+            check_unchanged(resp, "escambia", key=f"POST {action} (all inmates)")
             soup = BeautifulSoup(resp.text, "html.parser")
 
+    except SourceUnchanged:
+        raise
     except Exception as e:
         sys.stderr.write(f"❌ Error loading search page: {e}\n")
         return []
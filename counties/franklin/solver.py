@@ -8,7 +8,7 @@ Source: https://www.franklinsheriff.com
 Platform: html-list
 """
 
-import sys, re, json, os, datetime, time, string
+import sys, re, json, os, datetime, string
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
@@ -19,6 +19,9 @@ except ImportError:
     sys.stderr.write("[FRANKLIN] Missing requests/bs4\n")
     sys.exit(1)
 
+from core.fetch import FetchRequest, fetch_all
+from core.http import get_session
+
 BASE_URL = "https://www.franklinsheriff.com"
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -29,8 +32,7 @@ HEADERS = {
 def scrape_franklin(days_back=7, max_pages=10):
     """Scrape Franklin County inmate data."""
     sys.stderr.write(f"[FRANKLIN] Starting → {BASE_URL}\n")
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    session = get_session("franklin", HEADERS)
 
     try:
         resp = session.get(BASE_URL, timeout=30, allow_redirects=True)
@@ -93,16 +95,14 @@ def _az(session, form):
     for inp in form.find_all('input', type='hidden'):
         n, v = inp.get('name',''), inp.get('value','')
         if n: hf[n] = v
+    posts = [FetchRequest(action, method='POST', data={**hf, 'LastName': letter, 'FirstName': ''}, timeout=30)
+             for letter in string.ascii_uppercase]
     all_r = {}
-    for letter in string.ascii_uppercase:
-        try:
-            r = session.post(action, data={**hf, 'LastName': letter, 'FirstName': ''}, timeout=30)
-            if r.status_code == 200:
-                for rec in _parse(BeautifulSoup(r.text, 'html.parser')):
-                    k = rec.get('Booking_Number') or rec.get('Full_Name','')
-                    if k: all_r[k] = rec
-        except Exception: pass
-        time.sleep(0.3)
+    for r in fetch_all(posts, session=session):
+        if r.status == 200:
+            for rec in _parse(BeautifulSoup(r.text, 'html.parser')):
+                k = rec.get('Booking_Number') or rec.get('Full_Name','')
+                if k: all_r[k] = rec
     return list(all_r.values())
 
 
@@ -21,12 +21,13 @@ BASE_URL = "http://smartcop.gadsdensheriff.com"
 JAIL_PATH = "/smartwebclient/Jail.aspx"
 
 
-def scrape_gadsden(days_back=7, max_pages=10):
+def scrape_gadsden(days_back=7, max_pages=10, watermark=None):
     """Scrape Gadsden County jail roster via SmartCOP."""
     return scrape_smartcop(
         base_url=BASE_URL,
         county="Gadsden",
         jail_path=JAIL_PATH,
+        watermark=watermark,
     )
 
 
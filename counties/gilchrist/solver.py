@@ -21,12 +21,13 @@ BASE_URL = "http://smartweb.gcso.us"
 JAIL_PATH = "/smartwebclient/Jail.aspx"
 
 
-def scrape_gilchrist(days_back=7, max_pages=10):
+def scrape_gilchrist(days_back=7, max_pages=10, watermark=None):
     """Scrape Gilchrist County jail roster via SmartCOP."""
     return scrape_smartcop(
         base_url=BASE_URL,
         county="Gilchrist",
         jail_path=JAIL_PATH,
+        watermark=watermark,
     )
 
 
@@ -21,12 +21,13 @@ BASE_URL = "http://smartweb.gladessheriff.org"
 JAIL_PATH = "/smartwebclient/Jail.aspx"
 
 
-def scrape_glades(days_back=7, max_pages=10):
+def scrape_glades(days_back=7, max_pages=10, watermark=None):
     """Scrape Glades County jail roster via SmartCOP."""
     return scrape_smartcop(
         base_url=BASE_URL,
         county="Glades",
         jail_path=JAIL_PATH,
+        watermark=watermark,
     )
 
 
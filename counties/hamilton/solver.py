@@ -21,12 +21,13 @@ BASE_URL = "http://inmate.hamiltonsheriff.com"
 JAIL_PATH = "/smartwebclient/Jail.aspx"
 
 
-def scrape_hamilton(days_back=7, max_pages=10):
+def scrape_hamilton(days_back=7, max_pages=10, watermark=None):
     """Scrape Hamilton County jail roster via SmartCOP."""
     return scrape_smartcop(
         base_url=BASE_URL,
         county="Hamilton",
         jail_path=JAIL_PATH,
+        watermark=watermark,
     )
 
 
@@ -10,11 +10,14 @@ DrissionPage required to handle Cloudflare challenge and render React content.
 """
 
 import sys
+import os
 import json
 import time
 import re
 from datetime import datetime
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
 if hasattr(sys.stdout, 'reconfigure'):
     sys.stdout.reconfigure(encoding='utf-8')
 if hasattr(sys.stderr, 'reconfigure'):
@@ -22,6 +25,11 @@ if hasattr(sys.stderr, 'reconfigure'):
 
 BASE_URL = "https://www.highlandssheriff.org"
 SEARCH_URL = f"{BASE_URL}/inmateSearch"
+# Linux Chrome/121 UA this site was tuned against
+USER_AGENT = (
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
+)
 
 
 def scrape_highlands(days_back=7, max_pages=10):
@@ -38,7 +46,7 @@ def scrape_highlands(days_back=7, max_pages=10):
         List of record dicts
     """
     try:
-        from DrissionPage import ChromiumPage, ChromiumOptions
+        from core.browser import acquire_page, release_page, navigate
     except ImportError:
         sys.stderr.write("❌ DrissionPage not installed — pip install DrissionPage\n")
         return []
@@ -46,18 +54,8 @@ def scrape_highlands(days_back=7, max_pages=10):
     sys.stderr.write(f"🐊 Highlands County Scraper\n")
     sys.stderr.write(f"📅 Days back: {days_back}  |  📄 Max pages: {max_pages}\n")
 
-    options = ChromiumOptions()
-    options.headless()
-    options.set_argument('--no-sandbox')
-    options.set_argument('--disable-dev-shm-usage')
-    options.set_argument('--disable-blink-features=AutomationControlled')
-    options.set_argument('--window-size=1920,1080')
-    options.set_user_agent(
-        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
-    )
-
     try:
-        page = ChromiumPage(options)
+        page = acquire_page({"headless": True, "browser": {"user_agent": USER_AGENT}})
     except Exception as e:
         sys.stderr.write(f"❌ Could not start Chromium browser: {e}\n")
         return []
@@ -69,7 +67,7 @@ def scrape_highlands(days_back=7, max_pages=10):
         page.listen.start('json')
 
         sys.stderr.write(f"📡 Loading: {SEARCH_URL}\n")
-        page.get(SEARCH_URL)
+        navigate(page, SEARCH_URL, "highlands")
 
         # Wait for Cloudflare
         for attempt in range(15):
@@ -150,9 +148,9 @@ def scrape_highlands(days_back=7, max_pages=10):
     finally:
         try:
             page.listen.stop()
-            page.quit()
         except Exception:
             pass
+        release_page(page)
 
     sys.stderr.write(f"📊 Total records: {len(records)}\n")
     return records
@@ -22,6 +22,10 @@ import os
 import datetime
 from bs4 import BeautifulSoup
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from core.browser import navigate
+from core.stealth import wait_for_ready
+
 # DrissionPage import
 from DrissionPage import ChromiumPage, ChromiumOptions
 
@@ -43,8 +47,8 @@ def login_hcso(page, email, password):
     """Log into the HCSO Arrest Inquiry portal (handles reCAPTCHA v2 checkbox)."""
     login_url = "https://webapps.hcso.tampa.fl.us/arrestinquiry/Account/Login"
     sys.stderr.write(f"🔑 Navigating to login page...\n")
-    page.get(login_url)
-    time.sleep(3)
+    navigate(page, login_url, "hillsborough")
+    wait_for_ready(page, "#Email", county="hillsborough", step="login_page")
 
     # Fill email
     email_field = page.ele('#Email', timeout=10)
@@ -120,7 +124,8 @@ def login_hcso(page, email, password):
         # Try form submit
         pwd_field.input('\n')
     
-    time.sleep(5)
+    wait_for_ready(page, ["text:Log out", "text:Welcome", "text:Invalid"], network_idle=True,
+                   navigation=True, timeout=15, county="hillsborough", step="login")
     
     # Check if login succeeded
     page_html = page.html
@@ -145,8 +150,8 @@ def perform_search(page, days_back=3):
     """Perform the arrest search with date range."""
     search_url = "https://webapps.hcso.tampa.fl.us/arrestinquiry/Home/Search"
     sys.stderr.write(f"🔍 Navigating to search page...\n")
-    page.get(search_url)
-    time.sleep(3)
+    navigate(page, search_url, "hillsborough")
+    wait_for_ready(page, ["#BeginDate", "@@name=BeginDate"], county="hillsborough", step="search_page")
 
     # Calculate date range
     end_date = datetime.datetime.now()
@@ -178,7 +183,9 @@ def perform_search(page, days_back=3):
         if end_field:
             end_field.input('\n')
     
-    time.sleep(5)
+    wait_for_ready(page, ["text:Search Results", "text:Booking Name", "text:No records found",
+                          "css:table.table-striped"], navigation=True, timeout=15,
+                   county="hillsborough", step="results")
     
     # Check for results
     page_html = page.html
@@ -405,7 +412,8 @@ def scrape_hillsborough(days_back=3):
                     sys.stderr.write("   📄 Reached last page\n")
                     break
                 next_btn.click()
-                time.sleep(3)
+                wait_for_ready(page, ["css:table.table-striped", "css:span.paginationLeft"],
+                               navigation=True, county="hillsborough", step="next_page")
                 current_page += 1
             else:
                 sys.stderr.write("   📄 No more pages\n")
@@ -13,12 +13,15 @@ Approach:
   individual detail URLs that return empty shells.
 """
 
+import os
 import sys
 import json
 import time
 import re
 from datetime import datetime
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
 try:
     import requests
     from bs4 import BeautifulSoup
@@ -26,6 +29,8 @@ except ImportError:
     sys.stderr.write("❌ Missing deps: pip install requests beautifulsoup4\n")
     sys.exit(1)
 
+from core.http import get_session
+
 
 BASE_URL = "https://www.ircsheriff.org"
 SEARCH_URL = f"{BASE_URL}/inmate-search"
@@ -55,8 +60,7 @@ def scrape_indian_river(days_back=3, max_pages=10):
     sys.stderr.write(f"🐊 Indian River County Scraper\n")
     sys.stderr.write(f"📅 Fetching recent bookings\n")
 
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    session = get_session("indian_river", HEADERS)
 
     records = []
     seen_ids = set()
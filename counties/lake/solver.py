@@ -10,11 +10,14 @@ Use DrissionPage to interact with the search form and extract results.
 """
 
 import sys
+import os
 import json
 import time
 import re
 from datetime import datetime
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
 # Force UTF-8
 if hasattr(sys.stdout, 'reconfigure'):
     sys.stdout.reconfigure(encoding='utf-8')
@@ -24,6 +27,11 @@ if hasattr(sys.stderr, 'reconfigure'):
 
 BASE_URL = "https://www.lcso.org"
 SEARCH_URL = f"{BASE_URL}/inmates/"
+# Linux Chrome/121 UA this site was tuned against
+USER_AGENT = (
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
+)
 
 
 def scrape_lake(days_back=7, max_pages=10):
@@ -37,28 +45,17 @@ def scrape_lake(days_back=7, max_pages=10):
     Returns:
         List of record dicts
     """
-    from DrissionPage import ChromiumPage, ChromiumOptions
+    from core.browser import acquire_page, release_page, navigate
 
     sys.stderr.write(f"🐊 Lake County Scraper\n")
     sys.stderr.write(f"📅 Days back: {days_back}  |  📄 Max pages: {max_pages}\n")
 
-    # Configure browser
-    options = ChromiumOptions()
-    options.headless()
-    options.set_argument('--no-sandbox')
-    options.set_argument('--disable-dev-shm-usage')
-    options.set_argument('--disable-blink-features=AutomationControlled')
-    options.set_argument('--window-size=1920,1080')
-    options.set_user_agent(
-        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
-    )
-
-    page = ChromiumPage(options)
+    page = acquire_page({"headless": True, "browser": {"user_agent": USER_AGENT}})
     records = []
 
     try:
         sys.stderr.write(f"📡 Loading: {SEARCH_URL}\n")
-        page.get(SEARCH_URL)
+        navigate(page, SEARCH_URL, "lake")
         time.sleep(5)  # Wait for JS rendering
 
         # Handle CloudFlare if present
@@ -132,10 +129,7 @@ def scrape_lake(days_back=7, max_pages=10):
     except Exception as e:
         sys.stderr.write(f"❌ Fatal error: {e}\n")
     finally:
-        try:
-            page.quit()
-        except Exception:
-            pass
+        release_page(page)
 
     sys.stderr.write(f"📊 Total records: {len(records)}\n")
     return records
@@ -31,6 +31,8 @@ except ImportError:
     sys.stderr.write("[LEE] Missing requests library\n")
     sys.exit(1)
 
+from core.http import get_session
+
 BASE_URL = "https://www.sheriffleefl.org"
 BOOKINGS_URL = f"{BASE_URL}/public-api/bookings"
 CHARGES_URL = f"{BASE_URL}/public-api/bookings/{{booking_number}}/charges"
@@ -259,23 +261,44 @@ def _build_record(raw: dict, charges_info: dict) -> dict:
     return record
 
 
-def scrape_lee(days_back: int = 7, max_pages: int = 20) -> list:
+def _watermark_cutoff(watermark: dict) -> str:
+    """API-format date ('YYYY-MM-DD') one day before the last run's newest booking, or ''."""
+    if not watermark or not watermark.get('booking_date'):
+        return ''
+    last = datetime.datetime.strptime(watermark['booking_date'], '%Y-%m-%d')
+    return (last - datetime.timedelta(days=1)).strftime('%Y-%m-%d')
+
+
+def scrape_lee(days_back: int = 7, max_pages: int = 20, watermark: dict = None) -> list:
+    """Scrape Lee County jail bookings via the public REST API (all pages as one list)."""
+    return [record for page in stream_lee(days_back, max_pages, watermark) for record in page]
+
+
+def stream_lee(days_back: int = 7, max_pages: int = 20, watermark: dict = None):
     """
-    Scrape Lee County jail bookings via the public REST API.
+    Scrape Lee County jail bookings via the public REST API, yielding each
+    page's records as soon as its charges are fetched (run_pipeline streams them).
 
     Args:
         days_back: Not used directly (API returns current inmates); kept for interface compatibility
         max_pages: Maximum number of pages to fetch (PAGE_SIZE=100 per page)
+        watermark: core.watermark mark from the last run. Bookings older than
+            its newest booking date (less a day of overlap) are skipped without
+            fetching charges, and paging stops at the first page made up
+            entirely of them (the API lists newest bookings first).
 
-    Returns:
-        list[dict] — arrest records matching the 34-column schema
+    Yields:
+        list[dict] per API page — arrest records matching the 34-column schema
     """
     sys.stderr.write(f"[LEE] Starting REST API scraper → {BOOKINGS_URL}\n")
 
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    session = get_session("lee", HEADERS)
+
+    cutoff = _watermark_cutoff(watermark)
+    if cutoff:
+        sys.stderr.write(f"[LEE] Incremental: bookings on/after {cutoff}\n")
 
-    all_records = []
+    total = 0
     offset = 0
     page = 0
 
@@ -300,29 +323,40 @@ def scrape_lee(days_back: int = 7, max_pages: int = 20) -> list:
 
         sys.stderr.write(f"[LEE] Got {len(bookings)} bookings on page {page + 1}\n")
 
+        stale = 0
+        page_records = []
         for booking in bookings:
             booking_number = str(booking.get('bookingNumber', '')).strip()
             if not booking_number:
                 continue
+            booked = (booking.get('bookingDate') or '')[:10]
+            if cutoff and booked and booked < cutoff:
+                stale += 1
+                continue
 
             # Fetch charges (with rate limiting)
             charges_info = _fetch_charges(session, booking_number)
-            time.sleep(0.3)  # Respectful rate limiting
 
             record = _build_record(booking, charges_info)
             if record.get('Full_Name') or record.get('Booking_Number'):
-                all_records.append(record)
+                page_records.append(record)
+
+        total += len(page_records)
+        if page_records:
+            yield page_records
 
         # Check if we got a full page (more records may exist)
         if len(bookings) < PAGE_SIZE:
             break
+        if cutoff and stale == len(bookings):
+            sys.stderr.write(f"[LEE] Page {page + 1} is all before {cutoff} — caught up\n")
+            break
 
         offset += PAGE_SIZE
         page += 1
         time.sleep(1.0)  # Pause between pages
 
-    sys.stderr.write(f"[LEE] Total extracted: {len(all_records)} records\n")
-    return all_records
+    sys.stderr.write(f"[LEE] Total extracted: {total} records\n")
 
 
 if __name__ == "__main__":
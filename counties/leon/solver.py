@@ -15,18 +15,19 @@ import re
 import json
 import os
 import datetime
-import time
 import string
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
 try:
-    import requests
     from bs4 import BeautifulSoup
 except ImportError:
     sys.stderr.write("[LEON] Missing requests/bs4\n")
     sys.exit(1)
 
+from core.fetch import FetchRequest, fetch_all
+from core.http import get_session
+
 
 BASE_URL = "https://www.leoncountyso.com"
 SEARCH_URL = f"{BASE_URL}/resources/inmate-search"
@@ -42,40 +43,33 @@ def scrape_leon(days_back=7, max_pages=10):
     """Scrape Leon County inmates by iterating A-Z last name prefix."""
     sys.stderr.write(f"[LEON] Starting scrape → {SEARCH_URL}\n")
 
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    session = get_session("leon", HEADERS)
 
     all_records = {}  # Dedup by booking number
 
-    # Try submitting with each letter of the alphabet
-    for letter in string.ascii_uppercase:
-        sys.stderr.write(f"[LEON] Searching last name: {letter}...\n")
-
-        try:
-            # POST the search form
-            payload = {
-                'FirstName': '',
-                'LastName': letter,
-                'submit': 'Search Poster',
-            }
-            resp = session.post(SEARCH_URL, data=payload, timeout=30)
-            if resp.status_code != 200:
-                continue
-
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            records = _parse_results(soup)
-
-            for rec in records:
-                key = rec.get('Booking_Number') or rec.get('Full_Name', '')
-                if key and key not in all_records:
-                    all_records[key] = rec
+    # Submit a search for each letter of the alphabet, concurrently
+    posts = [
+        FetchRequest(SEARCH_URL, method='POST', timeout=30, tag=letter,
+                     data={'FirstName': '', 'LastName': letter, 'submit': 'Search Poster'})
+        for letter in string.ascii_uppercase
+    ]
+    for result in fetch_all(posts, session=session):
+        letter = result.request.tag
+        if result.error is not None:
+            sys.stderr.write(f"[LEON] Error on letter {letter}: {result.error}\n")
+            continue
+        if result.status != 200:
+            continue
 
-            sys.stderr.write(f"[LEON] Letter {letter}: {len(records)} results\n")
+        soup = BeautifulSoup(result.text, 'html.parser')
+        records = _parse_results(soup)
 
-        except Exception as e:
-            sys.stderr.write(f"[LEON] Error on letter {letter}: {e}\n")
+        for rec in records:
+            key = rec.get('Booking_Number') or rec.get('Full_Name', '')
+            if key and key not in all_records:
+                all_records[key] = rec
 
-        time.sleep(0.5)  # Rate limit
+        sys.stderr.write(f"[LEON] Letter {letter}: {len(records)} results\n")
 
     records = list(all_records.values())
     sys.stderr.write(f"[LEON] Total extracted: {len(records)} records\n")
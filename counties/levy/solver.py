@@ -21,12 +21,13 @@ BASE_URL = "http://smartweb.levyso.com"
 JAIL_PATH = "/smartwebclient/Jail.aspx"
 
 
-def scrape_levy(days_back=7, max_pages=10):
+def scrape_levy(days_back=7, max_pages=10, watermark=None):
     """Scrape Levy County jail roster via SmartCOP."""
     return scrape_smartcop(
         base_url=BASE_URL,
         county="Levy",
         jail_path=JAIL_PATH,
+        watermark=watermark,
     )
 
 
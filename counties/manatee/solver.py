@@ -9,7 +9,12 @@ import sys
 import json
 import time
 import datetime
-from DrissionPage import ChromiumPage, ChromiumOptions
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from core.browser import acquire_page, release_page, fetch_details, navigate
+from core.dedup import KnownBookings
 
 
 def clean_text(text):
@@ -20,20 +25,8 @@ def clean_text(text):
 
 
 def setup_browser():
-    """Configure and launch DrissionPage browser."""
-    co = ChromiumOptions()
-    co.auto_port()
-    co.headless(False)
-    co.set_argument('--no-sandbox')
-    co.set_argument('--disable-dev-shm-usage')
-    co.set_argument('--disable-blink-features=AutomationControlled')
-    co.set_argument('--window-size=1920,1080')
-    co.set_user_agent(
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-        'AppleWebKit/537.36 (KHTML, like Gecko) '
-        'Chrome/120.0.0.0 Safari/537.36'
-    )
-    return ChromiumPage(addr_or_opts=co)
+    """Lease a tab from the shared Chromium pool (headed — Cloudflare blocks headless)."""
+    return acquire_page({"headless": False})
 
 
 def wait_for_cloudflare(page, max_wait=20):
@@ -62,7 +55,7 @@ def collect_booking_links(page, max_pages=10):
         url = base_url if current_page == 1 else f"{base_url}?page={current_page}"
         sys.stderr.write(f"\n📄 Loading page {current_page}: {url}\n")
 
-        page.get(url)
+        navigate(page, url, "manatee")
         time.sleep(2)
 
         if not wait_for_cloudflare(page):
@@ -125,7 +118,7 @@ def extract_detail(page, booking_id, detail_url):
     }
 
     try:
-        page.get(detail_url)
+        page.get(detail_url)  # fetch_details() already throttled this URL
         time.sleep(2)
 
         if not wait_for_cloudflare(page):
@@ -282,6 +275,7 @@ def scrape_manatee(days_back=21, max_pages=10):
     cutoff_date = datetime.datetime.now() - datetime.timedelta(days=days_back)
     page = setup_browser()
 
+    details = None
     try:
         # Phase 1: Collect links
         booking_links = collect_booking_links(page, max_pages)
@@ -290,13 +284,21 @@ def scrape_manatee(days_back=21, max_pages=10):
             sys.stderr.write("⚠️ No booking links found.\n")
             return []
 
-        # Phase 2: Visit each detail page
+        # Skip detail pages of bookings already stored (unless due a recheck)
+        booking_links = KnownBookings("Manatee", "manatee").filter(booking_links, key=lambda link: link[0])
+        if not booking_links:
+            sys.stderr.write("✅ Every listed booking is already known.\n")
+            return []
+
+        # Phase 2: Visit detail pages (several tabs, results in link order)
         arrests = []
-        for idx, (booking_id, detail_url) in enumerate(booking_links, 1):
+        details = fetch_details(page, booking_links, extract_detail, county="manatee")
+        for idx, ((booking_id, detail_url), record, error) in enumerate(details, 1):
             sys.stderr.write(f"\n🔍 [{idx}/{len(booking_links)}] {booking_id}\n")
 
             try:
-                record = extract_detail(page, booking_id, detail_url)
+                if error:
+                    raise error
 
                 # Date cutoff check
                 if record.get('Booking_Date'):
@@ -318,8 +320,6 @@ def scrape_manatee(days_back=21, max_pages=10):
                 sys.stderr.write(f"   ⚠️ Error: {e}\n")
                 continue
 
-            time.sleep(1)
-
         sys.stderr.write(f"\n📊 Total records: {len(arrests)}\n")
         return arrests
 
@@ -328,10 +328,9 @@ def scrape_manatee(days_back=21, max_pages=10):
         return []
 
     finally:
-        try:
-            page.quit()
-        except:
-            pass
+        if details is not None:
+            details.close()  # Stop the prefetch workers and return their tabs before ours
+        release_page(page)
 
 
 def main():
@@ -19,7 +19,6 @@ import re
 import json
 import os
 import datetime
-import time
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
@@ -30,6 +29,9 @@ except ImportError:
     sys.stderr.write("[MARION] Missing requests/bs4\n")
     sys.exit(1)
 
+from core.http import get_session
+from core.dedup import KnownBookings
+
 
 BASE_URL = "https://jail.marionso.com"
 
@@ -44,8 +46,7 @@ def scrape_marion(days_back=7, max_pages=10):
     """Scrape Marion County jail roster via Recent button."""
     sys.stderr.write(f"[MARION] Starting scrape → {BASE_URL}\n")
 
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    session = get_session("marion", HEADERS)
 
     # Step 1: Load the search page to get any hidden form fields
     try:
@@ -155,12 +156,12 @@ def scrape_marion(days_back=7, max_pages=10):
             records.append(record)
 
     # Step 4: Fetch detail pages for charges/bond if available
+    # (bookings already stored and not due a recheck are dropped instead)
+    records = KnownBookings('Marion', 'marion').filter(records, key=lambda r: r.get('Booking_Number'))
     for i, record in enumerate(records):
         detail_url = record.get('Detail_URL')
         if detail_url:
             _enrich_from_detail(session, record, detail_url)
-            if i > 0 and i % 5 == 0:
-                time.sleep(0.5)
 
     sys.stderr.write(f"[MARION] Total extracted: {len(records)} records\n")
     return records
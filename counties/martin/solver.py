@@ -11,17 +11,25 @@ Using the official Martin County SO inmate search instead.
 """
 
 import sys
+import os
 import json
 import time
 import re
 from datetime import datetime
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
 if hasattr(sys.stdout, 'reconfigure'):
     sys.stdout.reconfigure(encoding='utf-8')
 if hasattr(sys.stderr, 'reconfigure'):
     sys.stderr.reconfigure(encoding='utf-8')
 
 BASE_URL = "https://www.martinso.us"
+# Linux Chrome/121 UA this site was tuned against
+USER_AGENT = (
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
+)
 SEARCH_URLS = [
     "https://www.martinso.us/inmatesearch/",
     "https://www.mcsofl.org/224/Recent-Bookings",
@@ -40,22 +48,12 @@ def scrape_martin(days_back=7, max_pages=10):
     Returns:
         List of record dicts
     """
-    from DrissionPage import ChromiumPage, ChromiumOptions
+    from core.browser import acquire_page, release_page, navigate
 
     sys.stderr.write(f"🐊 Martin County Scraper\n")
     sys.stderr.write(f"📅 Days back: {days_back}  |  📄 Max pages: {max_pages}\n")
 
-    options = ChromiumOptions()
-    options.headless()
-    options.set_argument('--no-sandbox')
-    options.set_argument('--disable-dev-shm-usage')
-    options.set_argument('--disable-blink-features=AutomationControlled')
-    options.set_argument('--window-size=1920,1080')
-    options.set_user_agent(
-        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
-    )
-
-    page = ChromiumPage(options)
+    page = acquire_page({"headless": True, "browser": {"user_agent": USER_AGENT}})
     records = []
 
     try:
@@ -64,7 +62,7 @@ def scrape_martin(days_back=7, max_pages=10):
         for url in SEARCH_URLS:
             try:
                 sys.stderr.write(f"📡 Trying: {url}\n")
-                page.get(url)
+                navigate(page, url, "martin")
                 time.sleep(5)
 
                 # Check for Cloudflare
@@ -157,10 +155,7 @@ def scrape_martin(days_back=7, max_pages=10):
     except Exception as e:
         sys.stderr.write(f"❌ Fatal error: {e}\n")
     finally:
-        try:
-            page.quit()
-        except Exception:
-            pass
+        release_page(page)
 
     sys.stderr.write(f"📊 Total records: {len(records)}\n")
     return records
@@ -23,6 +23,8 @@ except ImportError:
     sys.stderr.write("[MIAMI_DADE] Missing requests/bs4\n")
     sys.exit(1)
 
+from core.http import get_session
+
 BASE_URL = "https://www.miamidade.gov"
 SEARCH_URL = f"{BASE_URL}/global/correctionsandrehabilitation/inmate-search.page"
 # Alternative API endpoints to try
@@ -41,8 +43,7 @@ HEADERS = {
 def scrape_miami_dade(days_back=7, max_pages=10):
     """Attempt to scrape Miami-Dade County inmates."""
     sys.stderr.write(f"[MIAMI_DADE] Starting scrape (high-difficulty target)\n")
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    session = get_session("miami_dade", HEADERS)
 
     # Try alternative endpoints first
     for url in ALT_URLS:
@@ -18,12 +18,14 @@ import datetime
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
 try:
-    import requests
     from bs4 import BeautifulSoup
 except ImportError:
     sys.stderr.write("[MONROE] Missing requests/bs4\n")
     sys.exit(1)
 
+from core.exceptions import SourceUnchanged
+from core.http import conditional_get, discard_validators, get_session
+
 
 BASE_URL = "https://keysso.net"
 
@@ -38,8 +40,7 @@ def scrape_monroe(days_back=7, max_pages=10):
     """Scrape Monroe County current inmates list."""
     sys.stderr.write(f"[MONROE] Starting scrape → {BASE_URL}\n")
 
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    session = get_session("monroe", HEADERS)
 
     # Try common paths for inmate pages
     urls_to_try = [
@@ -58,12 +59,15 @@ def scrape_monroe(days_back=7, max_pages=10):
 
     for url in urls_to_try:
         try:
-            resp = session.get(url, timeout=20, allow_redirects=True)
+            resp = conditional_get(session, url, timeout=20, allow_redirects=True)
             if resp.status_code == 200 and len(resp.text) > 1000:
                 if any(kw in resp.text.lower() for kw in ['inmate', 'booking', 'custody', 'arrest']):
                     page_content = resp.text
                     found_url = url
                     break
+            discard_validators("monroe")  # Not the roster — don't treat it as one next run
+        except SourceUnchanged:
+            raise
         except Exception:
             continue
 
@@ -24,6 +24,8 @@ except ImportError:
     sys.stderr.write("[OKEECHOBEE] Missing requests/bs4\n")
     sys.exit(1)
 
+from core.http import get_session
+
 
 BASE_URL = "https://www.okeesheriff.org"
 SEARCH_URL = f"{BASE_URL}/inmate-search"
@@ -39,8 +41,7 @@ def scrape_okeechobee(days_back=7, max_pages=10):
     """Scrape Okeechobee County inmate search."""
     sys.stderr.write(f"[OKEECHOBEE] Starting scrape → {SEARCH_URL}\n")
 
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    session = get_session("okeechobee", HEADERS)
 
     try:
         resp = session.get(SEARCH_URL, timeout=30)
@@ -16,6 +16,7 @@ Known Limitations:
 - Search is performed by Name because Booking Number search is unreliable.
 """
 
+import os
 import sys
 import json
 import re
@@ -26,6 +27,11 @@ import time
 from datetime import datetime
 from DrissionPage import ChromiumPage, ChromiumOptions
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from core.browser import navigate
+from core.exceptions import SourceUnchanged
+from core.http import conditional_get, get_session
+
 # Headless mode configuration
 HEADLESS = True
 
@@ -223,12 +229,12 @@ def enrich_records_with_web(records):
             try:
                 # Refresh session periodically or on first run
                 if i % 10 == 0:
-                    page.get("https://netapps.ocfl.net/BestJail/Home/Inmates")
+                    navigate(page, "https://netapps.ocfl.net/BestJail/Home/Inmates", "orange")
                     time.sleep(2)
 
                 # Ensure we are on search page
                 if "Inmates" not in page.url:
-                    page.get("https://netapps.ocfl.net/BestJail/Home/Inmates")
+                    navigate(page, "https://netapps.ocfl.net/BestJail/Home/Inmates", "orange")
                     time.sleep(1)
 
                 # Try search strategies: Full Name first, then Last, First
@@ -361,7 +367,7 @@ def scrape_orange():
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        response = requests.get(url, headers=headers, timeout=30)
+        response = conditional_get(get_session("orange", headers), url, timeout=30)
         response.raise_for_status()
         
         sys.stderr.write(f"   PDF Size: {len(response.content)} bytes\n")
@@ -377,6 +383,8 @@ def scrape_orange():
         # Output JSON to stdout
         print(json.dumps(records))
         
+    except SourceUnchanged:
+        raise
     except requests.RequestException as e:
         sys.stderr.write(f"❌ Network Error: {e}\n")
         print("[]")
@@ -14,6 +14,7 @@ Known Limitations:
 - Some records may not have bond information
 """
 
+import os
 import sys
 import json
 import re
@@ -21,6 +22,9 @@ import time
 from datetime import datetime, timedelta
 from playwright.sync_api import sync_playwright
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from core.rate_limit import throttle
+
 
 def clean_text(text):
     """Clean and normalize text"""
@@ -95,6 +99,7 @@ def scrape_detail_page(page, inmate_id):
     detail_url = f"https://apps.osceola.org/Apps/CorrectionsReports/Report/Details/{inmate_id}"
     
     try:
+        throttle(detail_url, "osceola")
         page.goto(detail_url, wait_until='networkidle', timeout=30000)
         time.sleep(1)
         
@@ -189,6 +194,7 @@ def scrape_daily_report(page, target_date):
     
     # Navigate to daily report
     base_url = "https://apps.osceola.org/Apps/CorrectionsReports/Report/Daily/"
+    throttle(base_url, "osceola")
     page.goto(base_url, wait_until='networkidle', timeout=30000)
     time.sleep(2)
     
@@ -315,9 +321,6 @@ def scrape_daily_report(page, target_date):
                 }
                 
                 records.append(record)
-            
-            # Small delay between detail page requests
-            time.sleep(0.5)
         
     except Exception as e:
         sys.stderr.write(f"   Error scraping daily report: {e}\n")
@@ -369,7 +372,6 @@ def scrape_osceola(start_date_str="12/10/2025", end_date_str=None):
                     sys.stderr.write(f"   ❌ Error on {current_date.strftime('%m/%d/%Y')}: {e}\n")
                 
                 current_date += timedelta(days=1)
-                time.sleep(1)  # Delay between dates
             
             browser.close()
             
@@ -20,7 +20,13 @@ REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(REPO_ROOT))
 
 from core.config_loader import load_config
-from core.dedup import deduplicate
+from core.stream import StreamDedup, iter_chunks
+from core.dedup import ChangeDetector
+from core.identity import get_person_index
+from core.exceptions import SourceUnchanged
+from core.http import commit_validators, discard_validators
+from core.watermark import load_watermark, incremental_days_back, advance_watermark
+from core.outbox import get_outbox, drain_outbox
 from core.logging_config import get_logger
 
 # Direct file imports to bypass SIP-locked core/writers/__init__.py on macOS
@@ -35,7 +41,7 @@ def _import_from_file(module_name, file_path):
 
 _json_writer = _import_from_file('json_writer', REPO_ROOT / 'core' / 'writers' / 'json_writer.py')
 _slack_notifier = _import_from_file('slack_notifier', REPO_ROOT / 'core' / 'writers' / 'slack_notifier.py')
-write_json = _json_writer.write_json
+JsonArrayWriter = _json_writer.JsonArrayWriter
 notify_completion = _slack_notifier.notify_completion
 notify_error = _slack_notifier.notify_error
 
@@ -46,11 +52,18 @@ def run_pipeline(county_name: str, days_back: int = None, max_pages: int = None,
 
     1. Load config
     2. Import and run the county solver
-    3. Deduplicate
+    3. Deduplicate, then drop bookings unchanged since they were last written
     4. Score (if scorer available)
     5. Write to Google Sheets (insert at row 2 — newest first)
     6. Write JSON backup
     7. Notify Slack
+
+    Steps 3–6 run per chunk (pipeline.chunk_size). A solver module may
+    define stream_{county}() yielding records or pages of records instead
+    of returning one list.
+
+    With the outbox on (core/outbox.py), chunks are committed to a local
+    queue instead and background workers write Sheets / Mongo / Slack.
     """
     config = load_config(county_name)
     logger = get_logger(county_name)
@@ -61,17 +74,29 @@ def run_pipeline(county_name: str, days_back: int = None, max_pages: int = None,
     if max_pages is not None:
         config['scraper']['max_pages'] = max_pages
 
+    # Incremental: only fetch what's new since the last successful run
+    # (an explicit --days-back always scrapes the full window)
+    watermark = None
+    if days_back is None:
+        watermark = load_watermark(county_name, config)
+        if watermark:
+            config['scraper']['days_back'] = incremental_days_back(watermark, config)
+            logger.info(f"  watermark: last booking {watermark.get('booking_date')} #{watermark.get('booking_number', '')}")
+
     logger.info(f"Starting {county_name} scraper pipeline")
     logger.info(f"  days_back={config['scraper']['days_back']}, max_pages={config['scraper']['max_pages']}")
 
     # --- Step 1: Run the solver ---
+    discard_validators(county_name)
     try:
         # Try importing the county's solve function dynamically
         solver_module = __import__(f"counties.{county_name}.solver", fromlist=['*'])
 
-        # Look for scrape_{county_name} function
+        # Prefer a streaming stream_{county_name} generator, then scrape_{county_name}
         scrape_fn_name = f"scrape_{county_name}"
-        if hasattr(solver_module, scrape_fn_name):
+        if hasattr(solver_module, f"stream_{county_name}"):
+            scrape_fn = getattr(solver_module, f"stream_{county_name}")
+        elif hasattr(solver_module, scrape_fn_name):
             scrape_fn = getattr(solver_module, scrape_fn_name)
         elif hasattr(solver_module, 'scrape'):
             scrape_fn = solver_module.scrape
@@ -89,6 +114,8 @@ def run_pipeline(county_name: str, days_back: int = None, max_pages: int = None,
             kwargs['days_back'] = config['scraper']['days_back']
         if 'max_pages' in sig.parameters:
             kwargs['max_pages'] = config['scraper']['max_pages']
+        if 'watermark' in sig.parameters:
+            kwargs['watermark'] = watermark
 
         records = scrape_fn(**kwargs)
 
@@ -96,75 +123,215 @@ def run_pipeline(county_name: str, days_back: int = None, max_pages: int = None,
             records = []
         if isinstance(records, str):
             records = json.loads(records)
+        if isinstance(records, list):
+            logger.info(f"Solver returned {len(records)} records")
+        else:
+            logger.info("Solver is streaming records")
 
-        logger.info(f"Solver returned {len(records)} records")
-
+    except SourceUnchanged as e:
+        logger.info(f"Source unchanged since last run, nothing to do ({e})")
+        return {'total': 0, 'new': 0, 'dupes': 0, 'unchanged': True}
     except Exception as e:
         logger.error(f"Solver failed: {e}", exc_info=True)
         notify_error(county_name, str(e))
         return None
 
-    if not records:
-        logger.warning("No records returned by solver")
-        return {'total': 0, 'new': 0, 'dupes': 0}
-
-    # --- Step 2: Deduplicate within batch ---
-    unique_records = deduplicate(records)
-    logger.info(f"After dedup: {len(unique_records)} unique (removed {len(records) - len(unique_records)} dupes)")
-
-    # --- Step 3: Score records (if lead_scorer available) ---
-    try:
-        from python_scrapers.models.arrest_record import ArrestRecord
-        from python_scrapers.scoring.lead_scorer import score_and_update
-
-        for record in unique_records:
-            try:
-                ar = ArrestRecord.from_dict(record)
-                scored = score_and_update(ar)
-                record['Lead_Score'] = scored.Lead_Score
-                record['Lead_Status'] = scored.Lead_Status
-            except Exception:
-                record.setdefault('Lead_Score', 0)
-                record.setdefault('Lead_Status', 'Cold')
-    except ImportError:
-        logger.info("Lead scorer not available, skipping scoring")
-        for record in unique_records:
-            record.setdefault('Lead_Score', 0)
-            record.setdefault('Lead_Status', 'Cold')
-
-    # --- Step 4: Write to Google Sheets (row 2 = newest) ---
-    stats = {'total': len(records), 'new': 0, 'dupes': 0, 'qualified': 0}
-
-    if not dry_run:
+    # Steps 2–5 run per chunk of pipeline.chunk_size records, so a streaming
+    # solver's records reach Sheets as they arrive and memory stays flat.
+    chunk_size = int((config.get('pipeline', {}) or {}).get('chunk_size', 200))
+    stats = {'total': 0, 'new': 0, 'dupes': 0, 'qualified': 0}
+    sheets_result = {'total_records': 0, 'new_records': 0, 'duplicates_skipped': 0, 'qualified_records': 0}
+    sheets_failed = False
+    solver_error = None
+    dedup = StreamDedup(county_name)
+    changes = ChangeDetector(county_name)
+    persons = get_person_index()
+    identity = {'matched': 0, 'new': 0, 'unresolved': 0}
+    mark_records = []  # Booking_Date / Booking_Number only, for the watermark
+    json_out = JsonArrayWriter(county_name, stage='normalized')
+
+    # Outbox on: chunks go to a durable local queue; its workers write the sinks (with retries)
+    outbox = None if dry_run else get_outbox()
+    run_id = f"{county_name}:{datetime.now().isoformat(timespec='seconds')}"
+    sheets_target = os.getenv('GOOGLE_SHEETS_ID', '121z5R6Hpqur54GNPC8L26ccfDPLHTJc3_LU6G7IV_0E')
+    mongo_target = False  # This runner doesn't mirror to MongoDB
+
+    writer = None
+    if outbox is not None:
+        outbox.start()
+        logger.info("Writes go through the outbox (core/outbox.py)")
+    elif not dry_run:
         try:
             _sheets_mod = _import_from_file('sheets_writer', REPO_ROOT / 'core' / 'writers' / 'sheets_writer.py')
             SheetsWriter = _sheets_mod.SheetsWriter
             sheets_id = os.getenv('GOOGLE_SHEETS_ID', '121z5R6Hpqur54GNPC8L26ccfDPLHTJc3_LU6G7IV_0E')
             if sheets_id:
                 writer = SheetsWriter(sheets_id)
-                result = writer.write_records(unique_records, county=county_name)
-                stats['new'] = result.get('new_records', 0)
-                stats['dupes'] = result.get('duplicates_skipped', 0)
-                stats['qualified'] = result.get('qualified_records', 0)
-                logger.info(f"Sheets: {stats['new']} new, {stats['dupes']} dupes, {stats['qualified']} qualified")
-
-                # Log ingestion
-                writer.log_ingestion(county_name, result)
             else:
                 logger.warning("GOOGLE_SHEETS_ID not set, skipping Sheets write")
         except Exception as e:
             logger.error(f"Sheets write failed: {e}", exc_info=True)
+            sheets_failed = True
     else:
         logger.info("DRY RUN — skipping Sheets write")
+    # Batched Sheets inserts are only sent by writer.flush(); fingerprints wait for it
+    commit_each_chunk = writer is None or not writer.deferred
 
-    # --- Step 5: Write JSON backup ---
-    write_json(unique_records, county_name, stage='normalized')
+    try:
+        for chunk in iter_chunks(records, chunk_size):
+            stats['total'] += len(chunk)
+
+            # --- Step 2: Deduplicate (across the whole run) ---
+            unique_records = dedup.filter(chunk)
+            mark_records.extend(
+                {'Booking_Date': d, 'Booking_Number': b}
+                for d, b in zip(unique_records.column('Booking_Date'), unique_records.column('Booking_Number'))
+            )
+
+            # --- Step 2b: Only new or changed bookings go on to scoring and writers ---
+            unique_records = changes.filter(unique_records)
+            if not unique_records:
+                if commit_each_chunk and not dry_run and not sheets_failed:
+                    changes.commit()  # Nothing to write; still records when these were last seen
+                continue
+
+            # --- Step 2c: Resolve a stable cross-county Person_Key ---
+            if persons is not None:
+                try:
+                    for key, count in persons.resolve(unique_records, county_name, commit=not dry_run).items():
+                        identity[key] += count
+                except Exception as e:
+                    logger.error(f"Person index lookup failed (non-fatal): {e}", exc_info=True)
+
+            # --- Step 3: Score the whole chunk column-wise (if lead_scorer available) ---
+            try:
+                from python_scrapers.scoring.lead_scorer import score_and_update_batch
+                score_and_update_batch(unique_records)
+            except Exception as e:
+                if not isinstance(e, ImportError):
+                    logger.error(f"Scoring failed (non-fatal): {e}", exc_info=True)
+                for record in unique_records:
+                    record.setdefault('Lead_Score', 0)
+                    record.setdefault('Lead_Status', 'Cold')
+
+            # --- Step 4a: Commit the chunk to the outbox (its workers write Sheets / Mongo) ---
+            if outbox is not None and not sheets_failed:
+                try:
+                    stats['queued'] = stats.get('queued', 0) + outbox.put_records(
+                        unique_records, county_name, run_id, spreadsheet_id=sheets_target, mongo=mongo_target
+                    )
+                except Exception as e:
+                    logger.error(f"Outbox write failed: {e}", exc_info=True)
+                    sheets_failed = True
+
+            # --- Step 4: Write to Google Sheets (newest first; later chunks go below earlier ones) ---
+            if writer is not None and not sheets_failed:
+                try:
+                    result = writer.write_records(
+                        unique_records, county=county_name, row=2 + sheets_result['new_records']
+                    )
+                    for key in sheets_result:
+                        sheets_result[key] += result.get(key, 0)
+                except Exception as e:
+                    logger.error(f"Sheets write failed: {e}", exc_info=True)
+                    sheets_failed = True
+
+            # --- Step 5: Write JSON backup ---
+            json_out.write(unique_records)
+
+            # Fingerprints are stored only once the chunk is written
+            if commit_each_chunk and not dry_run and not sheets_failed:
+                changes.commit()
+    except SourceUnchanged as e:
+        logger.info(f"Source unchanged since last run, nothing to do ({e})")
+        return {'total': 0, 'new': 0, 'dupes': 0, 'unchanged': True}
+    except Exception as e:
+        # Everything flushed so far is kept; the watermark stays put
+        solver_error = e
+        logger.error(f"Solver failed after {stats['total']} records: {e}", exc_info=True)
+        notify_error(county_name, str(e))
+    finally:
+        json_out.close()
+        if hasattr(records, 'close'):
+            records.close()
+
+    if stats['total'] == 0:
+        if solver_error is not None:
+            return None
+        logger.warning("No records returned by solver")
+        return {'total': 0, 'new': 0, 'dupes': 0}
+
+    logger.info(f"After dedup: {stats['total'] - dedup.duplicates} unique (removed {dedup.duplicates} dupes)")
+    logger.info(
+        f"Changes: {changes.counts['new']} new, {changes.counts['changed']} changed, "
+        f"{changes.counts['unchanged']} unchanged (skipped)"
+    )
+    stats['changed'] = changes.counts['changed']
+    stats['unchanged_records'] = changes.counts['unchanged']
+    if persons is not None:
+        logger.info(
+            f"Identity: {identity['matched']} known people, {identity['new']} new, "
+            f"{identity['unresolved']} unresolved"
+        )
+    if writer is not None:
+        stats['new'] = sheets_result['new_records']
+        stats['dupes'] = sheets_result['duplicates_skipped']
+        stats['qualified'] = sheets_result['qualified_records']
+        logger.info(f"Sheets: {stats['new']} new, {stats['dupes']} dupes, {stats['qualified']} qualified")
+
+        # Log ingestion: everything scraped, and how much of it was unchanged / changed
+        writer.log_ingestion(county_name, {
+            **sheets_result,
+            'total_records': stats['total'],
+            'changed_records': changes.counts['changed'],
+            'unchanged_records': changes.counts['unchanged'],
+        }, error=str(solver_error) if solver_error else None)
+
+        # --- Step 4b: Send batched Sheets inserts (county tab, Qualified_Arrests, log) ---
+        if not sheets_failed:
+            try:
+                writer.flush()
+            except Exception as e:
+                logger.error(f"Sheets write failed: {e}", exc_info=True)
+                sheets_failed = True
+
+        # --- Step 4c: Move rows past sheets.rotation limits to archive tabs ---
+        if not sheets_failed:
+            try:
+                writer.rotate(county_name)
+            except Exception as e:
+                logger.error(f"Sheets rotation failed (non-fatal): {e}", exc_info=True)
+
+    if outbox is not None:
+        # Sheets counts come from the worker; "new" here is bookings never seen before
+        stats['new'] = changes.counts['new']
+        logger.info(f"Outbox: {stats.get('queued', 0)} records queued for the sink workers")
+        try:
+            outbox.put_log(county_name, run_id, sheets_target, stats['total'],
+                           changed=changes.counts['changed'], unchanged=changes.counts['unchanged'],
+                           error=str(solver_error) if solver_error else None)
+        except Exception as e:
+            logger.error(f"Outbox write failed (ingestion log): {e}", exc_info=True)
+
+    if not commit_each_chunk and not dry_run and not sheets_failed:
+        changes.commit()
+
+    if solver_error is not None:
+        stats['errors'] = str(solver_error)
+
+    # --- Step 5c: Advance the high-water mark and HTTP validators once records are written ---
+    if not dry_run and not sheets_failed and solver_error is None:
+        try:
+            advance_watermark(county_name, mark_records, config)
+            commit_validators(county_name)
+        except Exception as e:
+            logger.error(f"Watermark update failed (non-fatal): {e}", exc_info=True)
 
     # --- Step 6: Slack notification ---
     if stats['new'] > 0:
         notify_completion(county_name, {
             'new_records': stats['new'],
-            'updated_records': 0,
+            'updated_records': stats['changed'],
             'qualified_records': stats['qualified']
         })
 
@@ -190,6 +357,10 @@ def main():
     # Print summary JSON to stdout
     print(json.dumps(results))
 
+    # One-shot run: wait for the outbox to deliver, and fail if records are left behind
+    if not args.dry_run and not drain_outbox():
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
@@ -15,7 +15,12 @@ import re
 import platform
 import os
 from datetime import datetime, timedelta
-from DrissionPage import ChromiumPage, ChromiumOptions
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from core.browser import acquire_page, release_page, navigate
+from core.stealth import wait_for_ready
+from core.dedup import KnownBookings
 
 
 # ---------------------------------------------------------------------------
@@ -62,9 +67,8 @@ def parse_bond(text):
 
 
 def setup_browser():
-    """Configure and launch DrissionPage browser using shared core config."""
-    from core.browser import create_browser
-    return create_browser({"headless": True})
+    """Lease a tab from the shared Chromium pool (see core.browser)."""
+    return acquire_page({"headless": True})
 
 
 # ---------------------------------------------------------------------------
@@ -83,14 +87,15 @@ def search_and_collect(page, target_date, max_pages=50):
     sys.stderr.write(f"\n--- Searching for {target_date} ---\n")
 
     # Navigate to search form
-    page.get('https://www3.pbso.org/blotter/index.cfm')
-    time.sleep(2)
+    navigate(page, 'https://www3.pbso.org/blotter/index.cfm', "palm_beach")
+    wait_for_ready(page, ['#start_date', 'tag:iframe[src*="hcaptcha.com"]'],
+                   county="palm_beach", step="search_form")
 
     # Handle hCaptcha if present
     try:
-        if page.ele('tag:iframe[src*="hcaptcha.com"]'):
-            sys.stderr.write("⚠️  hCaptcha detected. Waiting 30s for manual solve...\n")
-            time.sleep(30)
+        if page.ele('tag:iframe[src*="hcaptcha.com"]', timeout=0):
+            sys.stderr.write("⚠️  hCaptcha detected. Waiting up to 30s for manual solve...\n")
+            page.wait.ele_deleted('tag:iframe[src*="hcaptcha.com"]', timeout=30)
     except:
         pass
 
@@ -118,7 +123,9 @@ def search_and_collect(page, target_date, max_pages=50):
 
     sys.stderr.write(f"Submitting search for {target_date}...\n")
     submit_btn.click()
-    time.sleep(5)
+    wait_for_ready(page, ['css:div[id^="allresults_"]', 'xpath://*[contains(text(), "matches retrieved")]',
+                          'text:0 matches'], navigation=True, timeout=15,
+                   county="palm_beach", step="results")
 
     # Collect records from all pages
     all_summaries = []
@@ -165,7 +172,8 @@ def search_and_collect(page, target_date, max_pages=50):
             break
 
         current_page += 1
-        time.sleep(3)
+        wait_for_ready(page, 'css:div[id^="allresults_"]', navigation=True,
+                       county="palm_beach", step="next_page")
 
     sys.stderr.write(f"📊 Collected {len(all_summaries)} records for {target_date}.\n")
     return all_summaries
@@ -397,13 +405,10 @@ def enrich_with_detail(page, record):
             return record
 
         link.click()
-        time.sleep(2)
 
-        # Wait for detail div to load
-        detail_div = page.ele('css:#blotterdetails')
-        if not detail_div:
-            time.sleep(2)
-            detail_div = page.ele('css:#blotterdetails')
+        # Wait for loaddetail() to inject the detail div
+        wait_for_ready(page, 'css:#blotterdetails', timeout=4, county="palm_beach", step="detail")
+        detail_div = page.ele('css:#blotterdetails', timeout=0)
 
         if not detail_div:
             # Try the whole page text as fallback
@@ -456,7 +461,8 @@ def enrich_with_detail(page, record):
 
         # Go back to results list
         page.back()
-        time.sleep(2)
+        wait_for_ready(page, 'css:div[id^="allresults_"]', timeout=5,
+                       county="palm_beach", step="back")
 
     except Exception as e:
         sys.stderr.write(f"   ⚠️ Detail page error for {booking_num}: {e}\n")
@@ -490,6 +496,7 @@ def scrape_palm_beach(days_back=1, max_pages=50):
 
     page = setup_browser()
     all_records = []
+    known = KnownBookings("Palm Beach", "palm_beach")
 
     try:
         # Loop oldest → newest
@@ -500,6 +507,8 @@ def scrape_palm_beach(days_back=1, max_pages=50):
             # Phase 1: Search & collect from list view
             summaries = search_and_collect(page, target_date, max_pages)
 
+            # Bookings already stored (and not due a recheck) skip Phase 2 entirely
+            summaries = known.filter(summaries, key=lambda r: r.get('Booking_Number'))
             if not summaries:
                 continue
 
@@ -531,10 +540,7 @@ def scrape_palm_beach(days_back=1, max_pages=50):
         return all_records  # Return whatever we got
 
     finally:
-        try:
-            page.quit()
-        except:
-            pass
+        release_page(page)
 
 
 if __name__ == "__main__":
@@ -20,8 +20,10 @@ import time
 import re
 from datetime import datetime, timedelta
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
 try:
-    from DrissionPage import ChromiumPage, ChromiumOptions
+    from core.browser import acquire_page, release_page, navigate
     HAS_DRISSION = True
 except ImportError:
     HAS_DRISSION = False
@@ -32,30 +34,8 @@ SEARCH_URL = "https://www.pascocountyfl.gov/government/public_safety_justice/cor
 
 
 def setup_browser(headed=False):
-    """Configure and return a DrissionPage browser instance."""
-    co = ChromiumOptions()
-    co.auto_port()
-
-    chrome_path = os.getenv("CHROME_PATH")
-    if chrome_path:
-        co.set_browser_path(chrome_path)
-
-    if not headed:
-        co.headless(True)
-        co.set_argument('--headless=new')
-
-    co.set_argument('--no-sandbox')
-    co.set_argument('--disable-dev-shm-usage')
-    co.set_argument('--disable-gpu')
-    co.set_argument('--disable-blink-features=AutomationControlled')
-    co.set_argument('--window-size=1920,1080')
-    co.set_user_agent(
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-        'AppleWebKit/537.36 (KHTML, like Gecko) '
-        'Chrome/120.0.0.0 Safari/537.36'
-    )
-
-    return ChromiumPage(addr_or_opts=co)
+    """Lease a tab from the shared Chromium pool (see core.browser)."""
+    return acquire_page({"headless": not headed})
 
 
 def wait_for_cloudflare(page, max_wait=30):
@@ -96,7 +76,7 @@ def scrape_pasco(days_back=7, max_pages=20):
     try:
         # Step 1: Navigate through Cloudflare
         sys.stderr.write("📡 Loading Pasco County corrections page...\n")
-        page.get(SEARCH_URL)
+        navigate(page, SEARCH_URL, "pasco")
         time.sleep(3)
 
         if not wait_for_cloudflare(page):
@@ -124,7 +104,7 @@ def scrape_pasco(days_back=7, max_pages=20):
                 if iframe:
                     iframe_src = iframe.attr('src')
                     sys.stderr.write(f"   Found iframe: {iframe_src}\n")
-                    page.get(iframe_src)
+                    navigate(page, iframe_src, "pasco")
                     time.sleep(3)
             except Exception:
                 pass
@@ -190,10 +170,7 @@ def scrape_pasco(days_back=7, max_pages=20):
     except Exception as e:
         sys.stderr.write(f"❌ Fatal error: {e}\n")
     finally:
-        try:
-            page.quit()
-        except Exception:
-            pass
+        release_page(page)
 
     sys.stderr.write(f"📊 Total records: {len(records)}\n")
     return records
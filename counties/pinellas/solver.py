@@ -5,6 +5,8 @@ County: Pinellas
 Limitations: Requires Selenium for JavaScript rendering, searches by booking date
 """
 
+import os
+import sys
 import json
 import time
 import re
@@ -18,6 +20,9 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from core.rate_limit import throttle
+
 
 def create_driver():
     """Create a headless Chrome driver."""
@@ -90,6 +95,7 @@ def scrape_pinellas(days_back: int = 7, fetch_details: bool = True) -> List[Dict
             print(f"\n📅 Searching bookings for {date_str}...")
             
             # Navigate to the page
+            throttle(base_url, "pinellas")
             driver.get(base_url)
             time.sleep(3)
             
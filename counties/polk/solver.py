@@ -17,7 +17,6 @@ import re
 import json
 import os
 import datetime
-import time
 import string
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -29,6 +28,8 @@ except ImportError:
     sys.stderr.write("[POLK] Missing requests/bs4\n")
     sys.exit(1)
 
+from core.http import get_session
+
 
 BASE_URL = "https://www.polksheriff.org"
 JAIL_URL = f"{BASE_URL}/detention/jail-inquiry"
@@ -44,8 +45,7 @@ def scrape_polk(days_back=7, max_pages=10):
     """Scrape Polk County jail by iterating A-Z last name searches."""
     sys.stderr.write(f"[POLK] Starting scrape → {JAIL_URL}\n")
 
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    session = get_session("polk", HEADERS)
 
     try:
         resp = session.get(JAIL_URL, timeout=30)
@@ -74,7 +74,6 @@ def scrape_polk(days_back=7, max_pages=10):
             key = rec.get('Booking_Number') or rec.get('Full_Name', '')
             if key and key not in all_records:
                 all_records[key] = rec
-        time.sleep(0.5)
 
     records = list(all_records.values())
     sys.stderr.write(f"[POLK] Total extracted: {len(records)} records\n")
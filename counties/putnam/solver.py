@@ -21,12 +21,13 @@ BASE_URL = "http://smartweb.pcso.us"
 JAIL_PATH = "/smartwebclient/Jail.aspx"
 
 
-def scrape_putnam(days_back=7, max_pages=10):
+def scrape_putnam(days_back=7, max_pages=10, watermark=None):
     """Scrape Putnam County jail roster via SmartCOP."""
     return scrape_smartcop(
         base_url=BASE_URL,
         county="Putnam",
         jail_path=JAIL_PATH,
+        watermark=watermark,
     )
 
 
@@ -21,12 +21,13 @@ BASE_URL = "http://smartweb.santarosasheriff.org"
 JAIL_PATH = "/smartwebclient/Jail.aspx"
 
 
-def scrape_santa_rosa(days_back=7, max_pages=10):
+def scrape_santa_rosa(days_back=7, max_pages=10, watermark=None):
     """Scrape Santa Rosa County jail roster via SmartCOP."""
     return scrape_smartcop(
         base_url=BASE_URL,
         county="Santa Rosa",
         jail_path=JAIL_PATH,
+        watermark=watermark,
     )
 
 
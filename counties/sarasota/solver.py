@@ -26,7 +26,11 @@ import time
 import re
 import datetime
 import argparse
-from DrissionPage import ChromiumPage, ChromiumOptions
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from core.browser import acquire_page, release_page, fetch_details, navigate
+from core.stealth import wait_for_ready
 
 
 # ─── Helpers ────────────────────────────────────────────────────────────────
@@ -60,35 +64,13 @@ def clean_charge_text(raw_charge):
 # ─── Browser Setup ──────────────────────────────────────────────────────────
 
 def setup_browser(headed=False):
-    """Configure and launch DrissionPage browser with anti-detection."""
-    co = ChromiumOptions()
-    co.auto_port()
-
-    # Docker / CI: use CHROME_PATH if set
-    chrome_path = os.getenv("CHROME_PATH")
-    if chrome_path:
-        co.set_browser_path(chrome_path)
-
+    """Lease a tab from the shared Chromium pool (see core.browser)."""
     # Headless mode (default unless --headed or HEADLESS=false)
     headless = not headed and os.getenv("HEADLESS", "true").lower() != "false"
-    if headless:
-        co.headless(True)
-        co.set_argument('--headless=new')
-
-    co.set_argument('--no-sandbox')
-    co.set_argument('--disable-dev-shm-usage')
-    co.set_argument('--disable-gpu')
-    co.set_argument('--disable-blink-features=AutomationControlled')
-    co.set_argument('--window-size=1920,1080')
-    co.set_argument('--ignore-certificate-errors')
-    co.set_user_agent(
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-        'AppleWebKit/537.36 (KHTML, like Gecko) '
-        'Chrome/120.0.0.0 Safari/537.36'
-    )
-
-    sys.stderr.write(f"🌐 Browser: headless={headless}, chrome={chrome_path or 'default'}\n")
-    return ChromiumPage(addr_or_opts=co)
+    return acquire_page({
+        "headless": headless,
+        "browser": {"extra_arguments": ["--ignore-certificate-errors"]},
+    })
 
 
 def wait_for_cloudflare(page, max_wait=30):
@@ -127,12 +109,13 @@ def collect_pins_for_date(page, date_str):
             search_url += f"&page={page_num}"
 
         sys.stderr.write(f"   📄 Page {page_num}: {search_url}\n")
-        page.get(search_url)
-        time.sleep(2)
+        navigate(page, search_url, "sarasota")
 
         if not wait_for_cloudflare(page):
             sys.stderr.write("   ❌ Cloudflare did not clear on search page\n")
             break
+        wait_for_ready(page, 'css:a[href*="pinSearch.php"]', network_idle=True,
+                       county="sarasota", step="search")
 
         # Extract PIN links: <a href="pinSearch.php?pin=XXXXX">
         pin_links = page.eles('css:a[href*="pinSearch.php"]')
@@ -162,7 +145,6 @@ def collect_pins_for_date(page, date_str):
             break
 
         page_num += 1
-        time.sleep(1)
 
     return pins
 
@@ -183,12 +165,13 @@ def resolve_bookings_for_pin(page, pin, target_dates):
     pin_url = f"{BASE_URL}pinSearch.php?pin={pin}"
 
     try:
-        page.get(pin_url)
-        time.sleep(2)
+        navigate(page, pin_url, "sarasota")
 
         if not wait_for_cloudflare(page):
             sys.stderr.write(f"   ⚠️ Cloudflare on PIN page for {pin}\n")
             return bookings
+        wait_for_ready(page, ['css:a[href*="booking.php"]', 'css:a[href*="viewInmate.php"]'],
+                       network_idle=True, county="sarasota", step="pin")
 
         # Look for booking links in search result rows
         # Try table rows first
@@ -252,12 +235,13 @@ def extract_detail(page, booking_id, detail_url):
     }
 
     try:
-        page.get(detail_url)
-        time.sleep(2)
+        page.get(detail_url)  # fetch_details() already throttled this URL
 
         if not wait_for_cloudflare(page):
             sys.stderr.write("   ⚠️ Cloudflare on detail page\n")
             return data
+        wait_for_ready(page, ['css:#data-table tr', 'css:h1.page-title'], network_idle=True,
+                       county="sarasota", step="detail")
 
         # --- Name from h1.page-title ---
         h1 = page.ele('css:h1.page-title')
@@ -421,6 +405,7 @@ def scrape_sarasota(days_back=1, max_pages=30, headed=False):
 
     page = setup_browser(headed=headed)
 
+    details = None
     try:
         # ─── Phase 1: Collect PINs across all target dates ───
         sys.stderr.write("═══ Phase 1: Collecting PINs from date searches ═══\n")
@@ -433,7 +418,6 @@ def scrape_sarasota(days_back=1, max_pages=30, headed=False):
                 if pin not in all_pins:
                     all_pins[pin] = set()
                 all_pins[pin].add(date_str)
-            time.sleep(1)
 
         sys.stderr.write(f"\n📊 Phase 1 complete: {len(all_pins)} unique PINs\n")
 
@@ -453,7 +437,6 @@ def scrape_sarasota(days_back=1, max_pages=30, headed=False):
                 if b[1] not in booking_set:
                     booking_set.add(b[1])
                     booking_list.append(b)
-            time.sleep(1)
 
         sys.stderr.write(f"\n📊 Phase 2 complete: {len(booking_list)} booking URLs\n")
 
@@ -462,9 +445,10 @@ def scrape_sarasota(days_back=1, max_pages=30, headed=False):
             sys.stderr.write("⚠️ No bookings from PIN resolution. Trying direct links...\n")
             for date_str in date_list:
                 search_url = f"{BASE_URL}personSearch.php?type=date&date={date_str}"
-                page.get(search_url)
-                time.sleep(2)
+                navigate(page, search_url, "sarasota")
                 if wait_for_cloudflare(page):
+                    wait_for_ready(page, ['css:a[href*="viewInmate.php"]', 'css:a[href*="booking.php"]'],
+                                   network_idle=True, county="sarasota", step="search")
                     direct_links = page.eles('css:a[href*="viewInmate.php"]') or \
                                    page.eles('css:a[href*="booking.php"]')
                     for link in direct_links:
@@ -487,11 +471,13 @@ def scrape_sarasota(days_back=1, max_pages=30, headed=False):
         sys.stderr.write(f"\n═══ Phase 3: Extracting details from {len(booking_list)} bookings ═══\n")
         arrests = []
 
-        for idx, (booking_id, detail_url) in enumerate(booking_list, 1):
+        details = fetch_details(page, booking_list, extract_detail, county="sarasota")
+        for idx, ((booking_id, detail_url), record, error) in enumerate(details, 1):
             sys.stderr.write(f"\n🔍 [{idx}/{len(booking_list)}] {booking_id}\n")
 
             try:
-                record = extract_detail(page, booking_id, detail_url)
+                if error:
+                    raise error
 
                 if record.get('Full_Name'):
                     arrests.append(record)
@@ -504,8 +490,6 @@ def scrape_sarasota(days_back=1, max_pages=30, headed=False):
                 sys.stderr.write(f"   ⚠️ Error: {e}\n")
                 continue
 
-            time.sleep(1)  # Polite delay
-
         sys.stderr.write(f"\n{'═' * 60}\n")
         sys.stderr.write(f"📊 Sarasota scraper complete: {len(arrests)} records\n")
         sys.stderr.write(f"{'═' * 60}\n")
@@ -518,10 +502,9 @@ def scrape_sarasota(days_back=1, max_pages=30, headed=False):
         return []
 
     finally:
-        try:
-            page.quit()
-        except Exception:
-            pass
+        if details is not None:
+            details.close()  # Stop the prefetch workers and return their tabs before ours
+        release_page(page)
 
 
 # ─── CLI Entry Point ─────────────────────────────────────────────────────────
@@ -14,6 +14,7 @@ Known Limitations:
 - Detail page fetching is slow (1-2 seconds per inmate)
 """
 
+import os
 import sys
 import json
 import re
@@ -35,6 +36,9 @@ except ImportError:
     print("[]")
     sys.exit(1)
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from core.rate_limit import throttle
+
 
 def setup_browser():
     """Configure and return a headless Chrome browser instance"""
@@ -147,6 +151,7 @@ def fetch_detail_page(driver, person_id):
     try:
         # Navigate directly to detail page URL
         detail_url = f"https://seminole.northpointesuite.com/custodyportal/details/{person_id}"
+        throttle(detail_url, "seminole")
         driver.get(detail_url)
         time.sleep(2)
         
@@ -231,6 +236,7 @@ def scrape_seminole(fetch_details=True, max_detail_records=100):
     try:
         sys.stderr.write(f"📡 Launching browser and navigating to {url}...\n")
         driver = setup_browser()
+        throttle(url, "seminole")
         driver.get(url)
         time.sleep(5)
         
@@ -15,7 +15,6 @@ import re
 import json
 import os
 import datetime
-import time
 import string
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -27,6 +26,8 @@ except ImportError:
     sys.stderr.write("[STJOHNS] Missing requests/bs4\n")
     sys.exit(1)
 
+from core.http import get_session
+
 
 BASE_URL = "https://www.sjso.org"
 SEARCH_URL = f"{BASE_URL}/detention-center/sj-inmate-search/"
@@ -42,8 +43,7 @@ def scrape_stjohns(days_back=7, max_pages=10):
     """Scrape St. Johns County inmate search."""
     sys.stderr.write(f"[STJOHNS] Starting scrape → {SEARCH_URL}\n")
 
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    session = get_session("stjohns", HEADERS)
 
     try:
         resp = session.get(SEARCH_URL, timeout=30)
@@ -98,7 +98,6 @@ def scrape_stjohns(days_back=7, max_pages=10):
         except Exception as e:
             sys.stderr.write(f"[STJOHNS] Error on {letter}: {e}\n")
 
-        time.sleep(0.3)
 
     records = list(all_records.values())
     sys.stderr.write(f"[STJOHNS] Total extracted: {len(records)} records\n")
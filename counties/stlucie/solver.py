@@ -25,6 +25,8 @@ except ImportError:
     sys.stderr.write("[ST_LUCIE] Missing requests/bs4\n")
     sys.exit(1)
 
+from core.http import get_session
+
 
 BASE_URL = "https://www.stluciesheriff.com"
 
@@ -39,8 +41,7 @@ def scrape_stlucie(days_back=7, max_pages=10):
     """Scrape St. Lucie County using '%' wildcard search."""
     sys.stderr.write(f"[ST_LUCIE] Starting scrape → {BASE_URL}\n")
 
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    session = get_session("stlucie", HEADERS)
 
     # Find the inmate lookup page
     lookup_urls = [
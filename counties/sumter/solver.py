@@ -21,12 +21,13 @@ BASE_URL = "http://portal.sumtercountysheriff.org"
 JAIL_PATH = "/smartwebclient/Jail.aspx"
 
 
-def scrape_sumter(days_back=7, max_pages=10):
+def scrape_sumter(days_back=7, max_pages=10, watermark=None):
     """Scrape Sumter County jail roster via SmartCOP."""
     return scrape_smartcop(
         base_url=BASE_URL,
         county="Sumter",
         jail_path=JAIL_PATH,
+        watermark=watermark,
     )
 
 
@@ -21,12 +21,13 @@ BASE_URL = "http://smartcop.suwanneesheriff.com"
 JAIL_PATH = "/smartwebclient/Jail.aspx"
 
 
-def scrape_suwannee(days_back=7, max_pages=10):
+def scrape_suwannee(days_back=7, max_pages=10, watermark=None):
     """Scrape Suwannee County jail roster via SmartCOP."""
     return scrape_smartcop(
         base_url=BASE_URL,
         county="Suwannee",
         jail_path=JAIL_PATH,
+        watermark=watermark,
     )
 
 
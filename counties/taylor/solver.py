@@ -21,12 +21,13 @@ BASE_URL = "http://smartcop.taylorsheriff.org"
 JAIL_PATH = "/smartwebclient/Jail.aspx"
 
 
-def scrape_taylor(days_back=7, max_pages=10):
+def scrape_taylor(days_back=7, max_pages=10, watermark=None):
     """Scrape Taylor County jail roster via SmartCOP."""
     return scrape_smartcop(
         base_url=BASE_URL,
         county="Taylor",
         jail_path=JAIL_PATH,
+        watermark=watermark,
     )
 
 
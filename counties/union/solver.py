@@ -20,6 +20,8 @@ except ImportError:
     sys.stderr.write("[UNION] Missing requests/bs4\n")
     sys.exit(1)
 
+from core.http import get_session
+
 BASE_URL = "https://www.unioncountysheriff.us"
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -30,8 +32,7 @@ HEADERS = {
 def scrape_union(days_back=7, max_pages=10):
     """Scrape Union County inmate data."""
     sys.stderr.write(f"[UNION] Starting → {BASE_URL}\n")
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    session = get_session("union", HEADERS)
 
     try:
         resp = session.get(BASE_URL, timeout=30, allow_redirects=True)
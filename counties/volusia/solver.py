@@ -17,8 +17,10 @@ import time
 import re
 from datetime import datetime, timedelta
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
 try:
-    from DrissionPage import ChromiumPage, ChromiumOptions
+    from core.browser import acquire_page, release_page, navigate
     HAS_DRISSION = True
 except ImportError:
     HAS_DRISSION = False
@@ -30,30 +32,8 @@ SEARCH_URL = "https://www.volusia.org/services/public-protection/corrections/inm
 
 
 def setup_browser(headed=False):
-    """Configure and return a DrissionPage browser instance."""
-    co = ChromiumOptions()
-    co.auto_port()
-
-    chrome_path = os.getenv("CHROME_PATH")
-    if chrome_path:
-        co.set_browser_path(chrome_path)
-
-    if not headed:
-        co.headless(True)
-        co.set_argument('--headless=new')
-
-    co.set_argument('--no-sandbox')
-    co.set_argument('--disable-dev-shm-usage')
-    co.set_argument('--disable-gpu')
-    co.set_argument('--disable-blink-features=AutomationControlled')
-    co.set_argument('--window-size=1920,1080')
-    co.set_user_agent(
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-        'AppleWebKit/537.36 (KHTML, like Gecko) '
-        'Chrome/120.0.0.0 Safari/537.36'
-    )
-
-    return ChromiumPage(addr_or_opts=co)
+    """Lease a tab from the shared Chromium pool (see core.browser)."""
+    return acquire_page({"headless": not headed})
 
 
 def wait_for_cloudflare(page, max_wait=20):
@@ -92,7 +72,7 @@ def scrape_volusia(days_back=7, max_pages=20):
     try:
         # Step 1: Try the direct search URL first
         sys.stderr.write("📡 Loading Volusia corrections search...\n")
-        page.get(SEARCH_URL)
+        navigate(page, SEARCH_URL, "volusia")
         time.sleep(3)
         wait_for_cloudflare(page)
 
@@ -103,7 +83,7 @@ def scrape_volusia(days_back=7, max_pages=20):
         # If the direct URL didn't work, try the corrections main page
         if 'error' in page.title.lower() or '404' in page.title or '404' in page.html[:200]:
             sys.stderr.write("⚠️  Direct search URL failed, trying corrections main page...\n")
-            page.get(CORRECTIONS_URL)
+            navigate(page, CORRECTIONS_URL, "volusia")
             time.sleep(3)
             wait_for_cloudflare(page)
 
@@ -218,10 +198,7 @@ def scrape_volusia(days_back=7, max_pages=20):
     except Exception as e:
         sys.stderr.write(f"❌ Fatal error: {e}\n")
     finally:
-        try:
-            page.quit()
-        except Exception:
-            pass
+        release_page(page)
 
     sys.stderr.write(f"📊 Total records: {len(records)}\n")
     return records
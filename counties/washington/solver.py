@@ -17,12 +17,13 @@ import datetime
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
 try:
-    import requests
     from bs4 import BeautifulSoup
 except ImportError:
     sys.stderr.write("[WASHINGTON] Missing requests/bs4\n")
     sys.exit(1)
 
+from core.http import get_session
+
 
 BASE_URL = "https://wcso.us"
 
@@ -37,8 +38,7 @@ def scrape_washington(days_back=7, max_pages=10):
     """Scrape Washington County inmate roster."""
     sys.stderr.write(f"[WASHINGTON] Starting scrape → {BASE_URL}\n")
 
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    session = get_session("washington", HEADERS)
 
     urls_to_try = [
         f"{BASE_URL}/inmateRoster",
@@ -4,17 +4,55 @@ ArrestRecord Model - Extended 34-Column Universal Schema
 This module defines the canonical ArrestRecord model with integrated lead scoring.
 Extends the original 32-column schema with Lead_Score and Lead_Status fields.
 
+Records are slotted (no per-instance __dict__) and share one timestamp per
+run: call set_run_timestamp() at the start of a run (or pass `timestamp` to
+ArrestRecord.from_dicts) and every record built until the next call gets the
+same Scrape_Timestamp / ingested_at instead of two utcnow() calls each.
+
+Usage:
+    from python_scrapers.models.arrest_record import ArrestRecord, set_run_timestamp
+    set_run_timestamp()
+    records = ArrestRecord.from_dicts(raw_records, County="Lee")
+    rows = [r.to_sheet_row() for r in records]
+
 Author: SWFL Arrest Scrapers Team
 Date: November 24, 2025
 """
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Dict, Any
+from operator import attrgetter
+from typing import Optional, Dict, Any, Iterable, List
+import gc
 import json
 
 
-@dataclass
+# Pinned (iso string, datetime) shared by records built during a run
+_run_stamp = None
+
+
+def set_run_timestamp(ts: Optional[datetime] = None) -> str:
+    """Pin the timestamp given to records built from now on (default: utcnow). Returns it as ISO."""
+    global _run_stamp
+    ts = ts or datetime.utcnow()
+    _run_stamp = (ts.isoformat(), ts)
+    return _run_stamp[0]
+
+
+def clear_run_timestamp() -> None:
+    """Go back to stamping each record with the time it is built."""
+    global _run_stamp
+    _run_stamp = None
+
+
+def _stamp() -> tuple:
+    if _run_stamp is not None:
+        return _run_stamp
+    now = datetime.utcnow()
+    return now.isoformat(), now
+
+
+@dataclass(slots=True)
 class ArrestRecord:
     """
     Universal arrest record model with 39 fields.
@@ -63,15 +101,16 @@ class ArrestRecord:
 
     # === INTERNAL METADATA (not part of 39-column output) ===
     ingested_at: Optional[datetime] = None
-    extra_data: Dict[str, Any] = field(default_factory=dict)
+    extra_data: Optional[Dict[str, Any]] = None  # Allocated only when a caller sets it
 
     def __post_init__(self):
         """Normalize data after initialization."""
-        if not self.Scrape_Timestamp:
-            self.Scrape_Timestamp = datetime.utcnow().isoformat()
-        
-        if self.ingested_at is None:
-            self.ingested_at = datetime.utcnow()
+        if not self.Scrape_Timestamp or self.ingested_at is None:
+            iso, now = _stamp()
+            if not self.Scrape_Timestamp:
+                self.Scrape_Timestamp = iso
+            if self.ingested_at is None:
+                self.ingested_at = now
         
         # Ensure Bond_Amount is numeric string
         if isinstance(self.Bond_Amount, (int, float)):
@@ -82,69 +121,60 @@ class ArrestRecord:
             self.Sex = self.Sex.upper()[:1]
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        data = dict(zip(SHEET_FIELDS, _row_getter(self)))
+        data["ingested_at"] = self.ingested_at
+        data["extra_data"] = dict(self.extra_data) if self.extra_data else {}
+        return data
 
     def to_sheet_row(self) -> list:
         """Returns the 39 fields in canonical order."""
-        return [
-            self.Scrape_Timestamp,
-            self.County,
-            self.Booking_Number,
-            self.Person_ID,
-            self.Full_Name,
-            self.First_Name,
-            self.Middle_Name,
-            self.Last_Name,
-            self.DOB,
-            self.Arrest_Date,
-            self.Arrest_Time,
-            self.Booking_Date,
-            self.Booking_Time,
-            self.Status,
-            self.Facility,
-            self.Agency,
-            self.Race,
-            self.Sex,
-            self.Height,
-            self.Weight,
-            self.Address,
-            self.City,
-            self.State,
-            self.ZIP,
-            self.Mugshot_URL,
-            self.Charges,
-            self.Bond_Amount,
-            self.Bond_Paid,
-            self.Bond_Type,
-            self.Court_Type,
-            self.Case_Number,
-            self.Court_Date,
-            self.Court_Time,
-            self.Court_Location,
-            self.Detail_URL,
-            self.Lead_Score,
-            self.Lead_Status,
-            self.LastChecked,
-            self.LastCheckedMode
-        ]
+        return list(_row_getter(self))
 
     @classmethod
     def get_header_row(cls) -> list:
         """Returns the canonical 39-column header row."""
-        return [
-            "Scrape_Timestamp", "County", "Booking_Number", "Person_ID", "Full_Name",
-            "First_Name", "Middle_Name", "Last_Name", "DOB", "Arrest_Date", "Arrest_Time",
-            "Booking_Date", "Booking_Time", "Status", "Facility", "Agency",
-            "Race", "Sex", "Height", "Weight", "Address", "City", "State", "ZIP",
-            "Mugshot_URL", "Charges", "Bond_Amount", "Bond_Paid", "Bond_Type",
-            "Court_Type", "Case_Number", "Court_Date", "Court_Time", "Court_Location",
-            "Detail_URL", "Lead_Score", "Lead_Status", "LastChecked", "LastCheckedMode"
-        ]
+        return list(SHEET_FIELDS)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ArrestRecord':
-        valid_fields = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
-        return cls(**valid_fields)
+        return cls(**{k: v for k, v in data.items() if k in _INIT_FIELDS})
+
+    @classmethod
+    def from_dicts(
+        cls,
+        dicts: Iterable[Dict[str, Any]],
+        timestamp: Optional[datetime] = None,
+        **fixed: Any
+    ) -> List['ArrestRecord']:
+        """
+        Build many records at once; unknown keys are ignored.
+
+        All records share one Scrape_Timestamp / ingested_at (`timestamp`,
+        else the run timestamp, else now) unless a dict carries its own.
+        Keyword arguments override every dict (e.g. County="Lee").
+        """
+        iso, now = (timestamp.isoformat(), timestamp) if timestamp else _stamp()
+        fields = _INIT_FIELDS
+        records = []
+        append = records.append
+        # Records hold no reference cycles; pausing the cyclic GC roughly
+        # halves the cost of building hundreds of thousands of them
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for data in dicts:
+                kwargs = {k: v for k, v in data.items() if k in fields}
+                if fixed:
+                    kwargs.update(fixed)
+                if not kwargs.get("Scrape_Timestamp"):
+                    kwargs["Scrape_Timestamp"] = iso
+                if kwargs.get("ingested_at") is None:
+                    kwargs["ingested_at"] = now
+                append(cls(**kwargs))
+        finally:
+            if gc_enabled:
+                gc.enable()
+        return records
 
     def is_qualified(self, min_score: int = 70) -> bool:
         return self.Lead_Score >= min_score and self.Lead_Status != "Disqualified"
@@ -152,6 +182,11 @@ class ArrestRecord:
     def get_dedup_key(self) -> str:
         return f"{self.County}:{self.Booking_Number}"
 
+# The 39 output columns, in order (dataclass fields minus internal metadata)
+SHEET_FIELDS = tuple(ArrestRecord.__dataclass_fields__)[:39]
+_INIT_FIELDS = frozenset(ArrestRecord.__dataclass_fields__)
+_row_getter = attrgetter(*SHEET_FIELDS)
+
 # Schema metadata
 SCHEMA_VERSION = "3.0"
 SCHEMA_FIELD_COUNT = 39
@@ -17,12 +17,20 @@ Lead Status Mapping:
 - score >= 40: Warm
 - otherwise: Cold
 
+Batch scoring:
+    score_batch() scores a whole set of records column by column: each rule
+    runs once per distinct value of its column (bond amounts, bond types and
+    statuses repeat heavily), charges are checked with one compiled keyword
+    pattern, and breakdown strings are only built with explain=True.
+    score_and_update_batch() writes Lead_Score / Lead_Status back onto a
+    RecordBatch, dicts or ArrestRecords; the pipeline scores each chunk this way.
+
 Author: SWFL Arrest Scrapers Team
 Date: November 24, 2025
 """
 
 import re
-from typing import Tuple, List
+from typing import Any, Dict, Tuple, List
 from python_scrapers.models.arrest_record import ArrestRecord
 
 
@@ -51,6 +59,7 @@ class LeadScorer:
         """Initialize the lead scorer."""
         self.debug_mode = False
         self.score_breakdown = []
+        self.batch_breakdown = []
     
     def score_arrest(self, record: ArrestRecord) -> Tuple[int, str]:
         """
@@ -119,6 +128,53 @@ class LeadScorer:
         
         return total_score, lead_status
     
+    def score_batch(self, records, explain: bool = False) -> Tuple[List[int], List[str]]:
+        """
+        Score many records at once; same rules and results as score_arrest().
+        
+        Args:
+            records: RecordBatch (anything with .column(name)), list of dicts,
+                or list of ArrestRecords
+            explain: Also build per-record reason lists in self.batch_breakdown
+        
+        Returns:
+            Tuple of (scores: List[int], statuses: List[str]), in record order
+        """
+        columns = _column_reader(records)
+        # Absent fields score like ArrestRecord's defaults (Bond_Amount "0"), as from_dict() did
+        bond = _text_column(columns('Bond_Amount'), _FIELD_DEFAULTS['Bond_Amount'])
+        bond_type = _text_column(columns('Bond_Type'))
+        status = _text_column(columns('Status'))
+        charges = _text_column(columns('Charges'))
+        full_name = _text_column(columns('Full_Name'))
+        court_date = _text_column(columns('Court_Date'))
+        
+        # Each rule once per distinct value, then a lookup per record
+        bond_points = _per_value(bond, lambda v: self._score_bond_amount(v)[0])
+        type_points = _per_value(bond_type, lambda v: self._score_bond_type(v)[0])
+        status_points = _per_value(status, lambda v: self._score_status(v)[0])
+        disqualifying = re.compile('|'.join(map(re.escape, self.DISQUALIFYING_CHARGES)), re.IGNORECASE)
+        charge_points = _per_value(charges, lambda v: -100 if disqualifying.search(v) else 0)
+        
+        scores = []
+        for b, t, st, ch, name, court in zip(bond, bond_type, status, charges, full_name, court_date):
+            complete = name.strip() and ch.strip() and b.strip() and court.strip()
+            scores.append(
+                bond_points[b] + type_points[t] + status_points[st] + charge_points[ch]
+                + (15 if complete else -10)
+            )
+        statuses = _per_value(scores, self._determine_lead_status)
+        
+        self.batch_breakdown = []
+        if explain:
+            for b, t, st, ch, name, court in zip(bond, bond_type, status, charges, full_name, court_date):
+                record = ArrestRecord(
+                    Full_Name=name, Charges=ch, Bond_Amount=b, Bond_Type=t, Status=st, Court_Date=court,
+                )
+                self.score_arrest(record)
+                self.batch_breakdown.append(self.get_score_breakdown())
+        return scores, [statuses[score] for score in scores]
+    
     def _score_bond_amount(self, bond_amount: str) -> Tuple[int, str]:
         """
         Score based on bond amount.
@@ -356,6 +412,28 @@ class LeadScorer:
         return record
 
 
+def _column_reader(records):
+    """name -> list of values, for a RecordBatch, dicts or ArrestRecords."""
+    if hasattr(records, 'column'):
+        return records.column
+    records = records if isinstance(records, list) else list(records)
+    if records and isinstance(records[0], dict):
+        return lambda name: [r.get(name) for r in records]
+    return lambda name: [getattr(r, name, None) for r in records]
+
+
+_FIELD_DEFAULTS = {name: f.default for name, f in ArrestRecord.__dataclass_fields__.items()}
+
+
+def _text_column(values, default: str = '') -> List[str]:
+    return [default if v is None else v if isinstance(v, str) else str(v) for v in values]
+
+
+def _per_value(values, fn) -> Dict[Any, Any]:
+    """{value: fn(value)} over the distinct values."""
+    return {v: fn(v) for v in set(values)}
+
+
 # Convenience function for quick scoring
 def score_arrest(record: ArrestRecord) -> Tuple[int, str]:
     """
@@ -404,3 +482,37 @@ def score_and_update(record: ArrestRecord) -> ArrestRecord:
     """
     scorer = LeadScorer()
     return scorer.score_and_update(record)
+
+
+def score_and_update_batch(records):
+    """
+    Score a batch and write Lead_Score / Lead_Status back onto it.
+    
+    Args:
+        records: RecordBatch, list of dicts or list of ArrestRecords
+    
+    Returns:
+        The same records, updated in place
+    
+    Example:
+        >>> from core.batch import RecordBatch
+        >>> batch = RecordBatch.from_records(raw_records)
+        >>> score_and_update_batch(batch)
+        >>> batch.column('Lead_Status')[:3]
+        ['Hot', 'Cold', 'Warm']
+    """
+    if not hasattr(records, 'column'):
+        records = records if isinstance(records, list) else list(records)
+    scores, statuses = LeadScorer().score_batch(records)
+    if hasattr(records, 'set_column'):
+        records.set_column('Lead_Score', scores)
+        records.set_column('Lead_Status', statuses)
+    else:
+        for record, score, status in zip(records, scores, statuses):
+            if isinstance(record, dict):
+                record['Lead_Score'] = score
+                record['Lead_Status'] = status
+            else:
+                record.Lead_Score = score
+                record.Lead_Status = status
+    return records
@@ -18,7 +18,7 @@ import json
 import subprocess
 import argparse
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
@@ -28,58 +28,30 @@ from python_scrapers.scoring.lead_scorer import score_and_update
 from python_scrapers.writers.sheets_writer import SheetsWriter
 
 
-def convert_to_arrest_record(raw_data: dict) -> ArrestRecord:
-    """Convert raw scraper data to ArrestRecord object."""
-    
+def convert_to_arrest_records(raw_records: List[dict], timestamp: Optional[datetime] = None) -> List[ArrestRecord]:
+    """Convert raw scraper data to ArrestRecord objects sharing `timestamp` (default: utcnow)."""
+    timestamp = timestamp or datetime.utcnow()
+    now = timestamp.isoformat()
+
     # Map raw fields to ArrestRecord schema v3.0 (39 columns)
-    record = ArrestRecord(
+    records = ArrestRecord.from_dicts(
+        ({'Status': 'IN CUSTODY', **raw} for raw in raw_records),
+        timestamp=timestamp,
         County="Charlotte",
-        Booking_Number=raw_data.get('Booking_Number', ''),
-        Person_ID=raw_data.get('Person_ID', ''),
-        Full_Name=raw_data.get('Full_Name', ''),
-        First_Name=raw_data.get('First_Name', ''),
-        Middle_Name=raw_data.get('Middle_Name', ''),
-        Last_Name=raw_data.get('Last_Name', ''),
-        DOB=raw_data.get('DOB', ''),
-        Arrest_Date=raw_data.get('Arrest_Date', ''),
-        Arrest_Time=raw_data.get('Arrest_Time', ''),
-        Booking_Date=raw_data.get('Booking_Date', ''),
-        Booking_Time=raw_data.get('Booking_Time', ''),
-        Status=raw_data.get('Status', 'IN CUSTODY'),
-        Facility=raw_data.get('Facility', ''),
-        Agency=raw_data.get('Agency', ''),
-        Race=raw_data.get('Race', ''),
-        Sex=raw_data.get('Sex', ''),
-        Height=raw_data.get('Height', ''),
-        Weight=raw_data.get('Weight', ''),
-        Address=raw_data.get('Address', ''),
-        City=raw_data.get('City', ''),
-        State=raw_data.get('State', 'FL'),
-        ZIP=raw_data.get('ZIP', ''),
-        Mugshot_URL=raw_data.get('Mugshot_URL', ''),
-        Charges=raw_data.get('Charges', ''),
-        Bond_Amount=raw_data.get('Bond_Amount', '0'),
-        Bond_Paid=raw_data.get('Bond_Paid', 'NO'),
-        Bond_Type=raw_data.get('Bond_Type', ''),
-        Court_Type=raw_data.get('Court_Type', ''),
-        Case_Number=raw_data.get('Case_Number', ''),
-        Court_Date=raw_data.get('Court_Date', ''),
-        Court_Time=raw_data.get('Court_Time', ''),
-        Court_Location=raw_data.get('Court_Location', ''),
-        Detail_URL=raw_data.get('Detail_URL', ''),
         Lead_Score=0,
         Lead_Status="WARM",
-        LastChecked=datetime.utcnow().isoformat(),
+        LastChecked=now,
         LastCheckedMode="INITIAL"
     )
-    
+
     # Chronological Fallback Logic
-    if not record.Booking_Date and record.Arrest_Date:
-        record.Booking_Date = record.Arrest_Date
-    if not record.Booking_Time and record.Arrest_Time:
-        record.Booking_Time = record.Arrest_Time
-        
-    return record
+    for record in records:
+        if not record.Booking_Date and record.Arrest_Date:
+            record.Booking_Date = record.Arrest_Date
+        if not record.Booking_Time and record.Arrest_Time:
+            record.Booking_Time = record.Arrest_Time
+
+    return records
 
 
 def main():
@@ -144,15 +116,19 @@ def main():
     
     # Convert to ArrestRecord objects
     print(f"\n[>] Converting to ArrestRecord objects...")
-    records = []
-    for raw in raw_records:
-        try:
-            record = convert_to_arrest_record(raw)
-            records.append(record)
-            print(f"   [OK] {record.Full_Name} ({record.Booking_Number})")
-        except Exception as e:
-            print(f"   [WARN] Failed to convert record: {e}")
-            continue
+    run_timestamp = datetime.utcnow()
+    try:
+        records = convert_to_arrest_records(raw_records, run_timestamp)
+    except Exception:
+        # Fall back to one at a time so a single bad record doesn't drop the rest
+        records = []
+        for raw in raw_records:
+            try:
+                records.extend(convert_to_arrest_records([raw], run_timestamp))
+            except Exception as e:
+                print(f"   [WARN] Failed to convert record: {e}")
+    for record in records:
+        print(f"   [OK] {record.Full_Name} ({record.Booking_Number})")
     
     print(f"\n[OK] Converted {len(records)} records")
     
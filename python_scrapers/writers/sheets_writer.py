@@ -7,7 +7,7 @@ Supports writing to county-specific tabs and the Qualified_Arrests sheet.
 Features:
 - 34-column output (32 original + Lead_Score + Lead_Status)
 - Automatic header creation
-- Deduplication based on County + Booking_Number
+- Deduplication based on County + Booking_Number (shared local index, core/dedup_index.py)
 - Qualified arrests filtering (score >= 70)
 - Batch writing for performance
 
@@ -22,8 +22,10 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 import gspread
 from google.oauth2.service_account import Credentials
+from core.dedup_index import get_index, sheet_sink
+from core.sheets_quota import install_quota
 from python_scrapers.models.arrest_record import ArrestRecord
-from python_scrapers.scoring.lead_scorer import score_and_update
+from python_scrapers.scoring.lead_scorer import score_and_update_batch
 
 
 class SheetsWriter:
@@ -98,7 +100,7 @@ class SheetsWriter:
                 scopes=self.SCOPES
             )
         
-        self.client = gspread.authorize(self.credentials)
+        self.client = install_quota(gspread.authorize(self.credentials))  # Paced to the Sheets API quota
         self.spreadsheet = self.client.open_by_key(spreadsheet_id)
     
     def write_records(
@@ -138,7 +140,7 @@ class SheetsWriter:
         
         # Auto-score records if needed
         if auto_score:
-            records = [score_and_update(r) if r.Lead_Score == 0 else r for r in records]
+            score_and_update_batch([r for r in records if r.Lead_Score == 0])
         
         # Get or create the county sheet
         sheet = self._get_or_create_sheet(county)
@@ -149,7 +151,7 @@ class SheetsWriter:
         # Get existing records for deduplication
         existing_keys = set()
         if deduplicate:
-            existing_keys = self._get_existing_dedup_keys(sheet)
+            existing_keys = self._get_existing_dedup_keys(sheet, records)
         
         # Filter out duplicates
         new_records = []
@@ -167,6 +169,7 @@ class SheetsWriter:
         if new_records:
             rows = [record.to_sheet_row() for record in new_records]
             sheet.insert_rows(rows, row=2, value_input_option='USER_ENTERED')
+            self._remember_dedup_keys(sheet, new_records)
         
         # Count qualified records
         qualified_count = sum(1 for r in new_records if r.is_qualified(self.qualified_min_score))
@@ -201,7 +204,7 @@ class SheetsWriter:
         self._ensure_header_row(sheet)
         
         # Get existing keys to avoid duplicates
-        existing_keys = self._get_existing_dedup_keys(sheet)
+        existing_keys = self._get_existing_dedup_keys(sheet, records)
         
         # Filter out duplicates
         new_records = []
@@ -214,6 +217,7 @@ class SheetsWriter:
         if new_records:
             rows = [record.to_sheet_row() for record in new_records]
             sheet.insert_rows(rows, row=2, value_input_option='USER_ENTERED')
+            self._remember_dedup_keys(sheet, new_records)
     
     def _get_or_create_sheet(self, sheet_name: str) -> gspread.Worksheet:
         """
@@ -261,33 +265,73 @@ class SheetsWriter:
         })
         sheet.freeze(rows=1)
     
-    def _get_existing_dedup_keys(self, sheet: gspread.Worksheet) -> set:
+    def _get_existing_dedup_keys(
+        self,
+        sheet: gspread.Worksheet,
+        records: Optional[List[ArrestRecord]] = None
+    ) -> set:
         """
-        Get all existing deduplication keys from a sheet.
+        Get the existing deduplication keys of a sheet.
         
         Dedup key format: County:Booking_Number
         
+        With the local dedup index enabled, only the keys of `records` are
+        looked up there (the index is seeded from the sheet the first time).
+        Otherwise every row of the sheet is read.
+        
         Args:
             sheet: Worksheet instance
+            records: Records about to be written
         
         Returns:
             Set of dedup key strings
         """
+        index = get_index()
+        if index is None or records is None:
+            return self._read_dedup_keys(sheet) or set()
+        
+        sink = sheet_sink(self.spreadsheet_id, sheet.title)
+        if not index.is_seeded(sink):
+            existing = self._read_dedup_keys(sheet)
+            if existing is None:
+                return set()
+            index.rebuild(sink, [tuple(k.split(':', 1)) for k in existing])
+        
+        known = index.known(sink, [(r.County, r.Booking_Number) for r in records])
+        return {f"{county}:{booking}" for county, booking in known}
+    
+    def _remember_dedup_keys(self, sheet: gspread.Worksheet, records: List[ArrestRecord]) -> None:
+        """Record the keys of rows just inserted in the local dedup index."""
+        index = get_index()
+        if index is None:
+            return
         try:
-            # Get all data
-            all_values = sheet.get_all_values()
-            
-            if len(all_values) <= 1:
-                return set()  # Only header or empty
+            index.add(
+                sheet_sink(self.spreadsheet_id, sheet.title),
+                [(r.County, r.Booking_Number) for r in records]
+            )
+        except Exception as e:
+            print(f"Warning: Could not update dedup index: {e}")
+    
+    def _read_dedup_keys(self, sheet: gspread.Worksheet) -> Optional[set]:
+        """
+        Read every deduplication key from a sheet.
+        
+        Args:
+            sheet: Worksheet instance
+        
+        Returns:
+            Set of dedup key strings (None if the sheet could not be read)
+        """
+        try:
+            # Master Schema columns: County = B, Booking_Number = C.
+            # Only those two columns are read (not all 39), below the header.
+            values = sheet.get('B2:C')
             
-            # Master Schema Indices:
-            # County = Index 1
-            # Booking_Number = Index 2
             dedup_keys = set()
-            for row in all_values[1:]:  # Skip header
-                if len(row) > 2:
-                    county = row[1] if len(row) > 1 else ""
-                    booking_number = row[2] if len(row) > 2 else ""
+            for row in values:
+                if len(row) > 1:
+                    county, booking_number = row[0], row[1]
                     if booking_number and county:
                         dedup_keys.add(f"{county}:{booking_number}")
             
@@ -295,7 +339,7 @@ class SheetsWriter:
         
         except Exception as e:
             print(f"Warning: Could not get existing dedup keys: {e}")
-            return set()
+            return None
     
     def log_ingestion(
         self,
@@ -392,11 +436,17 @@ class SheetsWriter:
             sheet = self.spreadsheet.worksheet(sheet_name)
             
             if keep_header:
-                # Clear everything except row 1
-                sheet.batch_clear(['A2:AM10000'])
+                # Clear everything except row 1 (every row and column, however large the tab)
+                if sheet.row_count > 1:
+                    sheet.batch_clear([f'2:{sheet.row_count}'])
             else:
                 # Clear everything
                 sheet.clear()
+            
+            # Cleared rows are no longer duplicates
+            index = get_index()
+            if index is not None:
+                index.forget(sheet_sink(self.spreadsheet_id, sheet.title))
         
         except gspread.WorksheetNotFound:
             print(f"Warning: Sheet '{sheet_name}' not found")
@@ -1,28 +1,167 @@
 #!/usr/bin/env python3
 """
-CLI — Run all active county scrapers sequentially.
+CLI — Run all active county scrapers, in parallel.
+
+Counties run concurrently on a worker pool. Per-class caps keep the number of
+Chromium counties (scraper.needs_browser: true) bounded while requests-only
+counties (SmartCOP, A–Z searches, APIs) fill the remaining workers. Limits
+come from the `orchestrator` section of config/global.yaml.
 
 Usage:
     python scripts/run_all.py
     python scripts/run_all.py --dry-run
     python scripts/run_all.py --only charlotte,collier
+    python scripts/run_all.py --workers 1            # sequential (old behavior)
+    python scripts/run_all.py --browser-limit 1 --json
 """
 
 import sys
+import json
+import time
 import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(REPO_ROOT))
 
-from core.config_loader import load_config, get_active_counties
+from core.config_loader import load_config, load_global_config, get_active_counties
 from core.logging_config import get_logger
+from core.orchestrator import ConcurrencySlots, county_class, county_platform, run_one
+from core.http import http_stats
+from core.normalizer import date_stats
+from core.stealth import wait_stats
+from core.sheets_batch import batch_stats
+from core.sheets_quota import quota_stats
+from core.outbox import drain_outbox, outbox_stats
+
+
+def run_counties(counties: list[str], workers: int, class_limits: dict,
+                 platform_limits: dict, dry_run: bool, logger) -> dict:
+    """
+    Dispatch counties onto a worker pool honoring per-class/platform caps.
+
+    Browser counties are queued first — they are the long poles, so starting
+    them early keeps wall-clock time close to the slowest single county.
+    """
+    results = {}
+    meta = {}
+    for county in counties:
+        try:
+            config = load_config(county)
+            meta[county] = (county_class(config), county_platform(config))
+        except Exception as e:
+            results[county] = {"status": "failed", "error": f"config: {e}", "duration_s": 0.0}
+
+    queue = deque(sorted(meta, key=lambda c: (meta[c][0] != "browser", counties.index(c))))
+    slots = ConcurrencySlots(class_limits, platform_limits)
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        while queue or running:
+            # Start every queued county that fits under the caps
+            for county in list(queue):
+                if len(running) >= workers:
+                    break
+                cls, platform = meta[county]
+                if not slots.can_start(cls, platform):
+                    continue
+                queue.remove(county)
+                slots.acquire(cls, platform)
+                logger.info(f"▶ {county} started ({cls}{', ' + platform if platform else ''})")
+                running[pool.submit(run_one, county, dry_run)] = county
+
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                county = running.pop(future)
+                cls, platform = meta[county]
+                slots.release(cls, platform)
+                entry = future.result()
+                entry["class"], entry["platform"] = cls, platform
+                results[county] = entry
+                logger.info(
+                    f"■ {county} {entry['status']} in {entry['duration_s']}s "
+                    f"({entry.get('new', 0)} new)"
+                )
+
+    return results
+
+
+def build_summary(results: dict, started_at: datetime, wall_seconds: float, workers: int) -> dict:
+    """Structured run summary: per-county entries plus totals."""
+    county_seconds = sum(r.get("duration_s", 0.0) for r in results.values())
+    slowest = max(results.items(), key=lambda kv: kv[1].get("duration_s", 0.0), default=(None, {}))
+    return {
+        "started_at": started_at.isoformat(timespec="seconds"),
+        "finished_at": datetime.now().isoformat(timespec="seconds"),
+        "workers": workers,
+        "wall_seconds": round(wall_seconds, 1),
+        "county_seconds": round(county_seconds, 1),
+        "slowest_county": slowest[0],
+        "slowest_seconds": slowest[1].get("duration_s", 0.0),
+        "totals": {
+            "counties": len(results),
+            "ok": sum(1 for r in results.values() if r["status"] == "ok"),
+            "failed": sum(1 for r in results.values() if r["status"] != "ok"),
+            "new": sum(r.get("new", 0) for r in results.values()),
+            "qualified": sum(r.get("qualified", 0) for r in results.values()),
+            "changed": sum(r.get("changed", 0) for r in results.values()),
+            "unchanged_records": sum(r.get("unchanged_records", 0) for r in results.values()),
+            "unchanged": sum(1 for r in results.values() if r.get("unchanged")),
+        },
+        "counties": results,
+        "page_waits": wait_stats(),
+        "http": http_stats(),
+        "dates": date_stats(),
+        "sheets_batch": batch_stats(),
+        "sheets_quota": quota_stats(),
+        "outbox": outbox_stats(),
+    }
+
+
+def print_summary(summary: dict):
+    print(f"\n{'='*60}")
+    print("SCRAPER RUN SUMMARY")
+    print(f"{'='*60}")
+    for county, entry in sorted(summary["counties"].items()):
+        status = "✅" if entry["status"] == "ok" else "❌"
+        detail = f"{entry.get('new', 0)} new records" if entry["status"] == "ok" else entry.get("error")
+        if entry.get("unchanged"):
+            detail = "source unchanged"
+        print(f"  {status} {county.title()}: {detail} ({entry.get('duration_s', 0)}s)")
+    totals = summary["totals"]
+    print(f"{'-'*60}")
+    print(
+        f"  {totals['ok']}/{totals['counties']} ok, {totals['new']} new, "
+        f"{totals['changed']} changed, {totals['unchanged_records']} unchanged, "
+        f"{totals['qualified']} qualified"
+    )
+    print(
+        f"  Wall {summary['wall_seconds']}s vs {summary['county_seconds']}s sequential "
+        f"(slowest: {summary['slowest_county']} {summary['slowest_seconds']}s, "
+        f"workers={summary['workers']})"
+    )
 
 
 def main():
+    orchestrator = load_global_config().get("orchestrator", {}) or {}
+    concurrency = orchestrator.get("concurrency", {}) or {}
+
     parser = argparse.ArgumentParser(description="Run all active county scrapers")
     parser.add_argument("--dry-run", action="store_true")
     parser.add_argument("--only", type=str, help="Comma-separated list of counties")
+    parser.add_argument("--workers", type=int, default=orchestrator.get("workers", 1),
+                        help="Counties to run concurrently (1 = sequential)")
+    parser.add_argument("--browser-limit", type=int, default=concurrency.get("browser", 0),
+                        help="Max Chromium counties at once (0 = unlimited)")
+    parser.add_argument("--requests-limit", type=int, default=concurrency.get("requests", 0),
+                        help="Max requests-only counties at once (0 = unlimited)")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON")
     args = parser.parse_args()
 
     logger = get_logger("system")
@@ -32,28 +171,33 @@ def main():
     else:
         counties = get_active_counties()
 
-    logger.info(f"Running {len(counties)} counties: {counties}")
-    results = {}
+    workers = max(1, args.workers)
+    class_limits = {"browser": args.browser_limit, "requests": args.requests_limit}
+    logger.info(
+        f"Running {len(counties)} counties with {workers} workers "
+        f"(browser≤{args.browser_limit or '∞'}, requests≤{args.requests_limit or '∞'}): {counties}"
+    )
 
-    for county in counties:
-        try:
-            import importlib
-            runner = importlib.import_module(f"counties.{county}.runner")
-            config = load_config(county)
-            stats = runner.run(county, config, dry_run=args.dry_run)
-            results[county] = stats
-        except Exception as e:
-            logger.error(f"{county}: {e}")
-            results[county] = {"error": str(e)}
+    started_at = datetime.now()
+    t0 = time.monotonic()
+    results = run_counties(
+        counties, workers, class_limits,
+        orchestrator.get("platform_limits", {}) or {},
+        args.dry_run, logger,
+    )
+    # Outbox entries must be delivered before this process (and a CI workspace) goes away
+    delivered = args.dry_run or drain_outbox()
+    if not args.dry_run and "core.writers.sheets_writer" in sys.modules:
+        # Qualified_Arrests / Ingestion_Log take every county's rows; rotate once all are done
+        sys.modules["core.writers.sheets_writer"].rotate_shared_tabs()
+    summary = build_summary(results, started_at, time.monotonic() - t0, workers)
 
-    # Summary
-    print(f"\n{'='*60}")
-    print("SCRAPER RUN SUMMARY")
-    print(f"{'='*60}")
-    for county, stats in results.items():
-        status = "❌" if stats.get("error") or stats.get("errors") else "✅"
-        new = stats.get("new_records", "?")
-        print(f"  {status} {county.title()}: {new} new records")
+    if args.json:
+        print(json.dumps(summary, indent=2, default=str))
+    else:
+        print_summary(summary)
+    if not delivered:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
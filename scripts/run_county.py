@@ -6,6 +6,7 @@ Usage:
     python scripts/run_county.py charlotte
     python scripts/run_county.py charlotte --days-back 7 --dry-run
     python scripts/run_county.py charlotte --max-pages 5
+    python scripts/run_county.py charlotte --rebuild-index   # re-seed dedup keys from the sheet first
 """
 
 import sys
@@ -18,6 +19,7 @@ REPO_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(REPO_ROOT))
 
 from core.config_loader import load_config, get_active_counties
+from core.outbox import drain_outbox
 
 
 def main():
@@ -31,6 +33,8 @@ def main():
     parser.add_argument("--max-pages", type=int, default=None)
     parser.add_argument("--dry-run", action="store_true", help="Don't write to Sheets")
     parser.add_argument("--no-slack", action="store_true", help="Skip Slack notifications")
+    parser.add_argument("--rebuild-index", action="store_true",
+                        help="Re-seed the local dedup index from the county's sheet tab before running")
     args = parser.parse_args()
 
     county = args.county.lower().replace(" ", "_").replace("-", "_")
@@ -71,6 +75,16 @@ def main():
         traceback.print_exc()
         sys.exit(1)
 
+    if args.rebuild_index:
+        import os
+        from core.writers.sheets_writer import SheetsWriter
+        sheets_id = os.getenv("GOOGLE_SHEETS_ID")
+        if not sheets_id:
+            sys.stderr.write("❌ GOOGLE_SHEETS_ID not set, cannot rebuild the dedup index\n")
+            sys.exit(1)
+        count = SheetsWriter(sheets_id).rebuild_index(county)
+        sys.stderr.write(f"🔁 Dedup index for '{county}' rebuilt from the sheet ({count} keys)\n")
+
     stats = runner_module.run_pipeline(
         county,
         days_back=args.days_back,
@@ -78,6 +92,10 @@ def main():
         dry_run=args.dry_run
     )
 
+    # One-shot run: wait for the outbox to deliver, and fail if records are left behind
+    if not args.dry_run and not drain_outbox():
+        sys.exit(1)
+
     if stats is None:
         sys.exit(1)
 
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+CLI — Resident scheduler daemon: runs county pipelines in-process on their cron.
+
+Each county fires on its `schedule.cron` (or `schedule_cron` from
+_defaults.yaml). Unlike one cold `run_county.py` process per tick, the daemon
+keeps imported solvers, parsed YAML, the authorized Sheets client and pooled
+HTTP/browser resources warm between cycles. Concurrency caps come from the
+`orchestrator` section of config/global.yaml, same as run_all.py.
+
+A county that is still running when it comes due again is skipped for that
+tick (never overlapped). SIGINT/SIGTERM stop scheduling and wait for running
+counties to finish.
+
+Usage:
+    python scripts/run_daemon.py
+    python scripts/run_daemon.py --only lee,charlotte --run-now
+    python scripts/run_daemon.py --dry-run --workers 2
+"""
+
+import sys
+import signal
+import argparse
+import importlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from core.config_loader import load_config, load_global_config, get_active_counties
+from core.logging_config import get_logger
+from core.orchestrator import ConcurrencySlots, county_class, county_platform, run_one
+from core.schedule import CronSchedule, get_schedule_cron
+
+CONFIG_CHECK_INTERVAL = timedelta(minutes=1)  # How often county configs are re-checked for edits
+
+
+def warm_up(counties: list[str], logger):
+    """Import runners/solvers and authorize Sheets once, before the first tick."""
+    for county in counties:
+        for module in (f"counties.{county}.runner", f"counties.{county}.solver"):
+            try:
+                importlib.import_module(module)
+            except (Exception, SystemExit) as e:
+                logger.warning(f"Warm-up import failed for {module}: {e}")
+
+    import os
+    sheets_id = os.getenv("GOOGLE_SHEETS_ID")
+    if sheets_id:
+        try:
+            from core.writers.sheets_writer import open_spreadsheet
+            open_spreadsheet(sheets_id)
+            logger.info("Sheets client authorized")
+        except Exception as e:
+            logger.warning(f"Sheets warm-up failed (will retry on first write): {e}")
+
+
+def load_schedules(counties: list[str], logger) -> dict:
+    """Return county → (CronSchedule, class, platform), skipping bad configs."""
+    schedules = {}
+    for county in counties:
+        try:
+            config = load_config(county)
+            cron = CronSchedule(get_schedule_cron(config))
+            schedules[county] = (cron, county_class(config), county_platform(config))
+        except Exception as e:
+            logger.error(f"{county}: not scheduled — {e}")
+    return schedules
+
+
+def main():
+    orchestrator = load_global_config().get("orchestrator", {}) or {}
+    concurrency = orchestrator.get("concurrency", {}) or {}
+
+    parser = argparse.ArgumentParser(description="Resident county scheduler daemon")
+    parser.add_argument("--only", type=str, help="Comma-separated list of counties")
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--run-now", action="store_true", help="Run every county once at startup")
+    parser.add_argument("--workers", type=int, default=orchestrator.get("workers", 1))
+    parser.add_argument("--browser-limit", type=int, default=concurrency.get("browser", 0))
+    parser.add_argument("--requests-limit", type=int, default=concurrency.get("requests", 0))
+    parser.add_argument("--tick", type=float, default=15.0, help="Scheduler poll interval (seconds)")
+    args = parser.parse_args()
+
+    logger = get_logger("system")
+    stop = threading.Event()
+
+    def _request_stop(signum, _frame):
+        logger.info(f"Signal {signum} received — finishing running counties, then exiting")
+        stop.set()
+
+    signal.signal(signal.SIGINT, _request_stop)
+    signal.signal(signal.SIGTERM, _request_stop)
+
+    def _counties() -> list[str]:
+        if args.only:
+            return [c.strip().lower() for c in args.only.split(",")]
+        return get_active_counties()
+
+    counties = _counties()
+    warm_up(counties, logger)
+
+    # Deliver whatever an earlier process left in the outbox; workers keep running
+    if not args.dry_run:
+        from core.outbox import get_outbox
+        outbox = get_outbox()
+        if outbox is not None:
+            outbox.start()
+            logger.info(f"Outbox workers started ({outbox.pending()} entries pending)")
+
+    now = datetime.now()
+    schedules = load_schedules(counties, logger)
+    next_run = {
+        county: now if args.run_now else cron.next_after(now)
+        for county, (cron, _, _) in schedules.items()
+    }
+    logger.info(f"Daemon started: {len(schedules)} counties, workers={args.workers}")
+
+    slots = ConcurrencySlots(
+        {"browser": args.browser_limit, "requests": args.requests_limit},
+        orchestrator.get("platform_limits", {}) or {},
+    )
+    running = {}  # county → future
+    rotation = (load_global_config().get("sheets", {}) or {}).get("rotation", {}) or {}
+    rotation_interval = timedelta(minutes=float(rotation.get("check_interval_minutes", 60)))
+    last_config_check = last_rotation = now
+    was_idle = False
+
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        while not stop.is_set():
+            # Reap finished counties
+            for county, future in list(running.items()):
+                if not future.done():
+                    continue
+                del running[county]
+                _, cls, platform = schedules.get(county, (None, "requests", ""))
+                slots.release(cls, platform)
+                entry = future.result()
+                logger.info(
+                    f"■ {county} {entry['status']} in {entry['duration_s']}s "
+                    f"({entry.get('new', 0)} new) — next {next_run.get(county)}"
+                )
+
+            # Pick up config edits (cached loader only re-parses changed files)
+            current = None
+            if datetime.now() - last_config_check >= CONFIG_CHECK_INTERVAL:
+                last_config_check = datetime.now()
+                current = _counties()
+            if current is not None and (set(current) != set(schedules) or any(
+                get_schedule_cron(load_config(c)) != schedules[c][0].expr for c in schedules
+            )):
+                schedules = load_schedules(current, logger)
+                now = datetime.now()
+                for county, (cron, _, _) in schedules.items():
+                    if county not in next_run or next_run[county] > cron.next_after(now):
+                        next_run[county] = cron.next_after(now)
+
+            # Dispatch everything that is due, oldest due first
+            now = datetime.now()
+            due = sorted((c for c in schedules if next_run.get(c, now) <= now), key=next_run.get)
+            for county in due:
+                cron, cls, platform = schedules[county]
+                if county in running:
+                    logger.warning(f"{county} still running at {now:%H:%M} — skipping this tick")
+                    next_run[county] = cron.next_after(now)
+                    continue
+                if len(running) >= args.workers or not slots.can_start(cls, platform):
+                    continue  # stays due; starts when a slot frees up
+                slots.acquire(cls, platform)
+                next_run[county] = cron.next_after(now)
+                logger.info(f"▶ {county} started ({cls})")
+                running[county] = pool.submit(run_one, county, args.dry_run)
+
+            # Close pooled Chromium processes nobody has used for a while
+            if "core.browser" in sys.modules:
+                sys.modules["core.browser"].get_browser_pool().reap_idle()
+
+            # Send batched Sheets inserts that have waited sheets.batch.max_delay_seconds
+            if "core.sheets_batch" in sys.modules:
+                sys.modules["core.sheets_batch"].flush_due()
+
+            # Between runs, archive old rows of the shared tabs (every
+            # check_interval_minutes), and once per idle spell re-read Sheets
+            # headers / tabs on the next write (picks up hand edits)
+            sheets_writer = sys.modules.get("core.writers.sheets_writer")
+            if not running and sheets_writer is not None:
+                if not args.dry_run and now - last_rotation >= rotation_interval:
+                    last_rotation = now
+                    sheets_writer.rotate_shared_tabs()
+                if not was_idle:
+                    sheets_writer.clear_sheet_cache()
+            was_idle = not running
+
+            stop.wait(args.tick)
+
+        logger.info(f"Waiting for {len(running)} running counties…")
+
+    logger.info("Daemon stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""Tests for core.browser.navigate() (every browser navigation takes a rate-limit token)."""
+
+import pytest
+
+pytest.importorskip("DrissionPage")
+
+import core.browser as browser  # noqa: E402
+
+
+class FakePage:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def get(self, url, **kwargs):
+        self.calls.append(("get", url, kwargs))
+        return True
+
+
+def test_navigate_throttles_before_loading(monkeypatch):
+    calls = []
+    monkeypatch.setattr(browser, "throttle", lambda url, county=None: calls.append(("throttle", url, county)))
+
+    assert browser.navigate(FakePage(calls), "https://example.org/inmates", "duval", timeout=30)
+    assert calls == [
+        ("throttle", "https://example.org/inmates", "duval"),
+        ("get", "https://example.org/inmates", {"timeout": 30}),
+    ]
@@ -0,0 +1,102 @@
+"""Tests for core/dedup_index.py and ChangeDetector (fingerprints held until the chunk is written)."""
+
+import sys
+import types
+
+import pytest
+
+from core.dedup import ChangeDetector
+from core.dedup_index import DedupIndex
+
+
+@pytest.fixture
+def index(tmp_path):
+    idx = DedupIndex(tmp_path / "dedup_index.sqlite3")
+    yield idx
+    idx.close()
+
+
+def _record(booking, status="IN CUSTODY", bond="500", county="Lee"):
+    return {"County": county, "Booking_Number": booking, "Full_Name": "DOE, JOHN",
+            "Status": status, "Bond_Amount": bond, "Charges": "DUI"}
+
+
+def test_index_fingerprints_round_trip(index):
+    assert index.fingerprints([("Lee", "1")]) == {}
+    index.set_fingerprints({("Lee", "1"): ("abc", "IN CUSTODY")})
+    assert index.fingerprints([("Lee", "1"), ("Lee", "2")]) == {("Lee", "1"): "abc"}
+
+
+def test_index_known_per_sink(index):
+    index.add("mongo", [("Lee", "1")])
+    assert index.known("mongo", [("Lee", "1"), ("Lee", "2")]) == {("Lee", "1")}
+    assert index.known("sheets:x:Lee", [("Lee", "1")]) == set()
+
+
+def test_new_changed_unchanged(index):
+    first = ChangeDetector("Lee", index=index)
+    assert len(first.filter([_record("1"), _record("2")])) == 2
+    first.commit()
+
+    second = ChangeDetector("Lee", index=index)
+    kept = second.filter([_record("1"), _record("2", bond="5000"), _record("3")])
+    assert [r["Booking_Number"] for r in kept] == ["2", "3"]
+    assert second.counts == {"new": 1, "changed": 1, "unchanged": 1}
+
+
+def test_uncommitted_chunk_passes_again(index):
+    changes = ChangeDetector("Lee", index=index)
+    changes.filter([_record("1")])  # Write failed: no commit
+    assert len(ChangeDetector("Lee", index=index).filter([_record("1")])) == 1
+
+
+def test_discard_drops_only_failed_records(index):
+    changes = ChangeDetector("Lee", index=index)
+    changes.filter([_record("1")])
+    failed = changes.filter([_record("2")])
+    changes.discard(failed)
+    changes.commit()
+
+    again = ChangeDetector("Lee", index=index)
+    assert [r["Booking_Number"] for r in again.filter([_record("1"), _record("2")])] == ["2"]
+
+
+def test_runner_mongo_failure_is_resent_next_run(index, tmp_path, monkeypatch):
+    """With the outbox off, a failed Mongo write must not fingerprint the chunk."""
+    pytest.importorskip("requests")
+    import core.writers.json_writer as json_writer
+    import core.writers.mongo_writer as mongo_writer
+    import counties.lee.runner as runner
+
+    solver = types.ModuleType("counties.lee.solver")
+    solver.scrape_lee = lambda days_back=1, max_pages=1: [_record("1"), _record("2")]
+    monkeypatch.setitem(sys.modules, "counties.lee.solver", solver)
+    monkeypatch.setenv("MONGODB_URI", "mongodb://example.invalid")
+    monkeypatch.delenv("GOOGLE_SHEETS_ID", raising=False)
+    monkeypatch.setattr(json_writer, "REPO_ROOT", tmp_path)
+    # Only the Sheets import is reached (GOOGLE_SHEETS_ID is unset); gspread is not needed
+    sheets_writer = types.ModuleType("core.writers.sheets_writer")
+    sheets_writer.SheetsWriter = None
+    monkeypatch.setitem(sys.modules, "core.writers.sheets_writer", sheets_writer)
+    monkeypatch.setattr(runner, "get_outbox", lambda: None)
+    monkeypatch.setattr(runner, "get_person_index", lambda: None)
+    monkeypatch.setattr(runner, "ChangeDetector", lambda county: ChangeDetector(county, index=index))
+    monkeypatch.setattr(runner, "advance_watermark", lambda *args: None)
+    monkeypatch.setattr(runner, "notify_slack", lambda **kwargs: None)
+
+    written = []
+
+    def write_to_mongo(records, county="Unknown", strict=False):
+        if not written:
+            written.append(None)
+            raise RuntimeError("Atlas unreachable")
+        written.append([r["Booking_Number"] for r in records])
+        return {"inserted": len(records), "updated": 0, "errors": 0, "total": len(records)}
+
+    monkeypatch.setattr(mongo_writer, "write_to_mongo", write_to_mongo)
+
+    runner.run_pipeline("lee", days_back=1, max_pages=1)
+    runner.run_pipeline("lee", days_back=1, max_pages=1)
+    assert written == [None, ["1", "2"]]
+    runner.run_pipeline("lee", days_back=1, max_pages=1)
+    assert len(written) == 2  # Delivered and fingerprinted: unchanged now
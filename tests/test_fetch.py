@@ -0,0 +1,77 @@
+"""Tests for core/fetch.py (per-thread sessions over one connection pool)."""
+
+import threading
+
+import pytest
+
+requests = pytest.importorskip("requests")
+
+from core.fetch import FetchEngine, FetchRequest, fetch_all  # noqa: E402
+
+
+class RecordingAdapter(requests.adapters.BaseAdapter):
+    """Answers 200 and records which session (via its thread) sent what."""
+
+    def __init__(self):
+        super().__init__()
+        self.sent = []
+        self.lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self.lock:
+            self.sent.append((threading.get_ident(), request.headers.get("Cookie"), request.headers.get("X-Solver")))
+        response = requests.Response()
+        response.status_code = 200
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def session():
+    session = requests.Session()
+    session.headers["X-Solver"] = "bay"
+    session.cookies.set("ASP.NET_SessionId", "abc")
+    adapter = RecordingAdapter()
+    session.mount("http://", adapter)
+    session.adapter = adapter
+    return session
+
+
+def test_threads_get_copies_with_headers_and_cookies(session):
+    results = fetch_all([FetchRequest(f"http://roster.example/{i}") for i in range(20)],
+                        session=session, per_host=8)
+    assert all(r.ok for r in results)
+    assert {(cookie, header) for _, cookie, header in session.adapter.sent} == {("ASP.NET_SessionId=abc", "bay")}
+
+
+def test_each_thread_sends_through_its_own_session(session):
+    engine = FetchEngine(session=session)
+    sessions = []
+    barrier = threading.Barrier(3)
+
+    def work():
+        barrier.wait()  # All three alive at once
+        own = engine._thread_session()
+        assert engine._thread_session() is own
+        sessions.append(own)
+
+    threads = [threading.Thread(target=work) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len({id(s) for s in sessions}) == 3 and session not in sessions
+    assert all(s.adapters["http://"] is session.adapter for s in sessions)
+
+
+def test_cookies_merged_back(session):
+    engine = FetchEngine(session=session)
+    thread = threading.Thread(target=lambda: engine._thread_session().cookies.set("token", "xyz"))
+    thread.start()
+    thread.join()
+    engine.merge_cookies()
+    assert session.cookies.get("token") == "xyz"
@@ -0,0 +1,98 @@
+"""Tests for core/identity.py (person matching and the Person_Key column)."""
+
+import pytest
+
+from core.identity import PersonIndex, _first_names_match, person_id_for, soundex, split_name
+
+
+@pytest.fixture
+def persons(tmp_path):
+    index = PersonIndex(tmp_path / "persons.sqlite3")
+    yield index
+    index.close()
+
+
+def _record(booking, first, last="SMITH", dob="01/02/1990", county="Lee", **extra):
+    return {"County": county, "Booking_Number": booking, "First_Name": first,
+            "Last_Name": last, "DOB": dob, **extra}
+
+
+def test_soundex():
+    assert soundex("Robert") == soundex("Rupert") == "R163"
+    assert soundex("Tymczak") == "T522"
+    assert soundex("") == ""
+
+
+def test_split_name_from_full_name():
+    assert split_name({"Full_Name": "SMITH, JOHN A"}) == ("SMITH", "JOHN")
+    assert split_name({"Full_Name": "John A Smith Jr"}) == ("SMITH", "JOHN")
+
+
+def test_first_names_match():
+    assert _first_names_match("JOHN", "JOHN")
+    assert _first_names_match("JON", "JONATHAN")
+    assert _first_names_match("JON", "JOHN")
+    assert not _first_names_match("JOHN", "MARY")
+    assert not _first_names_match("JO", "JA")
+
+
+def test_blank_first_name_does_not_match():
+    assert not _first_names_match("", "JOHN")
+    assert not _first_names_match("JOHN", "")
+    assert not _first_names_match("", "")
+
+
+def test_person_key_set_and_person_id_untouched(persons):
+    record = _record("B1", "JOHN", Person_ID="LEE-42")
+    assert persons.resolve([record], "Lee") == {"matched": 0, "new": 1, "unresolved": 0}
+    assert record["Person_ID"] == "LEE-42"
+    assert record["Person_Key"] == person_id_for("SMITH", "JOHN", "1990-01-02")
+
+
+def test_same_person_across_counties(persons):
+    first = _record("B1", "JONATHAN", county="Lee")
+    second = _record("C9", "JON", county="Collier", dob="1990-01-02")
+    persons.resolve([first], "Lee")
+    assert persons.resolve([second], "Collier")["matched"] == 1
+    assert second["Person_Key"] == first["Person_Key"]
+
+
+def test_different_first_names_are_different_people(persons):
+    a, b = _record("B1", "JOHN"), _record("B2", "MARY")
+    persons.resolve([a, b], "Lee")
+    assert a["Person_Key"] != b["Person_Key"]
+
+
+def test_blank_first_name_is_not_merged(persons):
+    named, bare = _record("B1", "JOHN"), _record("B2", "")
+    counts = persons.resolve([named, bare], "Lee")
+    assert counts["new"] == 2
+    assert bare["Person_Key"] != named["Person_Key"]
+
+
+def test_county_person_id_links_bookings(persons):
+    first = _record("B1", "JOHN", Person_ID="LEE-42")
+    renamed = _record("B2", "JOHNNY", last="SMYTHE", dob="", Person_ID="LEE-42")
+    persons.resolve([first], "Lee")
+    assert persons.resolve([renamed], "Lee")["matched"] == 1
+    assert renamed["Person_Key"] == first["Person_Key"]
+
+
+def test_booking_keeps_its_person(persons):
+    record = _record("B1", "JOHN")
+    persons.resolve([record], "Lee")
+    again = _record("B1", "JOHN", dob="")
+    assert persons.resolve([again], "Lee")["matched"] == 1
+    assert again["Person_Key"] == record["Person_Key"]
+
+
+def test_unresolved_without_dob(persons):
+    record = _record("B1", "JOHN", dob="")
+    assert persons.resolve([record], "Lee")["unresolved"] == 1
+    assert "Person_Key" not in record
+
+
+def test_dry_run_stores_nothing(persons):
+    persons.resolve([_record("B1", "JOHN")], "Lee", commit=False)
+    again = _record("B1", "JOHN", dob="")
+    assert persons.resolve([again], "Lee")["unresolved"] == 1
@@ -0,0 +1,86 @@
+"""Tests for LeadScorer.score_batch() against the per-record score_arrest()."""
+
+from itertools import product
+
+import pytest
+
+from core.batch import RecordBatch
+from python_scrapers.models.arrest_record import ArrestRecord
+from python_scrapers.scoring.lead_scorer import LeadScorer, score_and_update_batch
+
+BOND_AMOUNTS = ["", "0", "$250", "500", "$5,000.00", "50000", "75,000", "250000", "N/A", 1500]
+BOND_TYPES = ["", "CASH", "Surety", "NO BOND", "hold", "ROR", "OTHER"]
+STATUSES = ["", "IN CUSTODY", "Released", "BONDED OUT"]
+CHARGES = ["", "DUI", "Battery | Federal Probation Violation", "MURDER 2ND DEGREE", "Capitol Trespass"]
+NAMES = ["", "DOE, JOHN", "   "]
+COURT_DATES = ["", "2026-11-02"]
+
+
+def _records():
+    return [
+        ArrestRecord(Bond_Amount=bond, Bond_Type=bond_type, Status=status,
+                     Charges=charges, Full_Name=name, Court_Date=court)
+        for bond, bond_type, status, charges, name, court
+        in product(BOND_AMOUNTS, BOND_TYPES, STATUSES, CHARGES, NAMES, COURT_DATES)
+    ]
+
+
+def _expected(records):
+    scorer = LeadScorer()
+    return [scorer.score_arrest(r) for r in records]
+
+
+def _as_dicts(records):
+    return [{k: v for k, v in r.to_dict().items() if k not in ("ingested_at", "extra_data")} for r in records]
+
+
+@pytest.fixture(scope="module")
+def grid():
+    records = _records()
+    return records, _expected(records)
+
+
+@pytest.mark.parametrize("shape", ["records", "dicts", "batch"])
+def test_score_batch_matches_score_arrest(grid, shape):
+    records, expected = grid
+    data = {
+        "records": records,
+        "dicts": _as_dicts(records),
+        "batch": RecordBatch.from_records(_as_dicts(records)),
+    }[shape]
+    scores, statuses = LeadScorer().score_batch(data)
+    assert list(zip(scores, statuses)) == expected
+
+
+def test_score_batch_missing_columns():
+    scores, statuses = LeadScorer().score_batch([{}, {"Bond_Amount": "5000"}])
+    assert list(zip(scores, statuses)) == _expected([ArrestRecord(), ArrestRecord(Bond_Amount="5000")])
+
+
+def test_score_batch_explain_matches_breakdown():
+    records = _records()[:200]
+    scorer = LeadScorer()
+    scorer.score_batch(records, explain=True)
+    reference = LeadScorer()
+    for record, breakdown in zip(records, scorer.batch_breakdown):
+        reference.score_arrest(record)
+        assert breakdown == reference.get_score_breakdown()
+
+
+def test_score_batch_empty():
+    assert LeadScorer().score_batch([]) == ([], [])
+
+
+def test_score_and_update_batch_writes_back():
+    records = _records()[:50]
+    expected = _expected(records)
+    dicts = _as_dicts(records)
+    batch = RecordBatch.from_records(_as_dicts(records))
+
+    score_and_update_batch(records)
+    score_and_update_batch(dicts)
+    score_and_update_batch(batch)
+
+    assert [(r.Lead_Score, r.Lead_Status) for r in records] == expected
+    assert [(d["Lead_Score"], d["Lead_Status"]) for d in dicts] == expected
+    assert list(zip(batch.column("Lead_Score"), batch.column("Lead_Status"))) == expected
@@ -0,0 +1,378 @@
+"""Tests for core/outbox.py (idempotency keys, coalescing, retries, leases and owners)."""
+
+import sys
+import types
+
+import pytest
+
+import core.outbox as outbox_module
+from core.outbox import Outbox, record_key
+
+
+class FakeSink:
+    """Records what it was handed; raises while `fail` is set."""
+
+    def __init__(self):
+        self.calls = []
+        self.fail = None
+
+    def __call__(self, outbox, county, entries):
+        self.calls.append((county, [e.payload for e in entries]))
+        if self.fail is not None:
+            raise self.fail
+
+
+@pytest.fixture
+def sink(monkeypatch):
+    fake = FakeSink()
+    monkeypatch.setitem(outbox_module.SINKS, 'mongo', fake)
+    return fake
+
+
+@pytest.fixture
+def outbox(tmp_path, sink):
+    box = Outbox(tmp_path / "outbox.sqlite3", retry_seconds=0, lease_seconds=600)
+    yield box
+    box.stop()
+
+
+def _row(outbox, key):
+    return outbox._conn.execute(
+        "SELECT version, attempts, next_try, last_error, payload FROM outbox WHERE key = ?", (key,)
+    ).fetchone()
+
+
+def test_record_key_uses_booking_number():
+    assert record_key({'County': 'Lee ', 'Booking_Number': ' 123 '}, 'lee') == 'Lee|123'
+    assert record_key({'Booking_Number': '123'}, 'Lee') == 'Lee|123'
+
+
+def test_record_key_without_booking_hashes_content():
+    a = {'County': 'Lee', 'Full_Name': 'DOE, JOHN', 'Scrape_Timestamp': '2026-10-16 08:00:00'}
+    b = dict(a, Scrape_Timestamp='2026-10-16 09:00:00')
+    c = dict(a, Full_Name='DOE, JANE')
+    assert record_key(a, 'Lee').startswith('Lee|#')
+    assert record_key(a, 'Lee') == record_key(b, 'Lee')
+    assert record_key(a, 'Lee') != record_key(c, 'Lee')
+
+
+def test_records_without_booking_number_are_queued(outbox):
+    records = [
+        {'County': 'Lee', 'Booking_Number': '1', 'Full_Name': 'A'},
+        {'County': 'Lee', 'Booking_Number': '', 'Full_Name': 'B'},
+        {'County': 'Lee', 'Full_Name': 'C'},
+    ]
+    assert outbox.put_records(records, 'Lee', 'run', mongo=True) == 3
+    assert outbox.pending('mongo') == 3
+
+
+def test_put_coalesces_by_key(outbox):
+    outbox.put('mongo', [('Lee|1', 'Lee', {'n': 1})])
+    outbox.put('mongo', [('Lee|1', 'Lee', {'n': 2})])
+    assert outbox.pending('mongo') == 1
+    version, _, _, _, payload = _row(outbox, 'Lee|1')
+    assert version == 2 and '"n": 2' in payload
+
+
+def test_deliver_groups_by_county_and_deletes(outbox, sink):
+    outbox.put('mongo', [('Lee|1', 'Lee', {'n': 1}), ('Collier|1', 'Collier', {'n': 2}), ('Lee|2', 'Lee', {'n': 3})])
+    assert outbox.deliver('mongo') == 3
+    assert sorted(sink.calls) == [('Collier', [{'n': 2}]), ('Lee', [{'n': 1}, {'n': 3}])]
+    assert outbox.pending() == 0
+    assert outbox.stats['delivered'] == 3
+
+
+def test_failed_delivery_backs_off_and_retries(tmp_path, sink):
+    box = Outbox(tmp_path / "outbox.sqlite3", retry_seconds=60, max_backoff=600)
+    box.put('mongo', [('Lee|1', 'Lee', {'n': 1})])
+    sink.fail = RuntimeError('mongo down')
+    box.deliver('mongo')
+    _, attempts, next_try, last_error, _ = _row(box, 'Lee|1')
+    assert attempts == 1 and last_error == 'mongo down'
+    assert box.deliver('mongo') == 0  # Not due yet
+    assert box._backoff(1) >= 60 and 600 <= box._backoff(10) <= 660
+
+    box._conn.execute("UPDATE outbox SET next_try = 0")
+    sink.fail = None
+    assert box.deliver('mongo') == 1
+    assert box.pending() == 0
+
+
+def test_leased_entries_are_not_claimed_twice(outbox):
+    outbox.put('mongo', [('Lee|1', 'Lee', {'n': 1})])
+    assert len(outbox.claim('mongo', 10)) == 1
+    assert outbox.claim('mongo', 10) == []
+
+
+def test_expired_lease_is_claimed_again(tmp_path, sink):
+    box = Outbox(tmp_path / "outbox.sqlite3", lease_seconds=0)
+    box.put('mongo', [('Lee|1', 'Lee', {'n': 1})])
+    assert len(box.claim('mongo', 10)) == 1
+    assert len(box.claim('mongo', 10)) == 1  # The worker that held it died
+
+
+def test_newer_payload_survives_delivery_of_older(outbox, sink):
+    outbox.put('mongo', [('Lee|1', 'Lee', {'n': 1})])
+    entries = outbox.claim('mongo', 10)
+    outbox.put('mongo', [('Lee|1', 'Lee', {'n': 2})])  # Arrives while {'n': 1} is being delivered
+    outbox.done(entries)
+    assert outbox.pending() == 1
+    outbox.deliver('mongo')
+    assert sink.calls[-1] == ('Lee', [{'n': 2}])
+    assert outbox.pending() == 0
+
+
+def test_put_resets_retry_budget(outbox, sink):
+    outbox.put('mongo', [('Lee|1', 'Lee', {'n': 1})])
+    sink.fail = RuntimeError('down')
+    outbox.deliver('mongo')
+    outbox.put('mongo', [('Lee|1', 'Lee', {'n': 2})])
+    assert _row(outbox, 'Lee|1')[1] == 0
+
+
+def test_workers_drain(outbox, sink):
+    outbox.put('mongo', [(f'Lee|{i}', 'Lee', {'n': i}) for i in range(5)])
+    outbox.start()
+    assert outbox.drain(10)
+    assert sum(len(payloads) for _, payloads in sink.calls) == 5
+
+
+def test_slack_marks_each_sent_message_delivered(tmp_path, monkeypatch):
+    import core.writers.slack_notifier as slack_notifier
+
+    sent = []
+
+    def post_slack(text, webhook_url):
+        if text == 'bad':
+            raise RuntimeError('invalid_payload')
+        sent.append(text)
+
+    monkeypatch.setattr(slack_notifier, 'post_slack', post_slack)
+    box = Outbox(tmp_path / "outbox.sqlite3", retry_seconds=0)
+    for text in ('one', 'bad', 'three'):
+        box.put_slack(text, webhook_url='https://hooks.example/x', county='Lee')
+
+    box.deliver('slack')
+    assert sent == ['one', 'three']
+    assert box.pending('slack') == 1
+    assert box.deliver('slack') == 1  # Only 'bad' is retried
+    assert sent == ['one', 'three']
+    assert box.stats['delivered'] == 2 and box.stats['failed'] == 2
+
+
+def test_slack_gives_up_after_its_max_attempts(tmp_path, sink, monkeypatch):
+    monkeypatch.setitem(outbox_module.SINKS, 'slack', sink)
+    box = Outbox(tmp_path / "outbox.sqlite3", retry_seconds=0)
+    assert box.max_attempts == {'sheets': 10, 'mongo': 10, 'slack': 10}
+    box.put_slack('hello', webhook_url='https://hooks.example/gone')
+    sink.fail = RuntimeError('404 no_service')
+    for _ in range(10):
+        assert box.deliver('slack') == 1
+    assert box.deliver('slack') == 0
+    assert box.pending() == 0
+    summary = box.summary()
+    assert summary['dead'] == 1 and summary['dead_letters'] == {'slack': 1}
+
+
+def test_max_attempts_zero_retries_forever(tmp_path, sink):
+    box = Outbox(tmp_path / "outbox.sqlite3", retry_seconds=0, max_attempts={'mongo': 0})
+    box.put('mongo', [('Lee|1', 'Lee', {'n': 1})])
+    sink.fail = RuntimeError('rejected')
+    for _ in range(25):
+        assert box.deliver('mongo') == 1
+    assert box.pending() == 1 and box.stats['dead'] == 0
+
+
+def test_int_max_attempts_applies_to_every_sink(tmp_path, sink):
+    box = Outbox(tmp_path / "outbox.sqlite3", retry_seconds=0, max_attempts=2)
+    assert set(box.max_attempts.values()) == {2}
+    box.put('mongo', [('Lee|1', 'Lee', {'n': 1})])
+    sink.fail = RuntimeError('down')
+    box.deliver('mongo')
+    box.deliver('mongo')
+    assert box.pending() == 0 and box.summary()['dead_letters'] == {'mongo': 1}
+
+
+def test_requeue_dead(tmp_path, sink):
+    box = Outbox(tmp_path / "outbox.sqlite3", retry_seconds=0, max_attempts={'mongo': 1})
+    box.put('mongo', [('Lee|1', 'Lee', {'n': 1})])
+    sink.fail = RuntimeError('down')
+    box.deliver('mongo')
+    assert box.pending() == 0
+
+    sink.fail = None
+    assert box.requeue_dead('slack') == 0
+    assert box.requeue_dead('mongo') == 1
+    assert box.deliver('mongo') == 1
+    assert sink.calls[-1] == ('Lee', [{'n': 1}])
+    assert box.pending() == 0 and box.summary()['dead_letters'] == {}
+
+
+def test_drain_outbox_fails_when_entries_are_left(tmp_path, sink, monkeypatch):
+    box = Outbox(tmp_path / "outbox.sqlite3", retry_seconds=60, poll_seconds=0.05)
+    monkeypatch.setitem(outbox_module._outboxes, str(box.path), box)
+    box.put('mongo', [('Lee|1', 'Lee', {'n': 1})], run='lee:1')
+    sink.fail = ConnectionError('down')
+    box.start()
+    try:
+        assert not outbox_module.drain_outbox(timeout=0.5)
+        assert box.pending('mongo') == 1
+    finally:
+        box.stop()
+
+
+def test_drain_outbox_ignores_queued_slack(tmp_path, sink, monkeypatch):
+    slack = FakeSink()
+    slack.fail = RuntimeError('slack down')
+    monkeypatch.setitem(outbox_module.SINKS, 'slack', slack)
+    box = Outbox(tmp_path / "outbox.sqlite3", retry_seconds=60, poll_seconds=0.05)
+    monkeypatch.setitem(outbox_module._outboxes, str(box.path), box)
+    box.put('mongo', [('Lee|1', 'Lee', {'n': 1})], run='lee:1')
+    box.put_slack('hello', webhook_url='https://hooks.example/x')
+    box.start()
+    try:
+        assert outbox_module.drain_outbox(timeout=10)
+        assert box.pending('mongo') == 0 and box.pending('slack') == 1
+    finally:
+        box.stop()
+
+
+class HTTPError(Exception):
+    def __init__(self, status_code):
+        super().__init__(status_code)
+        self.response = type('Response', (), {'status_code': status_code})()
+
+
+@pytest.mark.parametrize("error,transient", [
+    (ConnectionError('reset'), True),
+    (TimeoutError('read timed out'), True),
+    (HTTPError(503), True),
+    (HTTPError(429), True),
+    (HTTPError(400), False),
+    (ValueError('bad document'), False),
+    (RuntimeError('rejected'), False),
+])
+def test_transient_error(error, transient):
+    assert outbox_module.transient_error(error) is transient
+
+
+def test_rejected_entry_is_bisected_out(outbox, sink, monkeypatch):
+    delivered = []
+
+    def picky(box, county, entries):
+        if any(e.payload.get('bad') for e in entries):
+            raise ValueError('document rejected')
+        delivered.extend(e.payload['n'] for e in entries)
+
+    monkeypatch.setitem(outbox_module.SINKS, 'mongo', picky)
+    outbox.put('mongo', [(f'Lee|{i}', 'Lee', {'n': i, 'bad': i == 5}) for i in range(8)])
+    assert outbox.deliver('mongo') == 8
+    assert sorted(delivered) == [0, 1, 2, 3, 4, 6, 7]
+    assert outbox.pending() == 1 and _row(outbox, 'Lee|5')[1] == 1
+
+
+def test_rejected_entry_is_dead_lettered(tmp_path, sink):
+    box = Outbox(tmp_path / "outbox.sqlite3", retry_seconds=0)
+    box.put('mongo', [('Lee|1', 'Lee', {'n': 1})])
+    sink.fail = ValueError('document rejected')
+    for _ in range(box.max_attempts['mongo']):
+        box.deliver('mongo')
+    assert box.pending() == 0 and box.dead('mongo') == 1
+
+
+def test_outage_retries_group_whole_and_never_dead_letters(tmp_path, sink):
+    box = Outbox(tmp_path / "outbox.sqlite3", retry_seconds=0, max_attempts=2)
+    box.put('mongo', [(f'Lee|{i}', 'Lee', {'n': i}) for i in range(8)])
+    sink.fail = ConnectionError('mongo unreachable')
+    for _ in range(5):
+        box.deliver('mongo')
+    assert len(sink.calls) == 5  # One call per round, no bisection
+    assert box.pending() == 8 and box.dead() == 0
+
+
+def test_claims_are_scoped_to_live_owners(tmp_path, sink):
+    a = Outbox(tmp_path / "outbox.sqlite3")
+    b = Outbox(tmp_path / "outbox.sqlite3")
+    a.put('mongo', [('Lee|1', 'Lee', {'n': 1})], run='lee:1')
+    assert b.claim('mongo', 10) == []
+
+    a._conn.execute("UPDATE outbox_owners SET heartbeat = 0 WHERE owner = ?", (a.owner,))
+    assert b.deliver('mongo') == 1  # A went quiet: B adopts its entries
+    assert b.pending() == 0
+
+
+def test_sheets_entry_waits_for_earlier_entry_of_its_run(outbox, monkeypatch):
+    monkeypatch.setitem(outbox_module.SINKS, 'sheets', FakeSink())
+    outbox.put('sheets', [('Lee|1', 'Lee', {'n': 1})], run='lee:1')
+    outbox.put('sheets', [('Lee|2', 'Lee', {'n': 2}), ('Collier|1', 'Collier', {'n': 3})], run='lee:1')
+    outbox._conn.execute("UPDATE outbox SET next_try = ? WHERE key = 'Lee|1'", (10 ** 10,))  # Backing off
+    assert outbox.claim('sheets', 10) == []
+
+
+class FakeSheetsWriter:
+    calls = []
+
+    def __init__(self, spreadsheet_id):
+        pass
+
+    def write_records(self, records, county, row):
+        self.calls.append(('write', [r['Booking_Number'] for r in records], row))
+        return {'total_records': len(records), 'new_records': len(records),
+                'duplicates_skipped': 0, 'qualified_records': 0}
+
+    def log_ingestion(self, county, stats, error=None):
+        self.calls.append(('log', stats['new_records'], stats['total_records']))
+
+    def flush(self):
+        pass
+
+    def rotate(self, county):
+        pass
+
+
+def test_run_offsets_survive_a_change_of_process(tmp_path, monkeypatch):
+    sheets_writer = types.ModuleType("core.writers.sheets_writer")
+    sheets_writer.SheetsWriter = FakeSheetsWriter
+    monkeypatch.setitem(sys.modules, "core.writers.sheets_writer", sheets_writer)
+    monkeypatch.setattr(FakeSheetsWriter, 'calls', [])
+
+    a = Outbox(tmp_path / "outbox.sqlite3")
+    a.put_records([{'County': 'Lee', 'Booking_Number': '1'}, {'County': 'Lee', 'Booking_Number': '2'}],
+                  'Lee', 'lee:1', spreadsheet_id='x')
+    assert a.deliver('sheets') == 2
+
+    # A dies; B delivers the run's second chunk and its log row
+    a.put_records([{'County': 'Lee', 'Booking_Number': '3'}], 'Lee', 'lee:1', spreadsheet_id='x')
+    a.put_log('Lee', 'lee:1', 'x', total=5)
+    a._conn.execute("UPDATE outbox_owners SET heartbeat = 0")
+    b = Outbox(tmp_path / "outbox.sqlite3")
+    assert b.deliver('sheets') == 2
+    assert FakeSheetsWriter.calls == [('write', ['1', '2'], 2), ('write', ['3'], 4), ('log', 3, 5)]
+    assert b.run_stats('lee:1')['new_records'] == 0  # Forgotten once logged
+
+
+def test_drain_outbox_waits_only_for_own_runs(tmp_path, sink, monkeypatch):
+    other = Outbox(tmp_path / "outbox.sqlite3")
+    other.put('mongo', [('Collier|1', 'Collier', {'n': 1})], run='collier:1')
+    box = Outbox(tmp_path / "outbox.sqlite3", poll_seconds=0.05)
+    monkeypatch.setitem(outbox_module._outboxes, str(box.path), box)
+    box.put('mongo', [('Lee|1', 'Lee', {'n': 1})], run='lee:1')
+    box.start()
+    try:
+        assert outbox_module.drain_outbox(timeout=10)
+        assert box.pending() == 1  # Collier's, still owned by a live process
+    finally:
+        box.stop()
+
+
+def test_drain_outbox_fails_when_own_entries_died(tmp_path, sink, monkeypatch):
+    box = Outbox(tmp_path / "outbox.sqlite3", retry_seconds=0, max_attempts=1, poll_seconds=0.05)
+    monkeypatch.setitem(outbox_module._outboxes, str(box.path), box)
+    sink.fail = ValueError('document rejected')
+    box.put('mongo', [('Lee|1', 'Lee', {'n': 1})], run='lee:1')
+    box.start()
+    try:
+        assert not outbox_module.drain_outbox(timeout=10)
+        assert box.dead('mongo', {'lee:1'}) == 1
+    finally:
+        box.stop()
@@ -0,0 +1,53 @@
+"""Tests for core/schedule.py (cron parsing and next fire times)."""
+
+from datetime import datetime
+
+import pytest
+
+from core.exceptions import ConfigError
+from core.schedule import CronSchedule, get_schedule_cron
+
+
+def test_every_three_hours():
+    cron = CronSchedule("0 */3 * * *")
+    assert cron.next_after(datetime(2026, 10, 16, 1, 30)) == datetime(2026, 10, 16, 3, 0)
+    assert cron.next_after(datetime(2026, 10, 16, 21, 0)) == datetime(2026, 10, 17, 0, 0)
+
+
+def test_next_after_is_strictly_after():
+    cron = CronSchedule("15 * * * *")
+    assert cron.next_after(datetime(2026, 10, 16, 8, 15, 30)) == datetime(2026, 10, 16, 9, 15)
+
+
+def test_ranges_lists_and_steps():
+    cron = CronSchedule("0,30 8-17/4 * * *")
+    assert cron.hours == {8, 12, 16}
+    assert cron.minutes == {0, 30}
+
+
+def test_sunday_is_0_and_7():
+    assert CronSchedule("0 6 * * 0").weekdays == CronSchedule("0 6 * * 7").weekdays == {6}
+    # 2026-10-16 is a Friday
+    assert CronSchedule("0 6 * * 0").next_after(datetime(2026, 10, 16)) == datetime(2026, 10, 18, 6, 0)
+
+
+def test_restricted_day_fields_match_either():
+    cron = CronSchedule("0 0 1 * 1")  # the 1st, or any Monday
+    assert cron.next_after(datetime(2026, 10, 16)) == datetime(2026, 10, 19)
+    assert cron.next_after(datetime(2026, 10, 27)) == datetime(2026, 11, 1)
+
+
+def test_sparse_schedule_skips_months():
+    assert CronSchedule("0 0 29 2 *").next_after(datetime(2026, 3, 1)) == datetime(2028, 2, 29)
+
+
+@pytest.mark.parametrize("expr", ["", "* * * *", "60 * * * *", "*/0 * * * *", "5-1 * * * *", "0 0 31 2 *"])
+def test_invalid_expressions(expr):
+    with pytest.raises(ConfigError):
+        CronSchedule(expr).next_after(datetime(2026, 1, 1))
+
+
+def test_get_schedule_cron_prefers_county_block():
+    assert get_schedule_cron({"schedule": {"cron": "0 * * * *"}, "schedule_cron": "5 * * * *"}) == "0 * * * *"
+    assert get_schedule_cron({"schedule_cron": "5 * * * *"}) == "5 * * * *"
+    assert get_schedule_cron({}) == ""
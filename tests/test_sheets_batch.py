@@ -0,0 +1,160 @@
+"""Tests for core/sheets_batch.py (final block positions and flush behaviour)."""
+
+import random
+
+import pytest
+
+from core.sheets_batch import PendingInsert, SheetsBatch, _final_blocks
+
+
+HEADER = ['Scrape_Timestamp']
+
+
+class FakeWorksheet:
+    def __init__(self, sheet_id, title):
+        self.id = sheet_id
+        self.title = title
+
+
+class FakeSpreadsheet:
+    """Applies batch_update inserts and values_batch_update writes to in-memory tabs."""
+
+    def __init__(self, *worksheets, fail_values=False):
+        self.tabs = {ws.title: [HEADER] for ws in worksheets}
+        self.ids = {ws.id: ws.title for ws in worksheets}
+        self.fail_values = fail_values
+        self.calls = []
+
+    def batch_update(self, body):
+        self.calls.append('batch_update')
+        for request in body['requests']:
+            for kind, spec in request.items():
+                rng = spec['range']
+                tab = self.tabs[self.ids[rng['sheetId']]]
+                start, end = rng['startIndex'], rng['endIndex']
+                if kind == 'insertDimension':
+                    tab[start:start] = [None] * (end - start)
+                else:
+                    del tab[start:end]
+
+    def values_batch_update(self, body):
+        self.calls.append('values_batch_update')
+        if self.fail_values:
+            raise RuntimeError('quota')
+        for data in body['data']:
+            title, _, cell = data['range'].rpartition('!A')
+            tab = self.tabs[title.strip("'").replace("''", "'")]
+            start = int(cell) - 1
+            tab[start:start + len(data['values'])] = data['values']
+
+
+def _apply_one_by_one(ops):
+    """What insert_rows() per op, in order, leaves on each tab."""
+    tabs = {}
+    for op in ops:
+        tab = tabs.setdefault(op.worksheet.title, [HEADER])
+        tab[op.row - 1:op.row - 1] = op.rows
+    return tabs
+
+
+def _apply_blocks(ops):
+    """The same tabs rebuilt from _final_blocks()."""
+    tabs = {}
+    for op in ops:
+        tab = tabs.setdefault(op.worksheet.title, [HEADER])
+        tab[op.row - 1:op.row - 1] = [None] * len(op.rows)
+    for title, start, rows in _final_blocks(ops):
+        tabs[title][start:start + len(rows)] = rows
+    return tabs
+
+
+def _rows(tag, n):
+    return [[f'{tag}-{i}'] for i in range(n)]
+
+
+def test_later_insert_at_row_2_pushes_earlier_down():
+    ws = FakeWorksheet(1, 'Lee')
+    ops = [PendingInsert(ws, _rows('a', 2), 2), PendingInsert(ws, _rows('b', 3), 2)]
+    assert sorted(_final_blocks(ops), key=lambda b: b[1]) == [
+        ('Lee', 1, _rows('b', 3)), ('Lee', 4, _rows('a', 2)),
+    ]
+
+
+def test_insert_below_earlier_block_leaves_it():
+    ws = FakeWorksheet(1, 'Lee')
+    ops = [PendingInsert(ws, _rows('a', 2), 2), PendingInsert(ws, _rows('b', 1), 4)]
+    assert _final_blocks(ops) == [('Lee', 1, _rows('a', 2)), ('Lee', 3, _rows('b', 1))]
+
+
+def test_insert_inside_block_splits_it():
+    ws = FakeWorksheet(1, 'Lee')
+    ops = [PendingInsert(ws, _rows('a', 4), 2), PendingInsert(ws, _rows('b', 2), 4)]
+    assert _apply_blocks(ops) == _apply_one_by_one(ops)
+    assert len(_final_blocks(ops)) == 3
+
+
+def test_tabs_are_independent():
+    lee, qualified = FakeWorksheet(1, 'Lee'), FakeWorksheet(2, 'Qualified_Arrests')
+    ops = [PendingInsert(lee, _rows('a', 2), 2), PendingInsert(qualified, _rows('q', 1), 2),
+           PendingInsert(lee, _rows('b', 1), 2)]
+    blocks = _final_blocks(ops)
+    assert ('Qualified_Arrests', 1, _rows('q', 1)) in blocks
+    assert _apply_blocks(ops) == _apply_one_by_one(ops)
+
+
+@pytest.mark.parametrize('seed', range(25))
+def test_random_inserts_match_sequential_insert_rows(seed):
+    rng = random.Random(seed)
+    sheets = [FakeWorksheet(1, 'Lee'), FakeWorksheet(2, "O'Brien")]
+    ops, sizes = [], {1: 0, 2: 0}
+    for i in range(rng.randint(1, 30)):
+        ws = rng.choice(sheets)
+        n = rng.randint(1, 5)
+        ops.append(PendingInsert(ws, _rows(f'{seed}.{i}', n), rng.randint(2, sizes[ws.id] + 2)))
+        sizes[ws.id] += n
+    assert _apply_blocks(ops) == _apply_one_by_one(ops)
+
+
+def test_flush_sends_two_requests_and_runs_callbacks():
+    lee, qualified = FakeWorksheet(1, 'Lee'), FakeWorksheet(2, 'Qualified_Arrests')
+    spreadsheet = FakeSpreadsheet(lee, qualified)
+    batch = SheetsBatch(spreadsheet, max_rows=1000, max_delay=3600)
+    written = []
+    a = batch.add(lee, _rows('a', 2), 2, keys=[('Lee', 'A')], on_written=lambda: written.append('a'))
+    batch.add(qualified, _rows('q', 1), 2)
+    batch.add(lee, _rows('b', 1), 2)
+    assert batch.queued_keys('Lee') == {('Lee', 'A')}
+    assert spreadsheet.calls == []
+
+    assert batch.flush() == 3
+    assert spreadsheet.calls == ['batch_update', 'values_batch_update']
+    assert spreadsheet.tabs['Lee'] == [HEADER] + _rows('b', 1) + _rows('a', 2)
+    assert spreadsheet.tabs['Qualified_Arrests'] == [HEADER] + _rows('q', 1)
+    assert a.done and a.error is None and written == ['a']
+    assert batch.queued_keys('Lee') == set()
+    assert batch.flush() == 0
+
+
+def test_max_rows_triggers_flush():
+    lee = FakeWorksheet(1, 'Lee')
+    spreadsheet = FakeSpreadsheet(lee)
+    batch = SheetsBatch(spreadsheet, max_rows=3, max_delay=3600)
+    batch.add(lee, _rows('a', 2), 2)
+    assert spreadsheet.calls == []
+    batch.add(lee, _rows('b', 1), 2)
+    assert spreadsheet.calls == ['batch_update', 'values_batch_update']
+
+
+def test_failed_flush_removes_blank_rows_and_marks_inserts():
+    lee = FakeWorksheet(1, 'Lee')
+    spreadsheet = FakeSpreadsheet(lee, fail_values=True)
+    spreadsheet.tabs['Lee'] = [HEADER] + _rows('old', 2)
+    batch = SheetsBatch(spreadsheet, max_rows=1000, max_delay=3600)
+    written = []
+    ops = [batch.add(lee, _rows('a', 2), 2, on_written=lambda: written.append('a')),
+           batch.add(lee, _rows('b', 1), 3)]
+    batch.flush()
+    assert spreadsheet.tabs['Lee'] == [HEADER] + _rows('old', 2)
+    assert all(op.done and isinstance(op.error, RuntimeError) for op in ops)
+    assert written == []
+    assert batch.stats['failed'] == 2
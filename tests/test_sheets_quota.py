@@ -0,0 +1,106 @@
+"""Tests for core/sheets_quota.py (read/write classification and retries)."""
+
+import pytest
+
+from core.sheets_quota import SheetsQuota
+
+BASE = "https://sheets.googleapis.com/v4/spreadsheets/abc"
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None, content=b"{}"):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = content
+
+
+class APIError(Exception):
+    def __init__(self, status_code):
+        super().__init__(status_code)
+        self.response = FakeResponse(status_code, {"Retry-After": "0"})
+
+
+def _failing(*statuses):
+    """A request function raising the given statuses in turn, then succeeding."""
+    calls = []
+
+    def request(method, endpoint, *args, **kwargs):
+        calls.append((method, endpoint))
+        if len(calls) <= len(statuses):
+            raise APIError(statuses[len(calls) - 1])
+        return FakeResponse(200)
+    return request, calls
+
+
+@pytest.fixture
+def quota():
+    return SheetsQuota(reads_per_minute=1000, writes_per_minute=1000, max_retries=3)
+
+
+@pytest.mark.parametrize("method,endpoint,kind", [
+    ("GET", f"{BASE}/values/Lee!B:C", "read"),
+    ("POST", f"{BASE}/values:batchGet", "read"),
+    ("POST", f"{BASE}:batchUpdate", "write"),
+    ("PUT", f"{BASE}/values/Lee!A1:AN1", "write"),
+])
+def test_kind(method, endpoint, kind):
+    assert SheetsQuota.kind(method, endpoint) == kind
+
+
+@pytest.mark.parametrize("method,endpoint,safe", [
+    ("GET", f"{BASE}/values/Lee!B:C", True),
+    ("PUT", f"{BASE}/values/Lee!A1:AN1?valueInputOption=USER_ENTERED", True),
+    ("POST", f"{BASE}/values:batchUpdate", True),
+    ("POST", f"{BASE}/values/Lee!A2:clear", True),
+    ("POST", f"{BASE}:batchUpdate", False),
+    ("POST", f"{BASE}/values/Lee!A1:append", False),
+])
+def test_idempotent(method, endpoint, safe):
+    assert SheetsQuota.idempotent(method, endpoint) is safe
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_rate_limits_retried_for_any_request(quota, status):
+    request, calls = _failing(status, status)
+    assert quota.call(request, "POST", f"{BASE}:batchUpdate").status_code == 200
+    assert len(calls) == 3
+    assert quota.stats["retries"] == 2
+
+
+def test_500_not_retried_for_batch_update(quota):
+    request, calls = _failing(500)
+    with pytest.raises(APIError):
+        quota.call(request, "POST", f"{BASE}:batchUpdate")
+    assert len(calls) == 1
+    assert quota.stats["errors"] == 1
+
+
+def test_500_not_retried_for_append(quota):
+    request, calls = _failing(500)
+    with pytest.raises(APIError):
+        quota.call(request, "POST", f"{BASE}/values/Lee!A1:append")
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("method,endpoint", [
+    ("GET", f"{BASE}/values/Lee!B:C"),
+    ("POST", f"{BASE}/values:batchUpdate"),
+])
+def test_500_retried_when_safe(quota, method, endpoint):
+    request, calls = _failing(500)
+    assert quota.call(request, method, endpoint).status_code == 200
+    assert len(calls) == 2
+
+
+def test_gives_up_after_max_retries(quota):
+    request, calls = _failing(429, 429, 429, 429, 429)
+    with pytest.raises(APIError):
+        quota.call(request, "GET", f"{BASE}/values/Lee!B:C")
+    assert len(calls) == quota.max_retries + 1
+
+
+def test_other_errors_not_retried(quota):
+    request, calls = _failing(400)
+    with pytest.raises(APIError):
+        quota.call(request, "GET", f"{BASE}/values/Lee!B:C")
+    assert len(calls) == 1
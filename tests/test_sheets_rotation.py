@@ -0,0 +1,63 @@
+"""Tests for SheetsWriter.rotate() size checks (marks persisted under output/state)."""
+
+import pytest
+
+sheets_writer = pytest.importorskip("core.writers.sheets_writer", exc_type=ImportError)
+
+
+class FakeSheet:
+    title = 'Lee'
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.reads = 0
+
+    def col_values(self, col):
+        self.reads += 1
+        return ['Scrape_Timestamp'] + ['10/16/2026 08:00:00'] * self.rows
+
+    def insert_rows(self, rows, row, value_input_option=None):
+        self.rows += len(rows)
+
+
+@pytest.fixture
+def writer(tmp_path, monkeypatch):
+    monkeypatch.setattr(sheets_writer, '_rotation_settings', lambda: {
+        'max_rows': 100, 'min_move': 10, 'check_interval_minutes': 60,
+        'state_path': str(tmp_path / 'rotation_marks.json'),
+    })
+    monkeypatch.setattr(sheets_writer, '_rotation_added', {})
+    writer = sheets_writer.SheetsWriter.__new__(sheets_writer.SheetsWriter)
+    writer.spreadsheet_id = 'sheet'
+    writer.batch = None
+    writer.sheet = FakeSheet(50)
+    writer._get_or_create_sheet = lambda name: writer.sheet
+    writer._remember = writer._forget = lambda *args: None
+    return writer
+
+
+def test_mark_is_reused_by_the_next_process(writer):
+    assert writer.rotate('Lee') == 0
+    assert writer.sheet.reads == 1
+    sheets_writer._rotation_added.clear()  # A new one-shot run
+    assert writer.rotate('Lee') == 0
+    assert writer.sheet.reads == 1
+
+
+def test_inserts_count_toward_the_stored_mark(writer):
+    writer.rotate('Lee')
+    writer._insert(writer.sheet, [['x']] * 40, 2)
+    assert writer.rotate('Lee') == 0
+    assert writer.sheet.reads == 1  # 90 rows: still under the limit
+    writer._insert(writer.sheet, [['x']] * 30, 2)
+    writer.sheet.rows = 50  # Rows deleted by hand: the estimate (120) is now too high
+    assert writer.rotate('Lee') == 0
+    assert writer.sheet.reads == 2  # Past max_rows + min_move, so it checks
+
+
+def test_mark_expires_after_check_interval(writer, monkeypatch):
+    writer.rotate('Lee')
+    now = sheets_writer.time.time()
+    monkeypatch.setattr(sheets_writer.time, 'time', lambda: now + 3601)
+    writer.rotate('Lee')
+    assert writer.sheet.reads == 2
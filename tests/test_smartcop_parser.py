@@ -0,0 +1,48 @@
+"""Tests for core/smartcop_parser.py (stopping "Load More" at the last run's bookings)."""
+
+import pytest
+
+BeautifulSoup = pytest.importorskip("bs4").BeautifulSoup
+pytest.importorskip("requests")
+
+from core.smartcop_parser import _card_bookings, _seen_booking  # noqa: E402
+
+
+def _card(booking):
+    return (
+        '<tr style="InmateRecordRow"><td>'
+        f'<img src="ViewImage.aspx?bookno={booking}">'
+        '<table><tbody><tr>'
+        '<td class="InmateInfoGridTd">Booking No:</td>'
+        f'<td class="InmateInfoGridTd">{booking}</td>'
+        '</tr></tbody></table>'
+        '</td></tr>'
+    )
+
+
+def _page(*bookings, extra=''):
+    cards = ''.join(_card(b) for b in bookings)
+    return BeautifulSoup(
+        f'<input type="hidden" name="__VIEWSTATE" value="{extra}">'
+        f'<div id="JailInfo"><table class="JailView">{cards}</table></div>',
+        'html.parser',
+    )
+
+
+def test_card_bookings():
+    assert _card_bookings(_page('2026001234', '2026001235')) == {'2026001234', '2026001235'}
+
+
+def test_known_booking_on_a_card_is_seen():
+    assert _seen_booking(_page('2026001234', '2026000999'), {'2026000999'})
+
+
+def test_booking_number_elsewhere_in_the_page_is_not_seen():
+    # A statute, case number or the viewstate containing a known number must not stop paging
+    page = _page('2026001234', extra='x2026000999y 316.193')
+    assert not _seen_booking(page, {'2026000999', '316193', '00999'})
+
+
+def test_fragment_cards_are_read():
+    fragment = BeautifulSoup(_card('2026000999'), 'html.parser')
+    assert _seen_booking(fragment, {'2026000999'})
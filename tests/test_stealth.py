@@ -0,0 +1,26 @@
+"""Tests for core/stealth.py (per-step ready settings)."""
+
+import core.config_loader as config_loader
+import core.stealth as stealth
+
+
+def test_ready_settings_cached_until_config_changes(monkeypatch):
+    loads = []
+    mtime = [(1, 1, 1)]
+
+    def load_config(county):
+        loads.append(county)
+        return {"scraper": {"ready": {"detail": {"selector": "#booking", "timeout": 4}}}}
+
+    monkeypatch.setattr(config_loader, "load_config", load_config)
+    monkeypatch.setattr(config_loader, "config_mtime", lambda county: mtime[0])
+    monkeypatch.setattr(stealth, "_ready_cache", {})
+
+    for _ in range(3):
+        settings = stealth._ready_settings("lee", "detail", {"timeout": 10, "network_idle": True})
+        assert settings == {"timeout": 4, "network_idle": True, "selector": ["#booking"]}
+    assert loads == ["lee"]
+
+    mtime[0] = (1, 1, 2)  # County YAML edited
+    stealth._ready_settings("lee", "detail", {})
+    assert loads == ["lee", "lee"]
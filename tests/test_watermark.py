@@ -0,0 +1,37 @@
+"""Tests for core/watermark.py (advancing the mark and per-county date stats)."""
+
+import pytest
+
+from core.normalizer import date_stats
+from core.watermark import advance_watermark, load_watermark
+
+
+@pytest.fixture
+def config(tmp_path):
+    return {"scraper": {"days_back": 7}, "incremental": {"state_path": str(tmp_path / "watermarks.json")}}
+
+
+def test_advance_keeps_newest_booking(config):
+    advance_watermark("lee", [
+        {"County": "Lee", "Booking_Number": "1", "Booking_Date": "10/14/2026"},
+        {"County": "Lee", "Booking_Number": "2", "Booking_Date": "2026-10-15 08:12"},
+    ], config)
+    mark = load_watermark("lee", config)
+    assert mark["booking_date"] == "2026-10-15"
+    assert mark["booking_numbers"] == ["2", "1"]
+
+
+def test_mark_never_moves_backwards(config):
+    advance_watermark("lee", [{"Booking_Number": "2", "Booking_Date": "10/15/2026"}], config)
+    advance_watermark("lee", [{"Booking_Number": "1", "Booking_Date": "10/01/2026"}], config)
+    assert load_watermark("lee", config)["booking_date"] == "2026-10-15"
+
+
+def test_booking_dates_counted_per_county(config):
+    advance_watermark("watermark_test", [
+        {"Booking_Number": "1", "Booking_Date": "10/15/2026"},
+        {"Booking_Number": "2", "Booking_Date": "not a date"},
+    ], config)
+    stats = date_stats()["watermark_test/Booking_Date"]
+    assert stats["parsed"] == 1 and stats["unparsed"] == 1
+    assert stats["unparsed_rate"] == 0.5 and stats["format"] == "%m/%d/%Y"